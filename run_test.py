@@ -1,12 +1,17 @@
 import configparser
+import copy
 import importlib
 import importlib.util
+import json
 import logging.config
+import multiprocessing
 import os
 import sys
 import glob
+import time
 
 from onapsdk.exceptions import ModuleError
+from xtesting.core import testcase
 import onaptests.utils.exceptions as onap_test_exceptions
 
 SETTING_FILE_EXCEPTIONS = {
@@ -23,6 +28,37 @@ MODULES_TO_RELOAD = [
     "onaptests"
 ]
 
+# modules kept between the tests, the database pools are shared by all of them
+MODULES_TO_KEEP = [
+    "onaptests.utils.database"
+]
+
+# "all" tests executed at the same time in worker processes, 0 means one by one
+# in the current process
+WORKERS_ENV = "PYTHON_SDK_TESTS_WORKERS"
+# seconds after which the test worker is stopped, 0 means no limit
+TIMEOUT_ENV = "PYTHON_SDK_TESTS_TIMEOUT"
+# directory of the test workers results, each test has its own subdirectory
+RESULTS_DIR_ENV = "PYTHON_SDK_TESTS_RESULTS_DIR"
+DEFAULT_RESULTS_DIR = "/tmp/onaptests"
+
+# modules imported once by the fork server of the test workers, they must not
+# load the settings, so only the worker loads the settings module of its test
+PRELOADED_MODULES = [
+    "__main__",
+    "avionix",
+    "jinja2",
+    "kubernetes.client",
+    "kubernetes.config",
+    "kubernetes.stream",
+    "mysql.connector",
+    "openstack",
+    "pg8000",
+    "requests",
+    "xtesting.core.testcase",
+    "yaml"
+]
+
 def get_entrypoints():
     config = configparser.ConfigParser()
     config.read('setup.cfg')
@@ -55,7 +91,20 @@ def check_scenarios(scenarios, entry_points):
                 raise onap_test_exceptions.TestConfigurationException(
                     f"Scenario defined in {full_mod_name}.py is not added to setup.cfg file")
 
-def run_test(test_name, validation, force_cleanup, entry_point):
+
+def set_results_dir(settings, results_dir):
+    os.makedirs(results_dir, exist_ok=True)
+    settings.REPORTING_FILE_DIRECTORY = results_dir
+    settings.STATUS_RESULTS_DIRECTORY = os.path.join(results_dir, "kubernetes-status")
+    log_config = copy.deepcopy(settings.LOG_CONFIG)
+    for handler in log_config.get("handlers", {}).values():
+        if "filename" in handler:
+            handler["filename"] = os.path.join(
+                results_dir, os.path.basename(handler["filename"]))
+    settings.LOG_CONFIG = log_config
+    testcase.TestCase.dir_results = results_dir
+
+def run_test(test_name, validation, force_cleanup, entry_point, results_dir=None):
     print(f"Configuring {test_name} test")
     settings_env = "ONAP_PYTHON_SDK_SETTINGS"
     if force_cleanup:
@@ -80,6 +129,8 @@ def run_test(test_name, validation, force_cleanup, entry_point):
         settings_module.settings.CLEANUP_ACTIVITY_TIMER = 1
         settings_module.settings.SDC_CLEANUP = True
         settings_module.settings.SERVICE_DISTRIBUTION_SLEEP_TIME = 1
+    if results_dir:
+        set_results_dir(settings_module.settings, results_dir)
 
     # logging configuration for onapsdk, it is not requested for onaptests
     # Correction requested in onapsdk to avoid having this duplicate code
@@ -98,7 +149,7 @@ def run_test(test_name, validation, force_cleanup, entry_point):
     if validation:
         logger.info(f"Validating {test_name} test")
         test_instance.validate()
-    return scenarios
+    return scenarios, test_instance
 
 def validate_scenario_base_class(test_name, scenario, scenarios):
     has_scenario_base = False
@@ -119,6 +170,91 @@ def validate_scenario_base_class(test_name, scenario, scenarios):
         raise onap_test_exceptions.TestConfigurationException(
             f"[{test_name}] {scenario.__class__.__name__} class does not inherit from ScenarioBase")
 
+
+def run_test_worker(test_name, validation, force_cleanup, entry_point, results_dir):
+    try:
+        _, test_instance = run_test(test_name, validation, force_cleanup, entry_point,
+                                    results_dir)
+    except Exception as exc:
+        logging.getLogger(test_name).exception("%s test failed", test_name)
+        print(f"{test_name} test failed: {exc}", file=sys.stderr)
+        sys.exit(1)
+    # scenario failures are only recorded in the result of the test
+    if test_instance.is_successful() != testcase.TestCase.EX_OK:
+        print(f"{test_name} test failed: {test_instance.result}% completed", file=sys.stderr)
+        sys.exit(1)
+
+
+def get_workers_context():
+    """Get the context starting the test workers.
+
+    Workers are forked from a server process which imports PRELOADED_MODULES
+    once for all the tests. Workers are spawned on platforms without fork.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(PRELOADED_MODULES)
+    return context
+
+
+def run_tests_in_workers(entry_points, validation, force_cleanup, workers, timeout, results_dir):
+    """Run the tests at the same time, each in its own worker process.
+
+    At most `workers` tests are running at the same time, a test running
+    longer than `timeout` seconds is stopped. Every test gets its own
+    settings module and results subdirectory, their reports are aggregated
+    in the reporting.json file of `results_dir`.
+
+    Returns:
+        dict: results of the tests by test name
+    """
+    context = get_workers_context()
+    pending = list(entry_points.items())
+    running = {}
+    results = {}
+    while pending or running:
+        while pending and len(running) < workers:
+            test_name, entry_point = pending.pop(0)
+            test_dir = os.path.join(results_dir, test_name)
+            process = context.Process(
+                target=run_test_worker, name=test_name,
+                args=(test_name, validation, force_cleanup, entry_point, test_dir))
+            process.start()
+            print(f"Started {test_name} test (pid {process.pid})")
+            running[test_name] = (process, time.monotonic(), test_dir)
+        time.sleep(0.1)
+        for test_name, (process, start_time, test_dir) in list(running.items()):
+            status = None
+            if not process.is_alive():
+                status = "PASS" if process.exitcode == 0 else "FAIL"
+            elif timeout and time.monotonic() - start_time > timeout:
+                process.terminate()
+                status = "TIMEOUT"
+            if status is None:
+                continue
+            process.join()
+            del running[test_name]
+            results[test_name] = {
+                "status": status,
+                "exitcode": process.exitcode,
+                "duration": time.monotonic() - start_time,
+                "results_dir": test_dir,
+                "report": load_report(test_dir)
+            }
+            print(f"Finished {test_name} test: {status}")
+    with open(os.path.join(results_dir, "reporting.json"), "w", encoding="utf-8") as file:
+        json.dump({name: results[name] for name in entry_points}, file, indent=4)
+    return results
+
+
+def load_report(test_dir):
+    try:
+        with open(os.path.join(test_dir, "reporting.json"), encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
 def main(argv):
     """Script is used to run one or all the tests.
 
@@ -128,10 +264,17 @@ def main(argv):
     test(s) in the validation mode that checks only a basic setup of
     steps (like cleanup) and their execution in a certain order.
 
+    With 'all' keyword and PYTHON_SDK_TESTS_WORKERS environment variable
+    set, each test is executed in a worker process forked with the third
+    party modules already imported, several of them at the same time if
+    the variable is greater than 1. See also PYTHON_SDK_TESTS_TIMEOUT and
+    PYTHON_SDK_TESTS_RESULTS_DIR environment variables.
+
     Examplary use:
     - python run_test.py basic_vm_macro
     - python run_test.py basic_cps validation
     - python run_test.py all true
+    - PYTHON_SDK_TESTS_WORKERS=4 python run_test.py all true
     """
     if len(argv) == 0:
         print("Required test name argument missing", file=sys.stderr)
@@ -141,7 +284,19 @@ def main(argv):
     force_cleanup = len(argv) > 2
     test_name = argv[0]
     entry_points = get_entrypoints()
-    if test_name == "all":
+    workers = int(os.environ.get(WORKERS_ENV, 0))
+    if test_name == "all" and workers > 0:
+        results_dir = os.environ.get(RESULTS_DIR_ENV, DEFAULT_RESULTS_DIR)
+        os.makedirs(results_dir, exist_ok=True)
+        results = run_tests_in_workers(entry_points, validation, force_cleanup, workers,
+                                       float(os.environ.get(TIMEOUT_ENV, 0)), results_dir)
+        if validation:
+            check_scenarios(importlib.import_module("onaptests.scenario"), entry_points)
+        failed = [name for name, result in results.items() if result["status"] != "PASS"]
+        if failed:
+            print(f"Failed tests: {', '.join(failed)}", file=sys.stderr)
+            exit(1)
+    elif test_name == "all":
         modules_reload = False
         scenarios = None
         for test_name, entry_point in entry_points.items():
@@ -149,6 +304,9 @@ def main(argv):
                 modules_to_keep = dict()
                 for module in sys.modules:
                     reload_module = False
+                    if module in MODULES_TO_KEEP:
+                        modules_to_keep[module] = sys.modules[module]
+                        continue
                     for module_to_reload in MODULES_TO_RELOAD:
                         if module_to_reload in module:
                             reload_module = True
@@ -157,7 +315,7 @@ def main(argv):
                         modules_to_keep[module] = sys.modules[module]
                 sys.modules.clear()
                 sys.modules.update(modules_to_keep)
-            scenarios = run_test(
+            scenarios, _ = run_test(
                 test_name, validation, force_cleanup, entry_point)
             modules_reload = True
         if validation:
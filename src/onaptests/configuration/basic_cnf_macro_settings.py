@@ -2,8 +2,6 @@ import os
 from pathlib import Path
 from uuid import uuid4
 
-from yaml import SafeLoader, load
-
 import onaptests.utils.exceptions as onap_test_exceptions
 from onaptests.utils.resources import get_resource_location
 
@@ -66,16 +64,15 @@ TENANT_NAME = 'dummy_test'
 
 SERVICE_YAML_TEMPLATE = Path(get_resource_location(
     "templates/vnf-services/basic_cnf_macro-service.yaml"))
-generate_service_config_yaml_file(service_name="basic_cnf_macro",  # noqa
-                                  service_template="basic_cnf_macro-service.yaml.j2",
-                                  service_config=SERVICE_YAML_TEMPLATE)
+service_configuration = generate_service_config_yaml_file(  # noqa
+    service_name="basic_cnf_macro",
+    service_template="basic_cnf_macro-service.yaml.j2",
+    service_config=SERVICE_YAML_TEMPLATE)
 
 try:
-    # Try to retrieve the SERVICE NAME from the yaml file
-    with open(SERVICE_YAML_TEMPLATE, "r", encoding="utf-8") as yaml_template:
-        yaml_config_file = load(yaml_template, SafeLoader)
-        SERVICE_NAME = next(iter(yaml_config_file.keys()))
-except (FileNotFoundError, ValueError) as exc:
+    # Try to retrieve the SERVICE NAME from the generated configuration
+    SERVICE_NAME = next(iter(service_configuration.keys()))
+except (AttributeError, StopIteration) as exc:
     raise onap_test_exceptions.TestConfigurationException from exc
 
 SERVICE_INSTANCE_NAME = f"basic_cnf_macro_{str(uuid4())}"
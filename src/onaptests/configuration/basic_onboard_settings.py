@@ -1,7 +1,5 @@
 
 
-from yaml import SafeLoader, load
-
 import onaptests.utils.exceptions as onap_test_exceptions
 from onaptests.utils.resources import get_resource_location
 
@@ -24,17 +22,16 @@ SDC_CLEANUP = True
 VERIFY_DISTRIBUTION = True
 
 SERVICE_YAML_TEMPLATE = get_resource_location("templates/vnf-services/basic-onboard-service.yaml")
-generate_service_config_yaml_file(service_name="basic_onboard",  # noqa
-                                  service_template="basic_onboard-service.yaml.j2",
-                                  service_config=SERVICE_YAML_TEMPLATE,
-                                  generate_random_names=SDC_CLEANUP)
+service_configuration = generate_service_config_yaml_file(  # noqa
+    service_name="basic_onboard",
+    service_template="basic_onboard-service.yaml.j2",
+    service_config=SERVICE_YAML_TEMPLATE,
+    generate_random_names=SDC_CLEANUP)
 
 try:
-    # Try to retrieve the SERVICE NAME from the yaml file
-    with open(SERVICE_YAML_TEMPLATE, "r", encoding="utf-8") as yaml_template:
-        yaml_config_file = load(yaml_template, SafeLoader)
-        SERVICE_NAME = next(iter(yaml_config_file.keys()))
-except (FileNotFoundError, ValueError) as exc:
+    # Try to retrieve the SERVICE NAME from the generated configuration
+    SERVICE_NAME = next(iter(service_configuration.keys()))
+except (AttributeError, StopIteration) as exc:
     raise onap_test_exceptions.TestConfigurationException from exc
 
 # CLEANUP_FLAG = True
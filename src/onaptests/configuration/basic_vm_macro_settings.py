@@ -2,14 +2,11 @@ import os
 from pathlib import Path
 from uuid import uuid4
 
-import openstack
-from yaml import SafeLoader, load
-
 import onaptests.utils.exceptions as onap_test_exceptions
 from onaptests.utils.resources import get_resource_location
 
 from .settings import *  # noqa
-from .settings import IF_VALIDATION
+from .settings import IF_VALIDATION, get_cloud_auth
 
 SERVICE_DETAILS = "Onboarding, distribution and instanitation of an Ubuntu VM using macro"
 
@@ -38,14 +35,14 @@ GLOBAL_CUSTOMER_ID = "basicvm-customer"
 
 if not IF_VALIDATION:
     TEST_CLOUD = os.getenv('OS_TEST_CLOUD')
-    cloud = openstack.connect(cloud=TEST_CLOUD)
-    VIM_USERNAME = cloud.config.auth.get('username', 'Fill me')
-    VIM_PASSWORD = cloud.config.auth.get('password', 'Fill me')
-    VIM_SERVICE_URL = cloud.config.auth.get('auth_url', 'Fill me')
-    TENANT_ID = cloud.config.auth.get('project_id', 'Fill me')
-    TENANT_NAME = cloud.config.auth.get('project_name', 'Fill me')
-    CLOUD_REGION_ID = cloud.config.auth.get('region_name', 'RegionOne')
-    CLOUD_DOMAIN = cloud.config.auth.get('project_domain_name', 'Default')
+    cloud_auth = get_cloud_auth(TEST_CLOUD)
+    VIM_USERNAME = cloud_auth.get('username', 'Fill me')
+    VIM_PASSWORD = cloud_auth.get('password', 'Fill me')
+    VIM_SERVICE_URL = cloud_auth.get('auth_url', 'Fill me')
+    TENANT_ID = cloud_auth.get('project_id', 'Fill me')
+    TENANT_NAME = cloud_auth.get('project_name', 'Fill me')
+    CLOUD_REGION_ID = cloud_auth.get('region_name', 'RegionOne')
+    CLOUD_DOMAIN = cloud_auth.get('project_domain_name', 'Default')
 
 OWNING_ENTITY = "basicvm-oe"
 PROJECT = "basicvm-project"
@@ -54,16 +51,15 @@ PLATFORM = "basicvm-platform"
 CLOUD_DOMAIN = "Default"
 SERVICE_YAML_TEMPLATE = Path(get_resource_location(
     "templates/vnf-services/basic_vm_macro-service.yaml"))
-generate_service_config_yaml_file(service_name="basic_vm_macro",  # noqa
-                                  service_template="basic_vm_macro-service.yaml.j2",
-                                  service_config=SERVICE_YAML_TEMPLATE)
+service_configuration = generate_service_config_yaml_file(  # noqa
+    service_name="basic_vm_macro",
+    service_template="basic_vm_macro-service.yaml.j2",
+    service_config=SERVICE_YAML_TEMPLATE)
 
 try:
-    # Try to retrieve the SERVICE NAME from the yaml file
-    with open(SERVICE_YAML_TEMPLATE, "r", encoding="utf-8") as yaml_template:
-        yaml_config_file = load(yaml_template, SafeLoader)
-        SERVICE_NAME = next(iter(yaml_config_file.keys()))
-except (FileNotFoundError, ValueError) as exc:
+    # Try to retrieve the SERVICE NAME from the generated configuration
+    SERVICE_NAME = next(iter(service_configuration.keys()))
+except (AttributeError, StopIteration) as exc:
     raise onap_test_exceptions.TestConfigurationException from exc
 
 SERVICE_INSTANCE_NAME = f"basic_macro_{str(uuid4())}"
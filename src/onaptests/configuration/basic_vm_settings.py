@@ -1,13 +1,10 @@
 import os
 
-import openstack
-from yaml import SafeLoader, load
-
 import onaptests.utils.exceptions as onap_test_exceptions
 from onaptests.utils.resources import get_resource_location
 
 from .settings import *  # noqa
-from .settings import IF_VALIDATION
+from .settings import IF_VALIDATION, get_cloud_auth
 
 # The ONAP part
 SERVICE_DETAILS = "Onboarding, distribution and instanitation of an Ubuntu VM using à la carte"
@@ -20,16 +17,15 @@ ONLY_INSTANTIATE = False
 # if a yaml file is define, retrieve info from this yaml files
 # if not declare the parameters in the settings
 SERVICE_YAML_TEMPLATE = get_resource_location("templates/vnf-services/basic_vm-service.yaml")
-generate_service_config_yaml_file(service_name="basic_vm",  # noqa
-                                  service_template="basic_vm-service.yaml.j2",
-                                  service_config=SERVICE_YAML_TEMPLATE)
+service_configuration = generate_service_config_yaml_file(  # noqa
+    service_name="basic_vm",
+    service_template="basic_vm-service.yaml.j2",
+    service_config=SERVICE_YAML_TEMPLATE)
 
 try:
-    # Try to retrieve the SERVICE NAME from the yaml file
-    with open(SERVICE_YAML_TEMPLATE, "r", encoding="utf-8") as yaml_template:
-        yaml_config_file = load(yaml_template, SafeLoader)
-        SERVICE_NAME = next(iter(yaml_config_file.keys()))
-except (FileNotFoundError, ValueError) as exc:
+    # Try to retrieve the SERVICE NAME from the generated configuration
+    SERVICE_NAME = next(iter(service_configuration.keys()))
+except (AttributeError, StopIteration) as exc:
     raise onap_test_exceptions.TestConfigurationException from exc
 
 CLEANUP_FLAG = True
@@ -63,13 +59,13 @@ SERVICE_INSTANCE_NAME = "basic_vm_service_instance"
 # to retrieve cloud info and avoid data duplication
 if not IF_VALIDATION:
     TEST_CLOUD = os.getenv('OS_TEST_CLOUD')
-    cloud = openstack.connect(cloud=TEST_CLOUD)
-    VIM_USERNAME = cloud.config.auth.get('username', 'Fill me')
-    VIM_PASSWORD = cloud.config.auth.get('password', 'Fill me')
-    VIM_SERVICE_URL = cloud.config.auth.get('auth_url', 'Fill me')
-    TENANT_ID = cloud.config.auth.get('project_id', 'Fill me')
-    TENANT_NAME = cloud.config.auth.get('project_name', 'Fill me')
-    CLOUD_REGION_ID = cloud.config.auth.get('region_name', 'RegionOne')
-    CLOUD_DOMAIN = cloud.config.auth.get('project_domain_name', 'Default')
+    cloud_auth = get_cloud_auth(TEST_CLOUD)
+    VIM_USERNAME = cloud_auth.get('username', 'Fill me')
+    VIM_PASSWORD = cloud_auth.get('password', 'Fill me')
+    VIM_SERVICE_URL = cloud_auth.get('auth_url', 'Fill me')
+    TENANT_ID = cloud_auth.get('project_id', 'Fill me')
+    TENANT_NAME = cloud_auth.get('project_name', 'Fill me')
+    CLOUD_REGION_ID = cloud_auth.get('region_name', 'RegionOne')
+    CLOUD_DOMAIN = cloud_auth.get('project_domain_name', 'Default')
 
 MODEL_YAML_TEMPLATE = None
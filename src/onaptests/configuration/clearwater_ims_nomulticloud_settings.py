@@ -1,12 +1,11 @@
 import os
 
-import openstack
 from yaml import SafeLoader, load
 
 from onaptests.utils.resources import get_resource_location
 
 from .settings import *  # noqa
-from .settings import IF_VALIDATION
+from .settings import IF_VALIDATION, get_cloud_auth
 
 SERVICE_DETAILS = "Onboarding, distribution and instantiation of a Clearwater IMS"
 # The ONAP part
@@ -55,13 +54,13 @@ SERVICE_INSTANCE_NAME = "clearwater-ims_service_instance"
 # to retrieve cloud info and avoid data duplication
 if not IF_VALIDATION:
     TEST_CLOUD = os.getenv('OS_TEST_CLOUD')
-    cloud = openstack.connect(cloud=TEST_CLOUD)
-    VIM_USERNAME = cloud.config.auth.get('username', 'Fill me')
-    VIM_PASSWORD = cloud.config.auth.get('password', 'Fill me')
-    VIM_SERVICE_URL = cloud.config.auth.get('auth_url', 'Fill me')
-    TENANT_ID = cloud.config.auth.get('project_id', 'Fill me')
-    TENANT_NAME = cloud.config.auth.get('project_name', 'Fill me')
-    CLOUD_REGION_ID = cloud.config.get('region_name', 'RegionOne')
-    CLOUD_DOMAIN = cloud.config.auth.get('project_domain_name', 'Default')
+    cloud_auth = get_cloud_auth(TEST_CLOUD)
+    VIM_USERNAME = cloud_auth.get('username', 'Fill me')
+    VIM_PASSWORD = cloud_auth.get('password', 'Fill me')
+    VIM_SERVICE_URL = cloud_auth.get('auth_url', 'Fill me')
+    TENANT_ID = cloud_auth.get('project_id', 'Fill me')
+    TENANT_NAME = cloud_auth.get('project_name', 'Fill me')
+    CLOUD_REGION_ID = cloud_auth.get('region_name', 'RegionOne')
+    CLOUD_DOMAIN = cloud_auth.get('project_domain_name', 'Default')
 
 MODEL_YAML_TEMPLATE = None
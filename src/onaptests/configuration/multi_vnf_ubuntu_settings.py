@@ -2,12 +2,10 @@ import os
 import uuid
 from pathlib import Path
 
-import openstack
-
 from onaptests.utils.resources import get_resource_location
 
 from .settings import *  # noqa
-from .settings import IF_VALIDATION
+from .settings import IF_VALIDATION, get_cloud_auth
 
 VNF_FILENAME_PREFIX = "multi-vnf-ubuntu"
 SERVICE_NAME = f"multivnfubuntu{str(uuid.uuid4().hex)[:6]}"
@@ -37,14 +35,14 @@ GLOBAL_CUSTOMER_ID = "ubuntu-customer"
 
 if not IF_VALIDATION:
     TEST_CLOUD = os.getenv('OS_TEST_CLOUD')  # Get values from clouds.yaml
-    cloud = openstack.connect(cloud=TEST_CLOUD)
-    VIM_USERNAME = cloud.config.auth.get('username', 'nso')
-    VIM_PASSWORD = cloud.config.auth.get('password', 'Password123')
-    VIM_SERVICE_URL = cloud.config.auth.get('auth_url', 'https://10.195.194.215:5000')
-    TENANT_ID = cloud.config.auth.get('project_id', 'e2710e84063b421fab08189818761d55')
-    TENANT_NAME = cloud.config.auth.get('project_name', 'nso')
-    CLOUD_REGION_ID = cloud.config.auth.get('region_name', 'nso215')
-    CLOUD_DOMAIN = cloud.config.auth.get('project_domain_name', 'Default')
+    cloud_auth = get_cloud_auth(TEST_CLOUD)
+    VIM_USERNAME = cloud_auth.get('username', 'nso')
+    VIM_PASSWORD = cloud_auth.get('password', 'Password123')
+    VIM_SERVICE_URL = cloud_auth.get('auth_url', 'https://10.195.194.215:5000')
+    TENANT_ID = cloud_auth.get('project_id', 'e2710e84063b421fab08189818761d55')
+    TENANT_NAME = cloud_auth.get('project_name', 'nso')
+    CLOUD_REGION_ID = cloud_auth.get('region_name', 'nso215')
+    CLOUD_DOMAIN = cloud_auth.get('project_domain_name', 'Default')
 
 OWNING_ENTITY = "seb"
 PROJECT = "Project-UbuntuDemo"
@@ -6,9 +6,15 @@
 #                    #
 ######################
 
+import copy
+import os
 import random
 import string
+import tempfile
+from functools import lru_cache
+
 from jinja2 import Environment, PackageLoader
+from yaml import SafeLoader, load
 
 # Variables to set logger information
 # Possible values for logging levels in onapsdk: INFO, DEBUG , WARNING, ERROR
@@ -42,6 +48,7 @@ LOG_CONFIG = {
 }
 CLEANUP_FLAG = False
 CLEANUP_ACTIVITY_TIMER = 5
+SUBSTEPS_WORKERS = 8  # Substeps executed at the same time by steps running them in parallel
 SDC_CLEANUP = False
 
 REPORTING_FILE_DIRECTORY = "/tmp/"
@@ -50,6 +57,9 @@ JSON_REPORTING_FILE_NAME = "reporting.json"
 K8S_REGION_TYPE = "k8s"
 TILLER_HOST = "localhost"
 K8S_CONFIG = None  # None means it will use default config (~/.kube/config)
+# None means the k8s client default size, 0 the size for the status check
+K8S_CONNECTION_POOL_SIZE = None
+K8S_CREDENTIALS_TTL = 600  # Seconds the credentials read from k8s secrets are reused
 K8S_TESTS_NAMESPACE = "onap"  # ONAP Kubernetes namespace
 K8S_ADDITIONAL_RESOURCES_NAMESPACE = K8S_TESTS_NAMESPACE  # Resources created on tests namespace
 MSB_K8S_OVERRIDE_VALUES = None
@@ -66,14 +76,55 @@ IF_VALIDATION = False
 SDNC_SECRET_NAME = "onap-sdnc-db-secret"
 SDNC_DB_PRIMARY_HOST = "mariadb-galera.onap.svc.cluster.local"
 SDNC_DB_PORT = 3306
+DB_POOL_SIZE = 2  # Idle connections kept for each database
 
 
 # We need to create a service file with a random service name,
 # to be sure that we force onboarding
+@lru_cache(maxsize=None)
+def _service_templates_env() -> Environment:
+    """Get the Jinja environment of the service templates, created once."""
+    return Environment(
+        loader=PackageLoader('onaptests', 'templates/vnf-services'),
+    )
+
+
+@lru_cache(maxsize=None)
+def _render_service_config(service_name: str, service_template: str):
+    """Render the service configuration once for the process.
+
+    Returns:
+        tuple: rendered template and the configuration it describes
+
+    """
+    rendered_template = _service_templates_env().get_template(
+        service_template).render(service_name=service_name)
+    return rendered_template, load(rendered_template, SafeLoader)
+
+
+def _write_if_changed(path: str, content: str) -> None:
+    """Write the file unless it already has the content.
+
+    File is replaced atomically, so it can be read at the same time by
+    the tests running in other processes.
+    """
+    try:
+        with open(path, 'r', encoding="utf-8") as file_to_read:
+            if file_to_read.read() == content:
+                return
+    except FileNotFoundError:
+        pass
+    directory = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile('w', encoding="utf-8", dir=directory,
+                                     delete=False) as file_to_write:
+        file_to_write.write(content)
+    os.replace(file_to_write.name, path)
+
+
 def generate_service_config_yaml_file(service_name: str,
                                       service_template: str,
                                       service_config: str,
-                                      generate_random_names: bool = False):
+                                      generate_random_names: bool = False) -> dict:
     """Generate service config YAML file.
 
     Service configurations (both models and instances) are stored in YAML files
@@ -82,6 +133,10 @@ def generate_service_config_yaml_file(service_name: str,
         (so generate_random_names is set to False, as default) but it is possible to
         create all resources on each test execution.
 
+    Template is rendered once for the process and the file is not written
+        again if it is up to date, the configuration is returned so it does
+        not have to be read back from the file.
+
     Args:
         service_name (str): Name of the service
         service_template (str): Template which would be used to generate configuration
@@ -89,13 +144,10 @@ def generate_service_config_yaml_file(service_name: str,
         generate_random_names (bool, optional): Flag indicating whether service name
             should have a random suffix or not. Defaults to False.
 
-    """
-
-    env = Environment(
-        loader=PackageLoader('onaptests', 'templates/vnf-services'),
-    )
-    template = env.get_template(service_template)
+    Returns:
+        dict: generated service configuration
 
+    """
     if generate_random_names:
         # get a random string to randomize the vnf name
         # Random string with the combination of lower and upper case
@@ -103,7 +155,32 @@ def generate_service_config_yaml_file(service_name: str,
         result_str = ''.join(random.choice(letters) for i in range(6))
         service_name = f"{service_name}_{result_str}"
 
-    rendered_template = template.render(service_name=service_name)
+    rendered_template, service_configuration = _render_service_config(service_name,
+                                                                      service_template)
+    _write_if_changed(service_config, rendered_template)
+    # cached configuration is shared by all the settings modules
+    return copy.deepcopy(service_configuration)
+
+
+@lru_cache(maxsize=None)
+def _load_cloud_auth(cloud: str) -> dict:
+    """Read the authentication of the cloud once for the process."""
+    import openstack  # pylint: disable=import-outside-toplevel
+
+    return dict(openstack.config.get_cloud_region(cloud=cloud).auth)
 
-    with open(service_config, 'w+', encoding="utf-8") as file_to_write:
-        file_to_write.write(rendered_template)
+
+def get_cloud_auth(cloud: str) -> dict:
+    """Get the authentication of the cloud described in clouds.yaml.
+
+    Configuration is read once for the process, openstack is imported only
+        when it is needed as the validation mode doesn't use it.
+
+    Args:
+        cloud (str): Name of the cloud, OS_TEST_CLOUD of the tests
+
+    Returns:
+        dict: authentication parameters of the cloud, a copy of the cached ones
+
+    """
+    return copy.deepcopy(_load_cloud_auth(cloud))
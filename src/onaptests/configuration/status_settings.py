@@ -11,6 +11,44 @@ INCLUDE_ALL_RES_IN_DETAILS = True
 CHECK_ALL_NAMESPACES = False
 EXTRA_NAMESPACE_LIST = []
 EXCLUDE_NAMESPACE_LIST = []
+# size of k8s list pages, 0 means the whole list at once
+K8S_LIST_PAGE_SIZE = 500
+# list only metadata of configmaps and secrets, their data is not checked
+STATUS_METADATA_ONLY = True
+# load listed resources from raw JSON instead of k8s client models, faster on big lists
+STATUS_RAW_JSON = False
+# keep only the fields of k8s objects used by the check and its templates once parsed
+STATUS_COMPACT_RESOURCES = True
+# number of resource checks executed in parallel, 1 means sequential execution
+STATUS_CHECK_WORKERS = 1
+# logs collection workers, in total and for the single pod, 1 means sequential collection
+STATUS_ARTIFACTS_WORKERS = 4
+STATUS_ARTIFACTS_PER_POD = 2
+# size limit of all collected logs in bytes, 0 means no limit
+STATUS_ARTIFACTS_MAX_BYTES = 0
+# reuse artifacts of resources which did not change since the previous check
+# stored in STATUS_RESULTS_DIRECTORY
+STATUS_INCREMENTAL = False
+STATUS_SNAPSHOT_FILE = "status-snapshot.json"
+# continuous monitoring with k8s watch instead of the single check, 0 means disabled
+# status details are stored every STATUS_MONITOR_INTERVAL seconds
+STATUS_MONITOR_DURATION = 0
+STATUS_MONITOR_INTERVAL = 60
+STATUS_MONITOR_WATCH_TIMEOUT = 300
+# HTML pages are rendered once the check is done on STATUS_RENDER_WORKERS processes
+# disable rendering if only the JSON results are used
+STATUS_RENDER_HTML = True
+STATUS_RENDER_WORKERS = 4
+# artifacts are stored in a single zip archive of the results directory instead of
+# separate files if set, identical artifacts are archived once if deduplicated
+STATUS_ARCHIVE = ""
+STATUS_ARCHIVE_DEDUP = True
+# kubeconfig contexts of K8S_CONFIG checked at the same time, status details
+# are stored by context, empty means only the cluster of the default configuration
+K8S_CONTEXTS = []
+# 0 means the pool is sized for the resources checks, the artifacts collection
+# and the watches of the status monitor
+K8S_CONNECTION_POOL_SIZE = 0
 
 FULL_LOGS_CONTAINERS = [
     'dcae-bootstrap', 'dcae-cloudify-manager', 'aai-resources',
@@ -95,9 +95,10 @@ class ScenarioBase(testcase.TestCase):
 class BaseScenarioStep(BaseStep):
     """Main scenario step that has no own execution method."""
 
-    def __init__(self, cleanup=False):
+    def __init__(self, cleanup=False, parallel_substeps=False, parallel_cleanup=None):
         """Initialize BaseScenarioStep step."""
-        super().__init__(cleanup=cleanup)
+        super().__init__(cleanup=cleanup, parallel_substeps=parallel_substeps,
+                         parallel_cleanup=parallel_cleanup)
 
     @BaseStep.store_state
     def execute(self) -> None:
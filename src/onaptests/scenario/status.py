@@ -1,5 +1,9 @@
+from onapsdk.configuration import settings
+
 from onaptests.scenario.scenario_base import ScenarioBase
-from onaptests.steps.cloud.check_status import CheckNamespaceStatusStep
+from onaptests.steps.cloud.clusters_status import CheckClustersStatusStep
+from onaptests.steps.cloud.namespace_status import CheckNamespaceStatusStep
+from onaptests.steps.cloud.status_monitor import MonitorNamespaceStatusStep
 
 
 class Status(ScenarioBase):
@@ -8,4 +12,9 @@ class Status(ScenarioBase):
     def __init__(self, **kwargs):
         """Init the testcase."""
         super().__init__('status', **kwargs)
-        self.test = CheckNamespaceStatusStep()
+        if settings.STATUS_MONITOR_DURATION:
+            self.test = MonitorNamespaceStatusStep()
+        elif settings.K8S_CONTEXTS:
+            self.test = CheckClustersStatusStep()
+        else:
+            self.test = CheckNamespaceStatusStep()
@@ -5,7 +5,8 @@ import logging.config
 import os
 import time
 from abc import ABC, abstractmethod
-from typing import Iterator, List, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Set
 
 from onapsdk.aai.business import Customer, ServiceInstance, ServiceSubscription
 from onapsdk.configuration import settings
@@ -146,16 +147,26 @@ class BaseStep(StoreStateHandler, ABC):
         except SettingsError:
             pass
 
-    def __init__(self, cleanup: bool = False, break_on_error=True) -> None:
+    def __init__(self, cleanup: bool = False, break_on_error=True,
+                 parallel_substeps: bool = False, parallel_cleanup: bool = None) -> None:
         """Step initialization.
 
         Args:
             cleanup(bool, optional): Determines if cleanup action should be called.
             break_on_error(bool, optional): Determines if fail on execution should
                 result with continuation of further steps
+            parallel_substeps(bool, optional): Determines if substeps are executed
+                at the same time once their dependencies are executed
+            parallel_cleanup(bool, optional): Determines if substeps are cleaned-up
+                at the same time once the steps depending on them are cleaned-up.
+                Defaults to parallel_substeps
 
         """
         self._steps: List["BaseStep"] = []
+        self._dependencies: List["BaseStep"] = []
+        self._parallel_substeps: bool = parallel_substeps
+        self._parallel_cleanup: bool = (parallel_substeps if parallel_cleanup is None
+                                        else parallel_cleanup)
         self._cleanup: bool = cleanup
         self._parent: "BaseStep" = None
         self._reports_collection: ReportsCollection = None
@@ -173,15 +184,19 @@ class BaseStep(StoreStateHandler, ABC):
         self._is_validation_only = settings.IF_VALIDATION
         self._is_force_cleanup = os.environ.get(IF_FORCE_CLEANUP) is not None
 
-    def add_step(self, step: "BaseStep") -> None:
+    def add_step(self, step: "BaseStep", depends_on: List["BaseStep"] = None) -> None:
         """Add substep.
 
         Add substep and mark step as a substep parent.
 
         Args:
             step (BaseStep): Step object
+            depends_on (List[BaseStep], optional): Sibling steps which have to be
+                executed before the step if substeps are executed in parallel
         """
         self._steps.append(step)
+        if depends_on:
+            step._dependencies.extend(depends_on)
         step._parent: "BaseStep" = self
         step._update_nesting_level()
 
@@ -214,6 +229,32 @@ class BaseStep(StoreStateHandler, ABC):
         """
         return len(self._steps) > 0
 
+    @property
+    def dependencies(self) -> List["BaseStep"]:
+        """Step dependencies.
+
+        Sibling steps executed before the step if its parent executes
+        substeps in parallel. Steps which are not siblings are ignored.
+
+        Returns:
+            List[BaseStep]: Steps the step depends on
+
+        """
+        return self._dependencies
+
+    @property
+    def substeps_workers(self) -> int:
+        """Number of substeps executed at the same time.
+
+        Used only if substeps are executed in parallel, 1 means they are
+        executed in order.
+
+        Returns:
+            int: Number of substeps executed at the same time
+
+        """
+        return settings.SUBSTEPS_WORKERS
+
     @property
     def is_executed(self) -> bool:
         """Is step executed.
@@ -357,14 +398,17 @@ class BaseStep(StoreStateHandler, ABC):
         Override this method and remember to call `super().execute()` before.
 
         """
-        substep_exceptions = []
-        for step in self._steps:
-            try:
-                step.execute()
-            except (OnapTestException, SDKException) as substep_err:
-                if step._break_on_error:
-                    raise SubstepExecutionException("", substep_err) # noqa: W0707
-                substep_exceptions.append(substep_err)
+        if self._parallel_substeps and self.substeps_workers > 1 and len(self._steps) > 1:
+            substep_exceptions = self._execute_substeps_in_parallel()
+        else:
+            substep_exceptions = []
+            for step in self._steps:
+                try:
+                    step.execute()
+                except (OnapTestException, SDKException) as substep_err:
+                    if step._break_on_error:
+                        raise SubstepExecutionException("", substep_err) # noqa: W0707
+                    substep_exceptions.append(substep_err)
         if self._steps:
             if len(substep_exceptions) > 0 and self._break_on_error:
                 if len(substep_exceptions) == 1:
@@ -374,23 +418,123 @@ class BaseStep(StoreStateHandler, ABC):
         self._substeps_executed = True
         self._start_execution_time = time.time()
 
+    def _run_substeps_in_parallel(self, steps: List["BaseStep"],
+                                  prerequisites: Dict["BaseStep", Set["BaseStep"]],
+                                  run: Callable[["BaseStep"], None],
+                                  stop_on_error: Callable[["BaseStep"], bool]
+                                  ) -> Dict["BaseStep", Exception]:
+        """Run substeps' action on a thread pool.
+
+        A substep is started once all its prerequisites are finished, whatever
+        their result. Unexpected errors are raised once the running substeps
+        are finished.
+
+        Args:
+            steps (List[BaseStep]): Substeps in the order they are started
+            prerequisites (Dict[BaseStep, Set[BaseStep]]): Substeps finished before the substep
+            run (Callable[[BaseStep], None]): Substep action
+            stop_on_error (Callable[[BaseStep], bool]): Determines if no more substeps
+                are started once the substep fails
+
+        Returns:
+            Dict[BaseStep, Exception]: Errors of the failed substeps
+
+        """
+        substep_exceptions = {}
+        unexpected_exception = None
+        pending = list(steps)
+        done = set()
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.substeps_workers,
+                                thread_name_prefix=self.name) as executor:
+            while pending or running:
+                for step in list(pending):
+                    if prerequisites[step] <= done:
+                        pending.remove(step)
+                        running[executor.submit(run, step)] = step
+                if not running:
+                    raise TestConfigurationException(
+                        f"{self._step_title()} - substeps dependencies cycle: "
+                        f"{', '.join(step.name for step in pending)}")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    done.add(step)
+                    try:
+                        future.result()
+                    except (OnapTestException, SDKException) as substep_err:
+                        substep_exceptions[step] = substep_err
+                        if stop_on_error(step):
+                            pending.clear()
+                    except Exception as exc:  # pylint: disable=broad-except
+                        unexpected_exception = unexpected_exception or exc
+                        pending.clear()
+        if unexpected_exception:
+            raise unexpected_exception
+        return substep_exceptions
+
+    def _execute_substeps_in_parallel(self) -> List[Exception]:
+        """Substeps' execution on a thread pool.
+
+        A substep is started once all its dependencies are executed, whatever
+        their result. No more substeps are started once a substep with
+        break_on_error fails. Errors are raised in substeps order, so they are
+        the same as for the execution in order.
+
+        Returns:
+            List[Exception]: Errors of the substeps without break_on_error
+
+        """
+        siblings = set(self._steps)
+        prerequisites = {step: {dependency for dependency in step.dependencies
+                                if dependency in siblings}
+                         for step in self._steps}
+        substep_exceptions = self._run_substeps_in_parallel(
+            self._steps, prerequisites, lambda step: step.execute(),
+            lambda step: step._break_on_error)
+        for step in self._steps:
+            if step in substep_exceptions and step._break_on_error:
+                raise SubstepExecutionException("", substep_exceptions[step])
+        return [substep_exceptions[step] for step in self._steps if step in substep_exceptions]
+
+    @staticmethod
+    def _cleanup_substep(step: "BaseStep") -> None:
+        """Substep's cleanup, its store_state is run even if it has no cleanup."""
+        if step._cleanup:
+            step.cleanup()
+        else:
+            step._default_cleanup_handler()
+
     def _cleanup_substeps(self) -> None:
         """Substeps' cleanup.
 
-        Substeps are cleaned-up in reversed order.
+        Substeps are cleaned-up in reversed order. If substeps are cleaned-up
+        in parallel a substep is cleaned-up once all the substeps depending on
+        it are cleaned-up, its own substeps are still cleaned-up after it.
         We also try to cleanup steps if others failed
 
         """
+        steps = list(reversed(self._steps))
+        if self._parallel_cleanup and self.substeps_workers > 1 and len(steps) > 1:
+            prerequisites = {step: set() for step in steps}
+            for step in steps:
+                for dependency in step.dependencies:
+                    if dependency in prerequisites:
+                        prerequisites[dependency].add(step)
+            substep_exceptions = self._run_substeps_in_parallel(
+                steps, prerequisites, self._cleanup_substep, lambda step: False)
+        else:
+            substep_exceptions = {}
+            for step in steps:
+                try:
+                    self._cleanup_substep(step)
+                except (OnapTestException, SDKException) as substep_err:
+                    substep_exceptions[step] = substep_err
         exceptions_to_raise = []
-        for step in reversed(self._steps):
-            try:
-                if step._cleanup:
-                    step.cleanup()
-                else:
-                    step._default_cleanup_handler()
-            except (OnapTestException, SDKException) as substep_err:
+        for step in steps:
+            if step in substep_exceptions:
                 try:
-                    raise SubstepExecutionException("", substep_err) # noqa: W0707
+                    raise SubstepExecutionException("", substep_exceptions[step])  # noqa: W0707
                 except Exception as e:
                     exceptions_to_raise.append(e)
         if len(exceptions_to_raise) > 0:
@@ -468,10 +612,10 @@ class BaseStep(StoreStateHandler, ABC):
 class YamlTemplateBaseStep(BaseStep, ABC):
     """Base YAML template step."""
 
-    def __init__(self, cleanup: bool):
+    def __init__(self, cleanup: bool, parallel_cleanup: bool = False):
         """Initialize step."""
 
-        super().__init__(cleanup=cleanup)
+        super().__init__(cleanup=cleanup, parallel_cleanup=parallel_cleanup)
         self._service_instance: ServiceInstance = None
         self._service_subscription: ServiceSubscription = None
         self._customer: Customer = None
@@ -0,0 +1,219 @@
+"""Status artifacts storage module."""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from contextlib import contextmanager
+
+from onapsdk.configuration import settings
+
+INDEX_NAME = "index.json"
+PREVIOUS_SUFFIX = ".previous"
+SPOOL_MAX_BYTES = 1024 * 1024
+
+
+class DirectoryStore():
+    """Store of the artifacts as files of the results directory."""
+
+    in_directory = True
+
+    def __init__(self, directory: str):
+        """Init the store.
+
+        Args:
+            directory (str): results directory
+        """
+        self.directory = directory
+
+    @contextmanager
+    def open(self, path: str):
+        """Open the artifact for binary writing.
+
+        Args:
+            path (str): path of the artifact in the results directory
+        """
+        with open(path, "wb") as artifact:
+            yield artifact
+
+    def exists(self, path: str) -> bool:
+        """Check if the artifact is stored, by this or the previous check.
+
+        Args:
+            path (str): path of the artifact in the results directory
+        """
+        return os.path.exists(path)
+
+    def keep(self, path: str) -> bool:
+        """Keep the artifact stored by the previous check.
+
+        Args:
+            path (str): path of the artifact in the results directory
+
+        Returns:
+            bool: False if the artifact is not stored
+        """
+        return self.exists(path)
+
+    def write(self, path: str, data) -> None:
+        """Write the artifact.
+
+        Args:
+            path (str): path of the artifact in the results directory
+            data (bytes|str): content of the artifact
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        with self.open(path) as artifact:
+            artifact.write(data)
+
+    def close(self) -> None:
+        """Close the store."""
+
+
+class ArchiveStore(DirectoryStore):
+    """Store of the artifacts in a single zip archive.
+
+    Artifacts are spooled until they are complete and then written to the
+    archive, so it is written through a single file handle whatever the
+    number of threads collecting artifacts. If deduplication is enabled an
+    artifact identical to an already archived one is only recorded in the
+    archive index which maps artifacts to archive members.
+
+    Archive of the previous check is moved aside when the new one is
+    started, its artifacts can be kept in the new archive.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    in_directory = False
+
+    def __init__(self, directory: str, archive: str, dedup: bool = True):
+        """Init the store.
+
+        Args:
+            directory (str): results directory, artifacts are named relatively to it
+            archive (str): path of the archive
+            dedup (bool): are identical artifacts archived once
+        """
+        super().__init__(directory)
+        self.archive = archive
+        self.dedup = dedup
+        self.index = {}
+        self._members = {}
+        self._lock = threading.Lock()
+        self._zip = None
+        self._previous = None
+        self._previous_index = None
+
+    def _name(self, path: str) -> str:
+        return os.path.relpath(path, self.directory).replace(os.sep, "/")
+
+    def _load_previous(self) -> dict:
+        """Move the previous archive aside and load its index."""
+        if self._previous_index is None:
+            self._previous_index = {}
+            if os.path.exists(self.archive):
+                previous = self.archive + PREVIOUS_SUFFIX
+                os.replace(self.archive, previous)
+                try:
+                    # kept open to copy the unchanged artifacts, closed by close()
+                    self._previous = zipfile.ZipFile(  # pylint: disable=consider-using-with
+                        previous)
+                    self._previous_index = json.loads(self._previous.read(INDEX_NAME))
+                except (OSError, KeyError, ValueError, zipfile.BadZipFile) as exc:
+                    self.__logger.warning("Previous archive %s can't be loaded: %s",
+                                          self.archive, exc)
+        return self._previous_index
+
+    def _open_archive(self) -> zipfile.ZipFile:
+        """Open the archive on the first write."""
+        if self._zip is None:
+            self._load_previous()
+            os.makedirs(os.path.dirname(os.path.abspath(self.archive)), exist_ok=True)
+            # written by all the artifacts of the step, closed by close()
+            self._zip = zipfile.ZipFile(  # pylint: disable=consider-using-with
+                self.archive, "w", compression=zipfile.ZIP_DEFLATED)
+        return self._zip
+
+    def _add(self, name: str, spool, size: int, digest: str) -> None:
+        """Add the spooled artifact to the archive."""
+        with self._lock:
+            member = self._members.get(digest) if self.dedup else None
+            if member is None:
+                member = name
+                spool.seek(0)
+                with self._open_archive().open(member, "w", force_zip64=True) as archived:
+                    shutil.copyfileobj(spool, archived)
+                self._members.setdefault(digest, member)
+            self.index[name] = {"member": member, "size": size, "sha256": digest}
+
+    @contextmanager
+    def open(self, path: str):
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as spool:
+            artifact = _HashingWriter(spool)
+            yield artifact
+            self._add(self._name(path), spool, artifact.size, artifact.hexdigest())
+
+    def exists(self, path: str) -> bool:
+        name = self._name(path)
+        with self._lock:
+            return name in self.index or name in self._load_previous()
+
+    def keep(self, path: str) -> bool:
+        name = self._name(path)
+        with self._lock:
+            if name in self.index:
+                return True
+            entry = self._load_previous().get(name)
+        if entry is None:
+            return False
+        with self._previous.open(entry["member"]) as member:
+            self._add(name, member, entry["size"], entry["sha256"])
+        return True
+
+    def close(self) -> None:
+        """Write the index, close the archive and remove the previous one."""
+        with self._lock:
+            if self._zip is not None and self._zip.fp is None:
+                return
+            archive = self._open_archive()
+            archive.writestr(INDEX_NAME, json.dumps(self.index, indent=4))
+            archive.close()
+            if self._previous is not None:
+                self._previous.close()
+                os.remove(self._previous.filename)
+
+
+class _HashingWriter():
+    """Binary writer computing the size and the hash of the written data."""
+
+    def __init__(self, spool):
+        self._spool = spool
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        """Write the data to the spool and update its hash."""
+        self._hash.update(data)
+        self.size += len(data)
+        return self._spool.write(data)
+
+    def hexdigest(self) -> str:
+        """Get the SHA-256 hash of the written data."""
+        return self._hash.hexdigest()
+
+
+def open_store(directory: str) -> DirectoryStore:
+    """Open the store of the artifacts of the results directory.
+
+    Artifacts are archived in STATUS_ARCHIVE of the directory if it is set,
+    identical artifacts are deduplicated if STATUS_ARCHIVE_DEDUP is set.
+    """
+    if settings.STATUS_ARCHIVE:
+        return ArchiveStore(directory, os.path.join(directory, settings.STATUS_ARCHIVE),
+                            dedup=settings.STATUS_ARCHIVE_DEDUP)
+    return DirectoryStore(directory)
@@ -0,0 +1,124 @@
+"""Artifacts collection module."""
+import logging
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from onapsdk.configuration import settings
+
+
+class ArtifactsCollector():
+    """Collector of the status check artifacts.
+
+    Artifacts collection tasks (logs download, files copy) are queued to a
+    bounded pool of workers. Number of tasks run at the same time for the
+    same pod and the total size of collected artifacts are limited too.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, workers: int = None, per_pod: int = None, max_bytes: int = None):
+        """Init the artifacts collector.
+
+        Args:
+            workers (int): number of workers, tasks are run immediately if lower than 2.
+                Defaults to STATUS_ARTIFACTS_WORKERS
+            per_pod (int): number of tasks run at the same time for the pod.
+                Defaults to STATUS_ARTIFACTS_PER_POD
+            max_bytes (int): total size of collected artifacts, no limit if 0.
+                Defaults to STATUS_ARTIFACTS_MAX_BYTES
+        """
+        self.workers = settings.STATUS_ARTIFACTS_WORKERS if workers is None else workers
+        self.per_pod = settings.STATUS_ARTIFACTS_PER_POD if per_pod is None else per_pod
+        self.max_bytes = settings.STATUS_ARTIFACTS_MAX_BYTES if max_bytes is None else max_bytes
+        self.collected_bytes = 0
+        self._executor = None
+        if self.workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix="artifacts")
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._running = defaultdict(int)
+        self._waiting = defaultdict(deque)
+        self._exceptions = []
+
+    @property
+    def exhausted(self) -> bool:
+        """Is the size limit of collected artifacts reached."""
+        return 0 < self.max_bytes <= self.collected_bytes
+
+    def add_bytes(self, size: int) -> None:
+        """Count the size of collected artifact.
+
+        Args:
+            size (int): size of the artifact
+        """
+        with self._condition:
+            was_exhausted = self.exhausted
+            self.collected_bytes += size
+            if self.exhausted and not was_exhausted:
+                self.__logger.warning("Artifacts size limit reached (%s bytes), "
+                                      "next artifacts are not collected", self.max_bytes)
+
+    def submit(self, pod_name: str, fun, *args, **kwargs) -> None:
+        """Queue the artifacts collection task.
+
+        Args:
+            pod_name (str): name of the pod which artifacts are collected
+            fun (Callable): collection task
+            args, kwargs: arguments of the task
+        """
+        if self._executor is None:
+            fun(*args, **kwargs)
+            return
+        with self._condition:
+            self._pending += 1
+            if self._running[pod_name] >= self.per_pod:
+                self._waiting[pod_name].append((fun, args, kwargs))
+                return
+            self._running[pod_name] += 1
+        self._executor.submit(self._run, pod_name, fun, args, kwargs)
+
+    def _run(self, pod_name, fun, args, kwargs):
+        """Run the task and start the next one waiting for the same pod."""
+        while True:
+            try:
+                fun(*args, **kwargs)
+            except Exception as exc:
+                self.__logger.error("Artifacts collection of pod %s failed: %s", pod_name, exc)
+                with self._condition:
+                    self._exceptions.append(exc)
+            with self._condition:
+                self._pending -= 1
+                self._condition.notify_all()
+                if not self._waiting[pod_name]:
+                    self._running[pod_name] -= 1
+                    return
+                fun, args, kwargs = self._waiting[pod_name].popleft()
+
+    def wait(self) -> None:
+        """Wait for all queued tasks.
+
+        Raises:
+            Exception: first exception raised by the tasks
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending == 0)
+            exceptions, self._exceptions = self._exceptions, []
+        if exceptions:
+            raise exceptions[0]
+
+    def close(self, cancel: bool = False) -> None:
+        """Stop the workers once the running tasks are done.
+
+        Args:
+            cancel (bool): are the tasks which are not started dropped
+        """
+        if self._executor is None:
+            return
+        if cancel:
+            with self._condition:
+                for waiting in self._waiting.values():
+                    self._pending -= len(waiting)
+                    waiting.clear()
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
@@ -1,26 +1,35 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 # SPDX-License-Identifier: Apache-2.0
+import hashlib
+import itertools
 import json
 import logging
 import os
-import re
-from pathlib import Path
 
-from jinja2 import Environment, PackageLoader, select_autoescape
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.stream import stream
-from natural.date import delta
 from onapsdk.configuration import settings
 from urllib3.exceptions import MaxRetryError, NewConnectionError
 from xtesting.core import testcase
 
 from onaptests.utils.exceptions import StatusCheckException
+from onaptests.utils.kubernetes import KubernetesHelper
 
 from ..base import BaseStep
+from .archive import DirectoryStore, open_store
+from .artifacts import ArtifactsCollector
+from .k8s_api import K8sApi
+from .rendering import PageRenderer
 from .resources import (ConfigMap, Container, DaemonSet, Deployment, Ingress,
-                        Job, Pod, Pvc, ReplicaSet, Secret, Service,
-                        StatefulSet, Node)
+                        Job, Node, Pod, Pvc, ReplicaSet, Secret, Service,
+                        StatefulSet)
+from .resources_index import EventsIndex, PodsIndex
+from .snapshot import StatusSnapshot
+from .versions import ImageInventory
+from .waivers import WaiverMatcher
+
+LOG_CHUNK_BYTES = 64 * 1024
 
 
 class CheckK8sResourcesStep(BaseStep):
@@ -28,30 +37,39 @@ class CheckK8sResourcesStep(BaseStep):
 
     __logger = logging.getLogger(__name__)
 
-    def __init__(self, namespace: str, resource_type: str, break_on_error=False):
+    core = K8sApi(client.CoreV1Api)
+    batch = K8sApi(client.BatchV1Api)
+    app = K8sApi(client.AppsV1Api)
+    networking = K8sApi(client.NetworkingV1Api)
+
+    def __init__(self, namespace: str, resource_type: str, break_on_error=False,
+                 events: EventsIndex = None, cluster: str = None):
         """Init CheckK8sResourcesStep."""
         super().__init__(cleanup=BaseStep.HAS_NO_CLEANUP, break_on_error=break_on_error)
-        self.core = client.CoreV1Api()
-        self.batch = client.BatchV1Api()
-        self.app = client.AppsV1Api()
-        self.networking = client.NetworkingV1Api()
+        self.cluster = cluster
         self.namespace = namespace
+        self.events = events
 
         if settings.STATUS_RESULTS_DIRECTORY:
             self.res_dir = f"{settings.STATUS_RESULTS_DIRECTORY}"
         else:
             self.res_dir = f"{testcase.TestCase.dir_results}/kubernetes-status"
 
+        if self.cluster is not None:
+            self.res_dir = f"{self.res_dir}/{self.cluster}"
         if not self.is_primary:
             self.res_dir = f"{self.res_dir}/{self.namespace}"
 
         self.failing = False
         self.resource_type = resource_type
         self.k8s_resources = []
+        self.k8s_resources_number = 0
         self.all_resources = []
+        self.resources_by_name = {}
         self.failing_resources = []
-        self.jinja_env = Environment(autoescape=select_autoescape(['html']),
-                                     loader=PackageLoader('onaptests.templates', 'status'))
+        self._matcher = None
+        self._store = None
+        self._renderer = None
 
     @property
     def component(self) -> str:
@@ -63,27 +81,157 @@ class CheckK8sResourcesStep(BaseStep):
         """Step description."""
         return f"Check status of all k8s {self.resource_type}s in the {self.namespace} namespace."
 
+    @property
+    def api_client(self) -> client.ApiClient:
+        """API client of the checked cluster, shared by all the steps checking it."""
+        if self.cluster is not None:
+            return KubernetesHelper.get_context_api_client(self.cluster)
+        return KubernetesHelper.get_api_client()
+
     @property
     def is_primary(self) -> bool:
         """Does step analyses primary namespace."""
         return self.namespace == settings.K8S_TESTS_NAMESPACE
 
+    @property
+    def snapshot(self) -> StatusSnapshot:
+        """Snapshot of the previous check.
+
+        Get from parent step, None if the check is not incremental.
+        """
+        if isinstance(self.parent, CheckK8sResourcesStep):
+            return self.parent.snapshot
+        return None
+
+    @property
+    def matcher(self) -> WaiverMatcher:
+        """Matcher of WAIVER_LIST and EXCLUDED_LABELS.
+
+        Get from parent step, built for the step if it is run alone.
+        """
+        if isinstance(self.parent, CheckK8sResourcesStep):
+            return self.parent.matcher
+        if self._matcher is None:
+            self._matcher = WaiverMatcher()
+        return self._matcher
+
+    @property
+    def store(self) -> DirectoryStore:
+        """Store of the artifacts.
+
+        Get from parent step, opened for the step if it is run alone.
+        """
+        if isinstance(self.parent, CheckK8sResourcesStep):
+            return self.parent.store
+        if self._store is None:
+            self._store = open_store(self.res_dir)
+        return self._store
+
+    @property
+    def renderer(self) -> PageRenderer:
+        """Renderer of the pages.
+
+        Get from parent step, built for the step if it is run alone.
+        """
+        if isinstance(self.parent, CheckK8sResourcesStep):
+            return self.parent.renderer
+        if self._renderer is None:
+            self._renderer = PageRenderer(store=self.store)
+        return self._renderer
+
+    @staticmethod
+    def _fingerprint(resource) -> str:
+        """Resource state fingerprint made of its and its pods' resource versions and events.
+
+        Events are shown on the pages, the fields they show are hashed.
+        """
+        pods = getattr(resource, "pods", [])
+        versions = [resource.k8s.metadata.resource_version]
+        versions.extend(pod.k8s.metadata.resource_version for pod in pods)
+        events = hashlib.sha256()
+        for event in itertools.chain(resource.events,
+                                     *(pod.events for pod in pods)):
+            events.update(repr((event.type, event.count, event.reason,
+                                event.message)).encode("utf-8"))
+        versions.append(events.hexdigest()[:16])
+        return ",".join(str(version) for version in versions)
+
+    def _dump_resource_page(self, resource, kind: str):
+        """Render the resource page.
+
+        Page is not rendered again if the resource did not change since the previous check.
+        """
+        if not self.renderer.enabled:
+            return
+        page = '{}/{}-{}.html'.format(self.res_dir, self.resource_type, resource.name)
+        snapshot = self.snapshot
+        if snapshot is not None:
+            fingerprint = self._fingerprint(resource)
+            snapshot.set(self.namespace, kind, resource.name,
+                         fingerprint=fingerprint, artifacts=[page])
+            if snapshot.is_up_to_date(self.namespace, kind, resource.name, fingerprint):
+                return
+        self.renderer.add('{}.html.j2'.format(self.resource_type), page,
+                          **{self.resource_type: resource})
+
     def _init_resources(self):
         if self.resource_type != "":
             self.__logger.debug(f"Loading all k8s {self.resource_type}s"
                                 " in the {NAMESPACE} namespace")
 
+    @staticmethod
+    def _list_resources(list_method, *args, model: str, **kwargs):
+        """List the resources page by page of K8S_LIST_PAGE_SIZE size.
+
+        If STATUS_RAW_JSON is set, resources are loaded from raw JSON
+        instead of k8s client models.
+
+        Args:
+            list_method (Callable): k8s client list method
+            model (str): name of the k8s client model of resources
+            args, kwargs: arguments passed to the list method
+
+        Returns:
+            Iterator: k8s resources, next page is requested when the previous one is consumed
+        """
+        if settings.STATUS_RAW_JSON:
+            return KubernetesHelper.list_all_raw(list_method, *args, model=model,
+                                                 limit=settings.K8S_LIST_PAGE_SIZE or None,
+                                                 **kwargs)
+        return KubernetesHelper.list_all(list_method, *args,
+                                         limit=settings.K8S_LIST_PAGE_SIZE or None, **kwargs)
+
+    def _list_resources_metadata(self, path: str, model: str):
+        """List only metadata of the resources page by page.
+
+        Used for resources which bodies are not checked, if STATUS_METADATA_ONLY is set.
+        """
+        return self._list_resources(KubernetesHelper.list_metadata, self.core.api_client,
+                                    path, f"{model}List", model=model,
+                                    namespace=self.namespace)
+
+    def _count_resources(self, resources):
+        """Count the k8s resources consumed by the parser."""
+        for k8s in resources:
+            self.k8s_resources_number += 1
+            yield k8s
+
     def _parse_resources(self):
         """Parse the resources."""
         return []
 
+    @staticmethod
+    def is_failing(k8s) -> bool:
+        """Check if the k8s resource is in error."""
+        return False
+
+    def _add_resource(self, resource):
+        self.all_resources.append(resource)
+        self.resources_by_name[resource.name] = resource
+
     def _add_failing_resource(self, resource):
-        if (hasattr(resource, 'labels') and resource.labels and settings.EXCLUDED_LABELS
-                and (resource.labels.keys() and settings.EXCLUDED_LABELS.keys())):
-            for label in resource.labels.items():
-                for waived_label in settings.EXCLUDED_LABELS.items():
-                    if label[0] in waived_label[0] and label[1] in waived_label[1]:
-                        return
+        if self.matcher.has_excluded_label(resource.labels):
+            return
         self.__logger.warning("a {} is in error: {}".format(self.resource_type, resource.name))
         self.failing_resources.append(resource)
         self.failing = True
@@ -91,13 +239,25 @@ class CheckK8sResourcesStep(BaseStep):
     def execute(self):
         super().execute()
         os.makedirs(self.res_dir, exist_ok=True)
+        if self.events is None:
+            self.events = EventsIndex(self.core, self.namespace)
         try:
             self._init_resources()
-            if len(self.k8s_resources) > 0:
+            resources = iter(self.k8s_resources)
+            first_resource = next(resources, None)
+            if first_resource is not None:
+                self.k8s_resources = self._count_resources(
+                    itertools.chain([first_resource], resources))
+                self._parse_resources()
+                if settings.STATUS_COMPACT_RESOURCES:
+                    for resource in self.all_resources:
+                        resource.compact()
+                if not isinstance(self.parent, CheckK8sResourcesStep):
+                    self.renderer.render()
+                    self.store.close()
                 self.__logger.info("%4s %ss in the namespace",
-                                   len(self.k8s_resources),
+                                   self.k8s_resources_number,
                                    self.resource_type)
-                self._parse_resources()
                 self.__logger.info("%4s %ss parsed, %s failing",
                                    len(self.all_resources),
                                    self.resource_type,
@@ -113,9 +273,9 @@ class CheckK8sResourcesStep(BaseStep):
 class CheckBasicK8sResourcesStep(CheckK8sResourcesStep):
     """Basic check of k8s resources in the selected namespace."""
 
-    def __init__(self, namespace: str, resource_type: str, k8s_res_class):
+    def __init__(self, namespace: str, resource_type: str, k8s_res_class, cluster: str = None):
         """Init CheckBasicK8sResourcesStep."""
-        super().__init__(namespace=namespace, resource_type=resource_type)
+        super().__init__(namespace=namespace, resource_type=resource_type, cluster=cluster)
         self.k8s_res_class = k8s_res_class
 
     def _parse_resources(self):
@@ -123,7 +283,7 @@ class CheckBasicK8sResourcesStep(CheckK8sResourcesStep):
         super()._parse_resources()
         for k8s in self.k8s_resources:
             resource = self.k8s_res_class(k8s=k8s)
-            self.all_resources.append(resource)
+            self._add_resource(resource)
 
     @BaseStep.store_state
     def execute(self):
@@ -133,49 +293,65 @@ class CheckBasicK8sResourcesStep(CheckK8sResourcesStep):
 class CheckK8sConfigMapsStep(CheckBasicK8sResourcesStep):
     """Check of k8s configmap in the selected namespace."""
 
-    def __init__(self, namespace: str):
+    def __init__(self, namespace: str, cluster: str = None):
         """Init CheckK8sConfigMapsStep."""
-        super().__init__(namespace=namespace, resource_type="configmap", k8s_res_class=ConfigMap)
+        super().__init__(namespace=namespace, resource_type="configmap", k8s_res_class=ConfigMap,
+                         cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.core.list_namespaced_config_map(self.namespace).items
+        if settings.STATUS_METADATA_ONLY:
+            self.k8s_resources = self._list_resources_metadata(
+                "/api/v1/namespaces/{namespace}/configmaps", "V1ConfigMap")
+        else:
+            self.k8s_resources = self._list_resources(
+                self.core.list_namespaced_config_map, self.namespace, model="V1ConfigMap")
 
 
 class CheckK8sSecretsStep(CheckBasicK8sResourcesStep):
     """Check of k8s secrets in the selected namespace."""
 
-    def __init__(self, namespace: str):
+    def __init__(self, namespace: str, cluster: str = None):
         """Init CheckK8sSecretsStep."""
-        super().__init__(namespace=namespace, resource_type="secret", k8s_res_class=Secret)
+        super().__init__(namespace=namespace, resource_type="secret", k8s_res_class=Secret,
+                         cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.core.list_namespaced_secret(self.namespace).items
+        if settings.STATUS_METADATA_ONLY:
+            self.k8s_resources = self._list_resources_metadata(
+                "/api/v1/namespaces/{namespace}/secrets", "V1Secret")
+        else:
+            self.k8s_resources = self._list_resources(
+                self.core.list_namespaced_secret, self.namespace, model="V1Secret")
 
 
 class CheckK8sIngressesStep(CheckBasicK8sResourcesStep):
     """Check of k8s ingress in the selected namespace."""
 
-    def __init__(self, namespace: str):
+    def __init__(self, namespace: str, cluster: str = None):
         """Init CheckK8sIngressesStep."""
-        super().__init__(namespace=namespace, resource_type="ingress", k8s_res_class=Ingress)
+        super().__init__(namespace=namespace, resource_type="ingress", k8s_res_class=Ingress,
+                         cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.networking.list_namespaced_ingress(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.networking.list_namespaced_ingress, self.namespace, model="V1Ingress")
 
 
 class CheckK8sPvcsStep(CheckK8sResourcesStep):
     """Check of k8s pvcs in the selected namespace."""
 
-    def __init__(self, namespace: str):
+    def __init__(self, namespace: str, events: EventsIndex = None, cluster: str = None):
         """Init CheckK8sPvcsStep."""
-        super().__init__(namespace=namespace, resource_type="pvc")
+        super().__init__(namespace=namespace, resource_type="pvc", events=events, cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.core.list_namespaced_persistent_volume_claim(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.core.list_namespaced_persistent_volume_claim, self.namespace,
+            model="V1PersistentVolumeClaim")
 
     def _parse_resources(self):
         """Parse the jobs.
@@ -184,15 +360,16 @@ class CheckK8sPvcsStep(CheckK8sResourcesStep):
         super()._parse_resources()
         for k8s in self.k8s_resources:
             pvc = Pvc(k8s=k8s)
-            field_selector = (f"involvedObject.name={pvc.name},"
-                              "involvedObject.kind=PersistentVolumeClaim")
-            pvc.events = self.core.list_namespaced_event(
-                self.namespace,
-                field_selector=field_selector).items
+            pvc.events = self.events.get(pvc.name, kind="PersistentVolumeClaim")
 
-            if k8s.status.phase != "Bound":
+            if self.is_failing(k8s):
                 self._add_failing_resource(pvc)
-            self.all_resources.append(pvc)
+            self._add_resource(pvc)
+
+    @staticmethod
+    def is_failing(k8s) -> bool:
+        """Check if the pvc is not bound."""
+        return k8s.status.phase != "Bound"
 
     @BaseStep.store_state
     def execute(self):
@@ -204,13 +381,13 @@ class CheckK8sNodesStep(CheckK8sResourcesStep):
 
     __logger = logging.getLogger(__name__)
 
-    def __init__(self, namespace: str):
+    def __init__(self, namespace: str, cluster: str = None):
         """Init CheckK8sNodesStep."""
-        super().__init__(namespace=namespace, resource_type="node")
+        super().__init__(namespace=namespace, resource_type="node", cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.core.list_node().items
+        self.k8s_resources = self._list_resources(self.core.list_node, model="V1Node")
 
     def _parse_resources(self):
         """Parse the nodes.
@@ -219,17 +396,27 @@ class CheckK8sNodesStep(CheckK8sResourcesStep):
         super()._parse_resources()
         for k8s in self.k8s_resources:
             node = Node(k8s=k8s)
-            for condition in k8s.status.conditions:
-                failing = False
-                if condition.status == 'False' and condition.type == 'Ready':
-                    failing = True
-                elif condition.status == 'True' and condition.type != 'Ready':
-                    failing = True
-                if failing:
-                    self._add_failing_resource(node)
-                    self.__logger.error(
-                        f"Node {node.name} {condition.type} status is {condition.status}")
-            self.all_resources.append(node)
+            for condition in self.failing_conditions(k8s):
+                self._add_failing_resource(node)
+                self.__logger.error(
+                    f"Node {node.name} {condition.type} status is {condition.status}")
+            self._add_resource(node)
+
+    @staticmethod
+    def failing_conditions(k8s) -> list:
+        """Get node conditions which are in error."""
+        failing = []
+        for condition in k8s.status.conditions or []:
+            if condition.status == 'False' and condition.type == 'Ready':
+                failing.append(condition)
+            elif condition.status == 'True' and condition.type != 'Ready':
+                failing.append(condition)
+        return failing
+
+    @staticmethod
+    def is_failing(k8s) -> bool:
+        """Check if the node has conditions in error."""
+        return len(CheckK8sNodesStep.failing_conditions(k8s)) > 0
 
     @BaseStep.store_state
     def execute(self):
@@ -239,34 +426,35 @@ class CheckK8sNodesStep(CheckK8sResourcesStep):
 class CheckK8sResourcesUsingPodsStep(CheckK8sResourcesStep):
     """Check of k8s respurces with pods in the selected namespace."""
 
-    def __init__(self, namespace: str, resource_type: str, pods_source):
+    def __init__(self, namespace: str, resource_type: str, pods_source,
+                 events: EventsIndex = None, cluster: str = None):
         """Init CheckK8sResourcesUsingPodsStep."""
-        super().__init__(namespace=namespace, resource_type=resource_type)
+        super().__init__(namespace=namespace, resource_type=resource_type, events=events,
+                         cluster=cluster)
         self.pods_source = pods_source
 
-    def _get_used_pods(self):
-        pods = []
+    @property
+    def dependencies(self) -> list:
+        """Pods source step is executed first."""
+        if self.pods_source is None:
+            return super().dependencies
+        return super().dependencies + [self.pods_source]
+
+    def _get_used_pods(self) -> set:
+        """Get names of the resources of pods source step."""
+        pods = set()
         if self.pods_source is not None:
-            pods = self.pods_source.all_resources
+            pods = set(self.pods_source.resources_by_name)
         return pods
 
     def _find_child_pods(self, selector):
-        pods_used = self._get_used_pods()
         pods_list = []
         failed_pods = 0
-        if selector:
-            raw_selector = ''
-            for key, value in selector.items():
-                raw_selector += key + '=' + value + ','
-            raw_selector = raw_selector[:-1]
-            pods = self.core.list_namespaced_pod(
-                self.namespace, label_selector=raw_selector).items
-            for pod in pods:
-                for known_pod in pods_used:
-                    if known_pod.name == pod.metadata.name:
-                        pods_list.append(known_pod)
-                        if not known_pod.ready():
-                            failed_pods += 1
+        if selector and self.pods_source is not None:
+            pods_list = self.pods_source.find_pods(selector)
+            for known_pod in pods_list:
+                if not known_pod.ready():
+                    failed_pods += 1
         return (pods_list, failed_pods)
 
     @BaseStep.store_state
@@ -279,13 +467,15 @@ class CheckK8sJobsStep(CheckK8sResourcesUsingPodsStep):
 
     __logger = logging.getLogger(__name__)
 
-    def __init__(self, namespace: str):
+    def __init__(self, namespace: str, events: EventsIndex = None, cluster: str = None):
         """Init CheckK8sJobsStep."""
-        super().__init__(namespace=namespace, resource_type="job", pods_source=None)
+        super().__init__(namespace=namespace, resource_type="job", pods_source=None,
+                         events=events, cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.batch.list_namespaced_job(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.batch.list_namespaced_job, self.namespace, model="V1Job")
 
     def _parse_resources(self):
         """Parse the jobs.
@@ -302,38 +492,46 @@ class CheckK8sJobsStep(CheckK8sResourcesUsingPodsStep):
                 (job.pods, job.failed_pods) = self._find_child_pods(
                     k8s.spec.selector.match_labels)
                 job_pods += job.pods
-            field_selector = "involvedObject.name={}".format(job.name)
-            field_selector += ",involvedObject.kind=Job"
-            job.events = self.core.list_namespaced_event(
-                self.namespace,
-                field_selector=field_selector).items
+            job.events = self.events.get(job.name, kind="Job")
 
-            self.jinja_env.get_template('job.html.j2').stream(job=job).dump(
-                '{}/job-{}.html'.format(self.res_dir, job.name))
+            self._dump_resource_page(job, "Job")
 
-            if not any(waiver_elt in job.name for waiver_elt in settings.WAIVER_LIST):
-                cron_job = self._get_cron_job_name(k8s)
+            if not self.matcher.is_waived(job.name):
+                cron_job = self.get_cron_job_name(k8s)
                 if cron_job:
                     if cron_job not in cron_jobs:
                         cron_jobs[cron_job] = []
                     cron_jobs[cron_job].append(job)
-                elif not k8s.status.completion_time:
+                elif self.is_failing(k8s):
                     # timemout job
                     self._add_failing_resource(job)
-                self.all_resources.append(job)
+                self._add_resource(job)
             else:
                 self.__logger.warning(
                     "Waiver pattern found in job, exclude %s", job.name)
             jobs_pods += job_pods
         for cron_job, jobs in cron_jobs.items():
-            if len(jobs) > 1:
-                jobs = sorted(jobs,
-                              key=lambda job: job.k8s.metadata.creation_timestamp,
-                              reverse=True)
-            if not jobs[0].k8s.status.completion_time:
-                self._add_failing_resource(jobs[0])
-
-    def _get_cron_job_name(self, k8s):
+            last_job = self.get_last_job(jobs)
+            if self.is_failing(last_job.k8s):
+                self._add_failing_resource(last_job)
+
+    @staticmethod
+    def is_failing(k8s) -> bool:
+        """Check if the job is not completed."""
+        return not k8s.status.completion_time
+
+    @staticmethod
+    def get_last_job(jobs):
+        """Get the most recently created job."""
+        if len(jobs) > 1:
+            jobs = sorted(jobs,
+                          key=lambda job: job.k8s.metadata.creation_timestamp,
+                          reverse=True)
+        return jobs[0]
+
+    @staticmethod
+    def get_cron_job_name(k8s):
+        """Get the name of the cron job owning the job, None if there is none."""
         if k8s.metadata.owner_references:
             for owner in k8s.metadata.owner_references:
                 if owner.kind == "CronJob":
@@ -346,108 +544,40 @@ class CheckK8sPodsStep(CheckK8sResourcesUsingPodsStep):
 
     __logger = logging.getLogger(__name__)
 
-    def __init__(self, namespace: str, pods):
-        """Init CheckK8sPodsStep."""
-        super().__init__(namespace=namespace, resource_type="pod", pods_source=pods)
+    def __init__(self, namespace: str, pods, events: EventsIndex = None,
+                 artifacts: ArtifactsCollector = None, cluster: str = None):
+        """Init CheckK8sPodsStep.
+
+        If artifacts collector is not given the step uses its own one
+        and waits for the collected artifacts before it ends.
+        """
+        super().__init__(namespace=namespace, resource_type="pod", pods_source=pods,
+                         events=events, cluster=cluster)
+        self.pods_index = PodsIndex()
+        self.artifacts = artifacts
+        self._wait_for_artifacts = artifacts is None
+        if self.artifacts is None:
+            self.artifacts = ArtifactsCollector()
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.core.list_namespaced_pod(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.core.list_namespaced_pod, self.namespace, model="V1Pod")
 
     def _parse_resources(self):  # noqa
         """Parse the pods."""
         super()._parse_resources()
         excluded_pods = self._get_used_pods()
-        pod_versions = []
-        containers = {}
+        inventory = ImageInventory()
         for k8s in self.k8s_resources:
             pod = Pod(k8s=k8s)
+            self.pods_index.add(k8s)
 
             # check version firstly
             if settings.CHECK_POD_VERSIONS:
-                pod_component = k8s.metadata.name
-                pod_component_from_label = None
-                if hasattr(k8s.metadata, "labels") and k8s.metadata.labels is not None:
-                    if 'app' in k8s.metadata.labels:
-                        pod_component_from_label = k8s.metadata.labels['app']
-                    else:
-                        if 'app.kubernetes.io/name' in k8s.metadata.labels:
-                            pod_component_from_label = k8s.metadata.labels[
-                                'app.kubernetes.io/name']
-                if pod_component_from_label is None:
-                    self.__logger.error("pod %s has no 'app' or 'app.kubernetes.io/name' "
-                                        "in metadata: %s", pod_component, k8s.metadata.labels)
-                else:
-                    pod_component = pod_component_from_label
-
-                # looks for docker version
-                for container in k8s.spec.containers:
-                    pod_version = {}
-                    pod_container_version = container.image.rsplit(":", 1)
-                    pod_container_image = pod_container_version[0]
-                    pod_container_tag = "latest"
-                    if len(pod_container_version) > 1:
-                        pod_container_tag = pod_container_version[1]
-
-                    pod_version.update({
-                        'container': container.name,
-                        'component': pod_component,
-                        'image': pod_container_image,
-                        'version': pod_container_tag
-                    })
-                    pod_versions.append(pod_version)
-
-                    search_rule = "^(?P<source>[^/]*)/*(?P<container>[^:]*):*(?P<version>.*)$"
-                    search = re.search(search_rule, container.image)
-                    name = "{}/{}".format(search.group('source'),
-                                          search.group('container'))
-                    version = search.group('version')
-                    if name[-1] == '/':
-                        name = name[0:-1]
-                    source = "default"
-                    if search.group('source') in settings.DOCKER_REPOSITORIES:
-                        source = search.group('source')
-                        name = search.group('container')
-                    container_search_rule = "^library/(?P<real_container>[^:]*)$"
-                    container_search = re.search(container_search_rule, name)
-                    if container_search:
-                        name = container_search.group('real_container')
-                    for common_component in settings.GENERIC_NAMES.keys():
-                        if name in settings.GENERIC_NAMES[common_component]:
-                            version = "{}:{}".format(name, version)
-                            name = common_component
-                            break
-
-                    repository = settings.DOCKER_REPOSITORIES_NICKNAMES[source]
-                    if name in containers:
-                        if version in containers[name]['versions']:
-                            if not (pod_component in containers[name]['versions']
-                                    [version]['components']):
-                                containers[name]['versions'][version][
-                                    'components'].append(pod_component)
-                                containers[name]['number_components'] += 1
-                            if not (repository in containers[name]['versions']
-                                    [version]['repositories']):
-                                containers[name]['versions'][version][
-                                    'repositories'].append(repository)
-                        else:
-                            containers[name]['versions'][version] = {
-                                'repositories': [repository],
-                                'components': [pod_component]
-                            }
-                            containers[name]['number_components'] += 1
-                    else:
-                        containers[name] = {
-                            'versions': {
-                                version: {
-                                    'repositories': [repository],
-                                    'components': [pod_component]
-                                }
-                            },
-                            'number_components': 1
-                        }
+                inventory.add_pod(k8s)
             # pod version check end
-            if excluded_pods and pod in excluded_pods:
+            if pod.name in excluded_pods:
                 continue
 
             if k8s.status.init_container_statuses:
@@ -458,49 +588,102 @@ class CheckK8sPodsStep(CheckK8sResourcesUsingPodsStep):
                 for k8s_container in k8s.status.container_statuses:
                     pod.running_containers += self._parse_container(
                         pod, k8s_container)
-            pod.events = self.core.list_namespaced_event(
-                self.namespace,
-                field_selector="involvedObject.name={}".format(pod.name)).items
-            self.jinja_env.get_template('pod.html.j2').stream(pod=pod).dump(
-                '{}/pod-{}.html'.format(self.res_dir, pod.name))
-            if any(waiver_elt in pod.name for waiver_elt in settings.WAIVER_LIST):
+            pod.events = self.events.get(pod.name)
+            self._dump_resource_page(pod, "Pod")
+            if self.matcher.is_waived(pod.name):
                 self.__logger.warning("Waiver pattern found in pod, exclude %s", pod.name)
             else:
-                self.all_resources.append(pod)
+                self._add_resource(pod)
 
         if settings.CHECK_POD_VERSIONS:
-            self.jinja_env.get_template('version.html.j2').stream(
-                pod_versions=pod_versions).dump('{}/versions.html'.format(
-                    self.res_dir))
-            self.jinja_env.get_template('container_versions.html.j2').stream(
-                containers=containers).dump('{}/container_versions.html'.format(
-                    self.res_dir))
+            self.renderer.add('version.html.j2', '{}/versions.html'.format(self.res_dir),
+                              pod_versions=inventory.pod_versions)
+            self.renderer.add('container_versions.html.j2',
+                              '{}/container_versions.html'.format(self.res_dir),
+                              containers=inventory.containers)
             # create a json file for version tracking
-            with open(self.res_dir + "/onap_versions.json", "w", encoding="utf-8") as write_file:
-                json.dump(pod_versions, write_file)
+            self.store.write(self.res_dir + "/onap_versions.json",
+                             json.dumps(inventory.pod_versions))
+        if self._wait_for_artifacts:
+            try:
+                self.artifacts.wait()
+            finally:
+                self.artifacts.close()
+
+    def find_pods(self, selector):
+        """Find checked pods matching the labels selector.
+
+        Args:
+            selector (dict): labels which have to be set on the pod
+
+        Returns:
+            list: checked pods matching the selector
+        """
+        return [self.resources_by_name[name] for name in self.pods_index.find(selector)
+                if name in self.resources_by_name]
 
     def _get_container_logs(self, pod, container, full=True, previous=False):
-        logs = ""
+        """Get the logs of the container.
+
+        Returns:
+            Iterator[bytes]: chunks of the logs read from the API server
+        """
         limit_bytes = settings.MAX_LOG_BYTES
         if full:
             limit_bytes = settings.UNLIMITED_LOG_BYTES
+        response = self.core.read_namespaced_pod_log(
+            pod.name,
+            self.namespace,
+            container=container.name,
+            limit_bytes=limit_bytes,
+            previous=previous,
+            _preload_content=False
+        )
+        return self._read_response(response)
+
+    @staticmethod
+    def _read_response(response):
+        """Read the HTTP response body by chunks."""
         try:
-            logs = self.core.read_namespaced_pod_log(
-                pod.name,
-                self.namespace,
-                container=container.name,
-                limit_bytes=limit_bytes,
-                previous=previous
-            )
-        except UnicodeDecodeError:
-            logs = "{0} has an unicode decode error...".format(pod.name)
-            self.__logger.error(logs)
-        return logs
+            yield from response.stream(LOG_CHUNK_BYTES)
+        finally:
+            response.release_conn()
+
+    def _get_container_file(self, pod, container, log_file):
+        """Get the content of the file from the container.
+
+        Returns:
+            Iterator[str]: chunks of the file content
+        """
+        exec_command = ['/bin/sh', '-c', "cat {}".format(log_file)]
+        response = stream(
+            self.core.connect_get_namespaced_pod_exec,
+            pod.name,
+            self.namespace,
+            container=container.name,
+            command=exec_command,
+            stderr=True,
+            stdin=False,
+            stdout=True,
+            tty=False,
+            _preload_content=False)
+        return self._read_exec_response(response)
+
+    @staticmethod
+    def _read_exec_response(response):
+        """Read the exec output by chunks."""
+        try:
+            while response.is_open():
+                response.update(timeout=1)
+                if response.peek_stdout():
+                    yield response.read_stdout()
+                if response.peek_stderr():
+                    yield response.read_stderr()
+        finally:
+            response.close()
 
     def _parse_container(self, pod, k8s_container, init=False):  # noqa
-        """Get the logs of a container."""
-        logs = ""
-        old_logs = ""
+        """Parse the container and queue the collection of its logs."""
         prefix = ""
         containers_list = pod.containers
         container = Container(name=k8s_container.name)
@@ -516,81 +699,124 @@ class CheckK8sPodsStep(CheckK8sResourcesUsingPodsStep):
                 pod.init_done = False
         else:
             pod.restart_count = max(pod.restart_count, container.restart_count)
-        if settings.STORE_ARTIFACTS:
+        if settings.STORE_ARTIFACTS and not self._is_container_up_to_date(pod, container):
+            self.artifacts.submit(pod.name, self._collect_container_artifacts,
+                                  pod, container, prefix)
+        if self.matcher.is_waived(container.name):
+            self.__logger.warning(
+                "Waiver pattern found in container, exclude %s", container.name)
+        else:
+            containers_list.append(container)
+            if k8s_container.ready:
+                return 1
+        return 0
+
+    def _container_artifacts(self, pod, container):
+        """Paths of the artifacts collected for the container."""
+        prefix = "{}/pod-{}-{}".format(self.res_dir, pod.name, container.name)
+        artifacts = ["{}.log".format(prefix), "{}-logs.html".format(prefix)]
+        if (not container.ready) and container.restart_count > 0:
+            artifacts.append("{}.old.log".format(prefix))
+        for log_file in settings.SPECIFIC_LOGS_CONTAINERS.get(container.name, []):
+            artifacts.append("{}-{}.log".format(prefix, log_file.split('.')[0].split('/')[-1]))
+        return artifacts
+
+    def _is_container_up_to_date(self, pod, container):
+        """Check if the container artifacts collected by the previous check can be reused.
+
+        They are reused if container restart count and status did not change.
+        """
+        snapshot = self.snapshot
+        if snapshot is None:
+            return False
+        entry = {
+            "restart_count": container.restart_count,
+            "status": container.status,
+            "artifacts": self._container_artifacts(pod, container)
+        }
+        snapshot.set_container(self.namespace, pod.name, container.name, **entry)
+        previous = snapshot.get_container(self.namespace, pod.name, container.name)
+        if previous == entry and snapshot.artifacts_exist(entry):
+            self.__logger.debug("Container %s of pod %s did not change, logs are not collected",
+                                container.name, pod.name)
+            return True
+        return False
+
+    def _store_logs(self, chunks, pod, container, suffix=""):
+        """Write the logs to the container's log file chunk by chunk.
+
+        Returns:
+            str: the end of the logs, up to MAX_LOG_BYTES, to be shown on the logs page
+        """
+        tail = bytearray()
+        size = 0
+        with self.store.open(
+                "{}/pod-{}-{}{}.log".format(self.res_dir, pod.name, container.name, suffix)
+        ) as log_result:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode("utf-8")
+                log_result.write(chunk)
+                self.artifacts.add_bytes(len(chunk))
+                size += len(chunk)
+                tail += chunk
+                if len(tail) > 2 * settings.MAX_LOG_BYTES:
+                    del tail[:-settings.MAX_LOG_BYTES]
+                if self.artifacts.exhausted:
+                    break
+        logs = bytes(tail[-settings.MAX_LOG_BYTES:]).decode("utf-8", errors="replace")
+        if size > settings.MAX_LOG_BYTES:
+            logs = "[...] (only the last {} bytes are shown, see raw version)\n{}".format(
+                settings.MAX_LOG_BYTES, logs)
+        return logs
+
+    def _collect_container_artifacts(self, pod, container, prefix=""):
+        """Download the logs of a container and render its logs page."""
+        logs = ""
+        old_logs = ""
+        log_files = {}
+        if self.artifacts.exhausted:
+            logs = "Logs are not collected, artifacts size limit is reached"
+        else:
             try:
-                log_files = {}
-                logs = self._get_container_logs(pod=pod, container=container, full=False)
-                with open(
-                        "{}/pod-{}-{}.log".format(self.res_dir,
-                                                  pod.name, container.name),
-                        'w', encoding="utf-8") as log_result:
-                    log_result.write(logs)
+                full = container.name in settings.FULL_LOGS_CONTAINERS
+                logs = self._store_logs(
+                    self._get_container_logs(pod=pod, container=container, full=full),
+                    pod, container)
                 if (not container.ready) and container.restart_count > 0:
-                    old_logs = self._get_container_logs(pod=pod, container=container,
-                                                        previous=True)
-                    with open(
-                            "{}/pod-{}-{}.old.log".format(self.res_dir,
-                                                          pod.name,
-                                                          container.name),
-                            'w', encoding="utf-8") as log_result:
-                        log_result.write(old_logs)
-                if container.name in settings.FULL_LOGS_CONTAINERS:
-                    logs = self._get_container_logs(pod=pod, container=container)
-                    with open(
-                            "{}/pod-{}-{}.log".format(self.res_dir,
-                                                      pod.name, container.name),
-                            'w', encoding="utf-8") as log_result:
-                        log_result.write(logs)
+                    old_logs = self._store_logs(
+                        self._get_container_logs(pod=pod, container=container, previous=True),
+                        pod, container, ".old")
                 if container.name in settings.SPECIFIC_LOGS_CONTAINERS:
                     for log_file in settings.SPECIFIC_LOGS_CONTAINERS[container.name]:
-                        exec_command = ['/bin/sh', '-c', "cat {}".format(log_file)]
-                        log_files[log_file] = stream(
-                            self.core.connect_get_namespaced_pod_exec,
-                            pod.name,
-                            self.namespace,
-                            container=container.name,
-                            command=exec_command,
-                            stderr=True,
-                            stdin=False,
-                            stdout=True,
-                            tty=False)
                         log_file_slug = log_file.split('.')[0].split('/')[-1]
-                        with open(
-                                "{}/pod-{}-{}-{}.log".format(
-                                    self.res_dir, pod.name,
-                                    container.name, log_file_slug),
-                                'w', encoding="utf-8") as log_result:
-                            log_result.write(log_files[log_file])
+                        log_files[log_file] = self._store_logs(
+                            self._get_container_file(pod, container, log_file),
+                            pod, container, "-{}".format(log_file_slug))
             except client.rest.ApiException as exc:
                 self.__logger.warning("%scontainer %s of pod %s has an exception: %s",
                                       prefix, container.name, pod.name, exc.reason)
-            self.jinja_env.get_template('container_log.html.j2').stream(
-                container=container,
-                pod_name=pod.name,
-                logs=logs,
-                old_logs=old_logs,
-                log_files=log_files).dump('{}/pod-{}-{}-logs.html'.format(
-                    self.res_dir, pod.name, container.name))
-        if any(waiver_elt in container.name for waiver_elt in settings.WAIVER_LIST):
-            self.__logger.warning(
-                "Waiver pattern found in container, exclude %s", container.name)
-        else:
-            containers_list.append(container)
-            if k8s_container.ready:
-                return 1
-        return 0
+        self.renderer.add('container_log.html.j2',
+                          '{}/pod-{}-{}-logs.html'.format(self.res_dir, pod.name, container.name),
+                          container=container,
+                          pod_name=pod.name,
+                          logs=logs,
+                          old_logs=old_logs,
+                          log_files=log_files)
 
 
 class CheckK8sServicesStep(CheckK8sResourcesUsingPodsStep):
     """Check of k8s services in the selected namespace."""
 
-    def __init__(self, namespace: str, pods):
+    def __init__(self, namespace: str, pods, cluster: str = None):
         """Init CheckK8sServicesStep."""
-        super().__init__(namespace=namespace, resource_type="service", pods_source=pods)
+        super().__init__(namespace=namespace, resource_type="service", pods_source=pods,
+                         cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.core.list_namespaced_service(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.core.list_namespaced_service, self.namespace, model="V1Service")
 
     def _parse_resources(self):
         """Parse the services."""
@@ -601,22 +827,22 @@ class CheckK8sServicesStep(CheckK8sResourcesUsingPodsStep):
             (service.pods,
              service.failed_pods) = self._find_child_pods(k8s.spec.selector)
 
-            self.jinja_env.get_template('service.html.j2').stream(
-                service=service).dump('{}/service-{}.html'.format(
-                    self.res_dir, service.name))
-            self.all_resources.append(service)
+            self._dump_resource_page(service, "Service")
+            self._add_resource(service)
 
 
 class CheckK8sDeploymentsStep(CheckK8sResourcesUsingPodsStep):
     """Check of k8s deployments in the selected namespace."""
 
-    def __init__(self, namespace: str, pods):
+    def __init__(self, namespace: str, pods, events: EventsIndex = None, cluster: str = None):
         """Init CheckK8sDeploymentsStep."""
-        super().__init__(namespace=namespace, resource_type="deployment", pods_source=pods)
+        super().__init__(namespace=namespace, resource_type="deployment", pods_source=pods,
+                         events=events, cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.app.list_namespaced_deployment(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.app.list_namespaced_deployment, self.namespace, model="V1Deployment")
 
     def _parse_resources(self):
         """Parse the deployments."""
@@ -630,32 +856,33 @@ class CheckK8sDeploymentsStep(CheckK8sResourcesUsingPodsStep):
                 (deployment.pods,
                  deployment.failed_pods) = self._find_child_pods(
                      k8s.spec.selector.match_labels)
-            field_selector = "involvedObject.name={}".format(deployment.name)
-            field_selector += ",involvedObject.kind=Deployment"
-            deployment.events = self.core.list_namespaced_event(
-                self.namespace,
-                field_selector=field_selector).items
+            deployment.events = self.events.get(deployment.name, kind="Deployment")
 
-            self.jinja_env.get_template('deployment.html.j2').stream(
-                deployment=deployment).dump('{}/deployment-{}.html'.format(
-                    self.res_dir, deployment.name))
+            self._dump_resource_page(deployment, "Deployment")
 
-            if k8s.status.unavailable_replicas:
+            if self.is_failing(k8s):
                 self._add_failing_resource(deployment)
 
-            self.all_resources.append(deployment)
+            self._add_resource(deployment)
+
+    @staticmethod
+    def is_failing(k8s) -> bool:
+        """Check if the deployment has unavailable replicas."""
+        return bool(k8s.status.unavailable_replicas)
 
 
 class CheckK8sReplicaSetsStep(CheckK8sResourcesUsingPodsStep):
     """Check of k8s replicasets in the selected namespace."""
 
-    def __init__(self, namespace: str, pods):
+    def __init__(self, namespace: str, pods, events: EventsIndex = None, cluster: str = None):
         """Init CheckK8sReplicaSetsStep."""
-        super().__init__(namespace=namespace, resource_type="replicaset", pods_source=pods)
+        super().__init__(namespace=namespace, resource_type="replicaset", pods_source=pods,
+                         events=events, cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.app.list_namespaced_replica_set(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.app.list_namespaced_replica_set, self.namespace, model="V1ReplicaSet")
 
     def _parse_resources(self):
         """Parse the replicasets."""
@@ -670,33 +897,34 @@ class CheckK8sReplicaSetsStep(CheckK8sResourcesUsingPodsStep):
                 (replicaset.pods,
                  replicaset.failed_pods) = self._find_child_pods(
                      k8s.spec.selector.match_labels)
-            field_selector = "involvedObject.name={}".format(replicaset.name)
-            field_selector += ",involvedObject.kind=ReplicaSet"
-            replicaset.events = self.core.list_namespaced_event(
-                self.namespace,
-                field_selector=field_selector).items
-
-            self.jinja_env.get_template('replicaset.html.j2').stream(
-                replicaset=replicaset).dump('{}/replicaset-{}.html'.format(
-                    self.res_dir, replicaset.name))
-
-            if (not k8s.status.ready_replicas or
-                    (k8s.status.ready_replicas < k8s.status.replicas)):
+            replicaset.events = self.events.get(replicaset.name, kind="ReplicaSet")
+
+            self._dump_resource_page(replicaset, "ReplicaSet")
+
+            if self.is_failing(k8s):
                 self._add_failing_resource(replicaset)
 
-            self.all_resources.append(replicaset)
+            self._add_resource(replicaset)
+
+    @staticmethod
+    def is_failing(k8s) -> bool:
+        """Check if the replicaset has not ready replicas."""
+        return (not k8s.status.ready_replicas or
+                (k8s.status.ready_replicas < k8s.status.replicas))
 
 
 class CheckK8sStatefulSetsStep(CheckK8sResourcesUsingPodsStep):
     """Check of k8s statefulsets in the selected namespace."""
 
-    def __init__(self, namespace: str, pods):
+    def __init__(self, namespace: str, pods, events: EventsIndex = None, cluster: str = None):
         """Init CheckK8sStatefulSetsStep."""
-        super().__init__(namespace=namespace, resource_type="statefulset", pods_source=pods)
+        super().__init__(namespace=namespace, resource_type="statefulset", pods_source=pods,
+                         events=events, cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.app.list_namespaced_stateful_set(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.app.list_namespaced_stateful_set, self.namespace, model="V1StatefulSet")
 
     def _parse_resources(self):
         """Parse the statefulsets."""
@@ -711,33 +939,34 @@ class CheckK8sStatefulSetsStep(CheckK8sResourcesUsingPodsStep):
                 (statefulset.pods,
                  statefulset.failed_pods) = self._find_child_pods(
                      k8s.spec.selector.match_labels)
-            field_selector = "involvedObject.name={}".format(statefulset.name)
-            field_selector += ",involvedObject.kind=StatefulSet"
-            statefulset.events = self.core.list_namespaced_event(
-                self.namespace,
-                field_selector=field_selector).items
-
-            self.jinja_env.get_template('statefulset.html.j2').stream(
-                statefulset=statefulset).dump('{}/statefulset-{}.html'.format(
-                    self.res_dir, statefulset.name))
-
-            if ((not k8s.status.ready_replicas)
-                    or (k8s.status.ready_replicas < k8s.status.replicas)):
+            statefulset.events = self.events.get(statefulset.name, kind="StatefulSet")
+
+            self._dump_resource_page(statefulset, "StatefulSet")
+
+            if self.is_failing(k8s):
                 self._add_failing_resource(statefulset)
 
-            self.all_resources.append(statefulset)
+            self._add_resource(statefulset)
+
+    @staticmethod
+    def is_failing(k8s) -> bool:
+        """Check if the statefulset has not ready replicas."""
+        return ((not k8s.status.ready_replicas)
+                or (k8s.status.ready_replicas < k8s.status.replicas))
 
 
 class CheckK8sDaemonSetsStep(CheckK8sResourcesUsingPodsStep):
     """Check of k8s daemonsets in the selected namespace."""
 
-    def __init__(self, namespace: str, pods):
+    def __init__(self, namespace: str, pods, events: EventsIndex = None, cluster: str = None):
         """Init CheckK8sDaemonSetsStep."""
-        super().__init__(namespace=namespace, resource_type="daemonset", pods_source=pods)
+        super().__init__(namespace=namespace, resource_type="daemonset", pods_source=pods,
+                         events=events, cluster=cluster)
 
     def _init_resources(self):
         super()._init_resources()
-        self.k8s_resources = self.app.list_namespaced_daemon_set(self.namespace).items
+        self.k8s_resources = self._list_resources(
+            self.app.list_namespaced_daemon_set, self.namespace, model="V1DaemonSet")
 
     def _parse_resources(self):
         """Parse the daemonsets."""
@@ -749,201 +978,16 @@ class CheckK8sDaemonSetsStep(CheckK8sResourcesUsingPodsStep):
                 (daemonset.pods,
                  daemonset.failed_pods) = self._find_child_pods(
                      k8s.spec.selector.match_labels)
-            field_selector = "involvedObject.name={}".format(daemonset.name)
-            field_selector += ",involvedObject.kind=DaemonSet"
-            daemonset.events = self.core.list_namespaced_event(
-                self.namespace,
-                field_selector=field_selector).items
+            daemonset.events = self.events.get(daemonset.name, kind="DaemonSet")
 
-            self.jinja_env.get_template('daemonset.html.j2').stream(
-                daemonset=daemonset).dump('{}/daemonset-{}.html'.format(
-                    self.res_dir, daemonset.name))
+            self._dump_resource_page(daemonset, "DaemonSet")
 
-            if k8s.status.number_ready < k8s.status.desired_number_scheduled:
+            if self.is_failing(k8s):
                 self._add_failing_resource(daemonset)
 
-            self.all_resources.append(daemonset)
-
-
-class CheckNamespaceStatusStep(CheckK8sResourcesStep):
-    """Check status of all k8s resources in the selected namespace."""
-
-    __logger = logging.getLogger(__name__)
-
-    def __init__(self):
-        """Init CheckNamespaceStatusStep."""
-        super().__init__(namespace=settings.K8S_TESTS_NAMESPACE, resource_type="")
-        self.__logger.debug("K8s namespaces status test init started")
-
-        self.job_list_step = None
-        self.pod_list_step = None
-        self.service_list_step = None
-        self.deployment_list_step = None
-        self.replicaset_list_step = None
-        self.statefulset_list_step = None
-        self.daemonset_list_step = None
-        self.configmap_list_step = None
-        self.secret_list_step = None
-        self.ingress_list_step = None
-        self.pvc_list_step = None
-        self.node_list_step = None
-        if not settings.IF_VALIDATION:
-            if settings.IN_CLUSTER:
-                config.load_incluster_config()
-            else:
-                config.load_kube_config(config_file=settings.K8S_CONFIG)
-        if settings.CHECK_ALL_NAMESPACES or settings.EXCLUDE_NAMESPACE_LIST:
-            self.namespaces_to_check_set = {namespace.metadata.name for namespace in
-                                            client.CoreV1Api().list_namespace().items} - set(
-                                                settings.EXCLUDE_NAMESPACE_LIST)
-        else:
-            self.namespaces_to_check_set = set([self.namespace] + settings.EXTRA_NAMESPACE_LIST)
-        for namespace in self.namespaces_to_check_set:
-            self._init_namespace_steps(namespace)
-        self.pods = []
-        self.services = []
-        self.jobs = []
-        self.deployments = []
-        self.replicasets = []
-        self.statefulsets = []
-        self.daemonsets = []
-        self.pvcs = []
-        self.configmaps = []
-        self.secrets = []
-        self.ingresses = []
-        self.nodes = []
-        self.failing_statefulsets = []
-        self.failing_jobs = []
-        self.failing_deployments = []
-        self.failing_replicasets = []
-        self.failing_daemonsets = []
-        self.failing_pvcs = []
-        self.failing_nodes = []
-
-    def _init_namespace_steps(self, namespace: str):
-        job_list_step = CheckK8sJobsStep(namespace)
-        pod_list_step = CheckK8sPodsStep(namespace, job_list_step)
-        service_list_step = CheckK8sServicesStep(namespace, pod_list_step)
-        deployment_list_step = CheckK8sDeploymentsStep(namespace, pod_list_step)
-        replicaset_list_step = CheckK8sReplicaSetsStep(namespace, pod_list_step)
-        statefulset_list_step = CheckK8sStatefulSetsStep(namespace, pod_list_step)
-        daemonset_list_step = CheckK8sDaemonSetsStep(namespace, pod_list_step)
-        configmap_list_step = CheckK8sConfigMapsStep(namespace)
-        secret_list_step = CheckK8sSecretsStep(namespace)
-        ingress_list_step = CheckK8sIngressesStep(namespace)
-        pvc_list_step = CheckK8sPvcsStep(namespace)
-        node_list_step = CheckK8sNodesStep(namespace)
-        if namespace == settings.K8S_TESTS_NAMESPACE:
-            self.job_list_step = job_list_step
-            self.pod_list_step = pod_list_step
-            self.service_list_step = service_list_step
-            self.deployment_list_step = deployment_list_step
-            self.replicaset_list_step = replicaset_list_step
-            self.statefulset_list_step = statefulset_list_step
-            self.daemonset_list_step = daemonset_list_step
-            self.configmap_list_step = configmap_list_step
-            self.secret_list_step = secret_list_step
-            self.ingress_list_step = ingress_list_step
-            self.pvc_list_step = pvc_list_step
-            self.node_list_step = node_list_step
-            self.add_step(node_list_step)
-        self.add_step(job_list_step)
-        self.add_step(pod_list_step)
-        self.add_step(service_list_step)
-        self.add_step(deployment_list_step)
-        self.add_step(replicaset_list_step)
-        self.add_step(statefulset_list_step)
-        self.add_step(daemonset_list_step)
-        self.add_step(configmap_list_step)
-        self.add_step(secret_list_step)
-        self.add_step(ingress_list_step)
-        self.add_step(pvc_list_step)
-
-    @property
-    def description(self) -> str:
-        """Step description."""
-        return "Check status of all k8s resources in the selected namespaces."
-
-    @property
-    def component(self) -> str:
-        """Component name."""
-        return "ALL"
+            self._add_resource(daemonset)
 
-    @BaseStep.store_state
-    def execute(self):
-        """Check status of all k8s resources in the selected namespaces.
-
-        Use settings values:
-         - K8S_TESTS_NAMESPACE
-         - STATUS_RESULTS_DIRECTORY
-         - STORE_ARTIFACTS
-         - CHECK_POD_VERSIONS
-         - IGNORE_EMPTY_REPLICAS
-         - INCLUDE_ALL_RES_IN_DETAILS
-        """
-        super().execute()
-
-        self.pods = self.pod_list_step.all_resources
-        self.services = self.service_list_step.all_resources
-        self.jobs = self.job_list_step.all_resources
-        self.deployments = self.deployment_list_step.all_resources
-        self.replicasets = self.replicaset_list_step.all_resources
-        self.statefulsets = self.statefulset_list_step.all_resources
-        self.daemonsets = self.daemonset_list_step.all_resources
-        self.pvcs = self.pvc_list_step.all_resources
-        self.configmaps = self.configmap_list_step.all_resources
-        self.secrets = self.secret_list_step.all_resources
-        self.ingresses = self.ingress_list_step.all_resources
-
-        self.failing_statefulsets = self.statefulset_list_step.failing_resources
-        self.failing_jobs = self.job_list_step.failing_resources
-        self.failing_deployments = self.deployment_list_step.failing_resources
-        self.failing_replicasets = self.replicaset_list_step.failing_resources
-        self.failing_daemonsets = self.daemonset_list_step.failing_resources
-        self.failing_pvcs = self.pvc_list_step.failing_resources
-
-        self.jinja_env.get_template('index.html.j2').stream(
-            ns=self,
-            delta=delta).dump('{}/index.html'.format(self.res_dir))
-        self.jinja_env.get_template('raw_output.txt.j2').stream(
-            ns=self, namespace=self.namespace).dump('{}/onap-k8s.log'.format(
-                self.res_dir))
-
-        details = {"namespace": {
-            "all": list(self.namespaces_to_check_set - set([self.namespace])),
-            "resources": {}
-        }}
-
-        def store_results(result_dict, step):
-            result_dict[step.resource_type] = {
-                'number_failing': len(step.failing_resources),
-                'failing': self.map_by_name(step.failing_resources)
-            }
-            if settings.INCLUDE_ALL_RES_IN_DETAILS:
-                result_dict[step.resource_type]['all'] = self.map_by_name(step.all_resources)
-                result_dict[step.resource_type]['number_all'] = len(step.all_resources)
-
-        for step in self._steps:
-            if step.failing:
-                self.failing = True
-                self.__logger.info("%s failing: %s",
-                                   step.resource_type,
-                                   len(step.failing_resources))
-            if step.is_primary:
-                store_results(details, step)
-            else:
-                ns_details = details["namespace"]["resources"]
-                if step.namespace not in ns_details:
-                    ns_details[step.namespace] = {}
-                ns_details = ns_details[step.namespace]
-                store_results(ns_details, step)
-
-        with (Path(self.res_dir).joinpath(settings.STATUS_DETAILS_JSON)
-              ).open('w', encoding="utf-8") as file:
-            json.dump(details, file, indent=4)
-        if self.failing:
-            raise StatusCheckException
-
-    def map_by_name(self, resources):
-        """Get resources' names."""
-        return list(map(lambda resource: resource.name, resources))
+    @staticmethod
+    def is_failing(k8s) -> bool:
+        """Check if the daemonset has not ready pods."""
+        return k8s.status.number_ready < k8s.status.desired_number_scheduled
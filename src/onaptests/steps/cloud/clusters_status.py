@@ -0,0 +1,74 @@
+"""Clusters status check module."""
+import json
+import logging
+import os
+from pathlib import Path
+
+from onapsdk.configuration import settings
+from xtesting.core import testcase
+
+from onaptests.utils.exceptions import StatusCheckException
+
+from ..base import BaseStep
+from .namespace_status import CheckNamespaceStatusStep
+
+
+class CheckClustersStatusStep(BaseStep):
+    """Check status of k8s resources of several clusters."""
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, clusters: list = None):
+        """Init CheckClustersStatusStep.
+
+        Args:
+            clusters (list): kubeconfig contexts of the checked clusters.
+                Defaults to K8S_CONTEXTS
+        """
+        super().__init__(cleanup=BaseStep.HAS_NO_CLEANUP, break_on_error=False,
+                         parallel_substeps=True)
+        if clusters is None:
+            clusters = settings.K8S_CONTEXTS
+        if settings.STATUS_RESULTS_DIRECTORY:
+            self.res_dir = f"{settings.STATUS_RESULTS_DIRECTORY}"
+        else:
+            self.res_dir = f"{testcase.TestCase.dir_results}/kubernetes-status"
+        for cluster in clusters:
+            self.add_step(CheckNamespaceStatusStep(cluster=cluster))
+
+    @property
+    def component(self) -> str:
+        """Component name."""
+        return "ALL"
+
+    @property
+    def description(self) -> str:
+        """Step description."""
+        return "Check status of all k8s resources in the selected clusters."
+
+    @property
+    def substeps_workers(self) -> int:
+        """Clusters are checked at the same time, each with its own API client."""
+        return len(self._steps)
+
+    @BaseStep.store_state
+    def execute(self):
+        """Check status of all k8s resources in the selected clusters.
+
+        Details of all clusters are stored in STATUS_DETAILS_JSON by cluster.
+
+        Use settings values:
+         - K8S_CONFIG
+         - K8S_CONTEXTS
+         - STATUS_RESULTS_DIRECTORY
+        """
+        super().execute()
+        details = {step.cluster: step.details for step in self._steps}
+        os.makedirs(self.res_dir, exist_ok=True)
+        with (Path(self.res_dir).joinpath(settings.STATUS_DETAILS_JSON)
+              ).open('w', encoding="utf-8") as file:
+            json.dump(details, file, indent=4)
+        failing = [step.cluster for step in self._steps if step.failing]
+        if failing:
+            self.__logger.info("failing clusters: %s", failing)
+            raise StatusCheckException(f"clusters {', '.join(failing)} failed")
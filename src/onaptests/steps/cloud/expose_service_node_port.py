@@ -4,12 +4,13 @@
 from typing import Any, Dict
 
 import urllib3
-from kubernetes import client, config
+from kubernetes import client
 from kubernetes.client.exceptions import ApiException
 from onapsdk.configuration import settings
 
 from onaptests.steps.base import BaseStep
 from onaptests.utils.exceptions import OnapTestException
+from onaptests.utils.kubernetes import KubernetesHelper
 
 
 class ExposeServiceNodePortStep(BaseStep):
@@ -64,11 +65,7 @@ class ExposeServiceNodePortStep(BaseStep):
 
         """
         super().execute()
-        if settings.IN_CLUSTER:
-            config.load_incluster_config()
-        else:
-            config.load_kube_config(config_file=settings.K8S_CONFIG)
-        self.k8s_client: client.CoreV1Api = client.CoreV1Api()
+        self.k8s_client: client.CoreV1Api = client.CoreV1Api(KubernetesHelper.get_api_client())
         if not self.is_service_node_port_type():
             try:
                 self.k8s_client.patch_namespaced_service(
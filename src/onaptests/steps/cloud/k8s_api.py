@@ -0,0 +1,29 @@
+"""k8s API descriptor module."""
+
+
+class K8sApi():
+    """k8s API of the step created on the first use with the step API client."""
+
+    def __init__(self, api_class):
+        """Init the k8s API descriptor.
+
+        Args:
+            api_class (type): k8s client API class
+        """
+        self.api_class = api_class
+        self.attribute = None
+
+    def __set_name__(self, owner, name):
+        self.attribute = f"_{name}"
+
+    def __get__(self, step, owner=None):
+        if step is None:
+            return self
+        api = step.__dict__.get(self.attribute)
+        if api is None:
+            api = self.api_class(step.api_client)
+            step.__dict__[self.attribute] = api
+        return api
+
+    def __set__(self, step, api):
+        step.__dict__[self.attribute] = api
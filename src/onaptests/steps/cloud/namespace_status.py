@@ -0,0 +1,303 @@
+"""Namespace status check module."""
+import json
+import logging
+from pathlib import Path
+
+from kubernetes import client
+from natural.date import delta
+from onapsdk.configuration import settings
+
+from onaptests.utils.exceptions import StatusCheckException
+from onaptests.utils.kubernetes import KubernetesHelper
+
+from ..base import BaseStep
+from .archive import DirectoryStore, open_store
+from .artifacts import ArtifactsCollector
+from .check_status import (CheckK8sConfigMapsStep, CheckK8sDaemonSetsStep,
+                           CheckK8sDeploymentsStep, CheckK8sIngressesStep,
+                           CheckK8sJobsStep, CheckK8sNodesStep,
+                           CheckK8sPodsStep, CheckK8sPvcsStep,
+                           CheckK8sReplicaSetsStep, CheckK8sResourcesStep,
+                           CheckK8sSecretsStep, CheckK8sServicesStep,
+                           CheckK8sStatefulSetsStep)
+from .rendering import PageRenderer, RenderJob
+from .resources_index import EventsIndex
+from .snapshot import StatusSnapshot
+from .waivers import WaiverMatcher
+
+
+class CheckNamespaceStatusStep(CheckK8sResourcesStep):
+    """Check status of all k8s resources in the selected namespace."""
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, cluster: str = None):
+        """Init CheckNamespaceStatusStep.
+
+        Failure of the check does not stop the checks of the other clusters.
+
+        Args:
+            cluster (str): kubeconfig context of the checked cluster,
+                cluster of the default configuration if not set
+        """
+        super().__init__(namespace=settings.K8S_TESTS_NAMESPACE, resource_type="",
+                         break_on_error=False, cluster=cluster)
+        self.__logger.debug("K8s namespaces status test init started")
+        self._parallel_substeps = True
+
+        self.job_list_step = None
+        self.pod_list_step = None
+        self.service_list_step = None
+        self.deployment_list_step = None
+        self.replicaset_list_step = None
+        self.statefulset_list_step = None
+        self.daemonset_list_step = None
+        self.configmap_list_step = None
+        self.secret_list_step = None
+        self.ingress_list_step = None
+        self.pvc_list_step = None
+        self.node_list_step = None
+        self.artifacts = ArtifactsCollector()
+        self._matcher = WaiverMatcher()
+        self._store = open_store(self.res_dir)
+        self._renderer = PageRenderer(store=self._store)
+        self._snapshot = None
+        if settings.STATUS_INCREMENTAL:
+            self._snapshot = StatusSnapshot(
+                str(Path(self.res_dir).joinpath(settings.STATUS_SNAPSHOT_FILE)), self._store)
+        self.namespaces_to_check_set = self.get_namespaces_to_check(self.api_client)
+        for namespace in self.namespaces_to_check_set:
+            self._init_namespace_steps(namespace)
+        self.pods = []
+        self.services = []
+        self.jobs = []
+        self.deployments = []
+        self.replicasets = []
+        self.statefulsets = []
+        self.daemonsets = []
+        self.pvcs = []
+        self.configmaps = []
+        self.secrets = []
+        self.ingresses = []
+        self.nodes = []
+        self.failing_statefulsets = []
+        self.failing_jobs = []
+        self.failing_deployments = []
+        self.failing_replicasets = []
+        self.failing_daemonsets = []
+        self.failing_pvcs = []
+        self.failing_nodes = []
+        self.details = {}
+
+    @staticmethod
+    def get_namespaces_to_check(api_client: client.ApiClient = None) -> set:
+        """Get names of the namespaces to check.
+
+        Args:
+            api_client (client.ApiClient): API client of the cluster, shared one if not set
+
+        Use settings values:
+         - K8S_TESTS_NAMESPACE
+         - CHECK_ALL_NAMESPACES
+         - EXTRA_NAMESPACE_LIST
+         - EXCLUDE_NAMESPACE_LIST
+        """
+        if settings.CHECK_ALL_NAMESPACES or settings.EXCLUDE_NAMESPACE_LIST:
+            return {namespace.metadata.name for namespace in
+                    KubernetesHelper.list_all(
+                        client.CoreV1Api(
+                            api_client or KubernetesHelper.get_api_client()).list_namespace,
+                        limit=settings.K8S_LIST_PAGE_SIZE or None)} - set(
+                        settings.EXCLUDE_NAMESPACE_LIST)
+        return set([settings.K8S_TESTS_NAMESPACE] + settings.EXTRA_NAMESPACE_LIST)
+
+    def _init_namespace_steps(self, namespace: str):
+        cluster = self.cluster
+        events = EventsIndex(self.core, namespace)
+        job_list_step = CheckK8sJobsStep(namespace, events, cluster=cluster)
+        pod_list_step = CheckK8sPodsStep(namespace, job_list_step, events, self.artifacts,
+                                         cluster=cluster)
+        service_list_step = CheckK8sServicesStep(namespace, pod_list_step, cluster=cluster)
+        deployment_list_step = CheckK8sDeploymentsStep(namespace, pod_list_step, events,
+                                                       cluster=cluster)
+        replicaset_list_step = CheckK8sReplicaSetsStep(namespace, pod_list_step, events,
+                                                       cluster=cluster)
+        statefulset_list_step = CheckK8sStatefulSetsStep(namespace, pod_list_step, events,
+                                                         cluster=cluster)
+        daemonset_list_step = CheckK8sDaemonSetsStep(namespace, pod_list_step, events,
+                                                     cluster=cluster)
+        configmap_list_step = CheckK8sConfigMapsStep(namespace, cluster=cluster)
+        secret_list_step = CheckK8sSecretsStep(namespace, cluster=cluster)
+        ingress_list_step = CheckK8sIngressesStep(namespace, cluster=cluster)
+        pvc_list_step = CheckK8sPvcsStep(namespace, events, cluster=cluster)
+        node_list_step = CheckK8sNodesStep(namespace, cluster=cluster)
+        if namespace == settings.K8S_TESTS_NAMESPACE:
+            self.job_list_step = job_list_step
+            self.pod_list_step = pod_list_step
+            self.service_list_step = service_list_step
+            self.deployment_list_step = deployment_list_step
+            self.replicaset_list_step = replicaset_list_step
+            self.statefulset_list_step = statefulset_list_step
+            self.daemonset_list_step = daemonset_list_step
+            self.configmap_list_step = configmap_list_step
+            self.secret_list_step = secret_list_step
+            self.ingress_list_step = ingress_list_step
+            self.pvc_list_step = pvc_list_step
+            self.node_list_step = node_list_step
+            self.add_step(node_list_step)
+        self.add_step(job_list_step)
+        self.add_step(pod_list_step)
+        self.add_step(service_list_step)
+        self.add_step(deployment_list_step)
+        self.add_step(replicaset_list_step)
+        self.add_step(statefulset_list_step)
+        self.add_step(daemonset_list_step)
+        self.add_step(configmap_list_step)
+        self.add_step(secret_list_step)
+        self.add_step(ingress_list_step)
+        self.add_step(pvc_list_step)
+
+    @property
+    def description(self) -> str:
+        """Step description."""
+        return "Check status of all k8s resources in the selected namespaces."
+
+    @property
+    def snapshot(self) -> StatusSnapshot:
+        """Snapshot of the previous check, None if the check is not incremental."""
+        return self._snapshot
+
+    @property
+    def store(self) -> DirectoryStore:
+        """Store of the artifacts of all the namespaces."""
+        return self._store
+
+    @property
+    def renderer(self) -> PageRenderer:
+        """Renderer of the pages of all the namespaces."""
+        return self._renderer
+
+    @property
+    def substeps_workers(self) -> int:
+        """Number of the namespaces' steps executed at the same time.
+
+        Steps are executed on a thread pool if STATUS_CHECK_WORKERS is greater
+        than 1, a step which needs pods is started once its pods source step
+        is done. Results are kept in steps so reports and details are the same
+        as for the sequential execution.
+        """
+        return settings.STATUS_CHECK_WORKERS
+
+    @property
+    def component(self) -> str:
+        """Component name."""
+        return "ALL"
+
+    @BaseStep.store_state
+    def execute(self):
+        """Check status of all k8s resources in the selected namespaces.
+
+        Use settings values:
+         - K8S_TESTS_NAMESPACE
+         - STATUS_RESULTS_DIRECTORY
+         - STORE_ARTIFACTS
+         - CHECK_POD_VERSIONS
+         - IGNORE_EMPTY_REPLICAS
+         - INCLUDE_ALL_RES_IN_DETAILS
+         - K8S_LIST_PAGE_SIZE
+         - STATUS_METADATA_ONLY
+         - STATUS_RAW_JSON
+         - STATUS_COMPACT_RESOURCES
+         - STATUS_CHECK_WORKERS
+         - STATUS_ARTIFACTS_WORKERS
+         - STATUS_ARTIFACTS_PER_POD
+         - STATUS_ARTIFACTS_MAX_BYTES
+         - STATUS_INCREMENTAL
+         - STATUS_SNAPSHOT_FILE
+         - STATUS_RENDER_HTML
+         - STATUS_RENDER_WORKERS
+         - STATUS_ARCHIVE
+         - STATUS_ARCHIVE_DEDUP
+        """
+        try:
+            super().execute()
+            self.artifacts.wait()
+        except Exception:
+            # collection tasks must be done before the archive is closed
+            self.artifacts.close(cancel=True)
+            self.store.close()
+            raise
+        finally:
+            self.artifacts.close()
+        self.renderer.render()
+
+        self.pods = self.pod_list_step.all_resources
+        self.services = self.service_list_step.all_resources
+        self.jobs = self.job_list_step.all_resources
+        self.deployments = self.deployment_list_step.all_resources
+        self.replicasets = self.replicaset_list_step.all_resources
+        self.statefulsets = self.statefulset_list_step.all_resources
+        self.daemonsets = self.daemonset_list_step.all_resources
+        self.pvcs = self.pvc_list_step.all_resources
+        self.configmaps = self.configmap_list_step.all_resources
+        self.secrets = self.secret_list_step.all_resources
+        self.ingresses = self.ingress_list_step.all_resources
+
+        self.failing_statefulsets = self.statefulset_list_step.failing_resources
+        self.failing_jobs = self.job_list_step.failing_resources
+        self.failing_deployments = self.deployment_list_step.failing_resources
+        self.failing_replicasets = self.replicaset_list_step.failing_resources
+        self.failing_daemonsets = self.daemonset_list_step.failing_resources
+        self.failing_pvcs = self.pvc_list_step.failing_resources
+
+        if self.renderer.enabled:
+            self.renderer.render_job(RenderJob('index.html.j2',
+                                               '{}/index.html'.format(self.res_dir),
+                                               {'ns': self, 'delta': delta}))
+        self.renderer.render_job(RenderJob('raw_output.txt.j2',
+                                           '{}/onap-k8s.log'.format(self.res_dir),
+                                           {'ns': self, 'namespace': self.namespace}))
+        self.store.close()
+        # pages of the snapshot are rendered and stored
+        if self.snapshot is not None:
+            self.snapshot.save()
+
+        details = {"namespace": {
+            "all": list(self.namespaces_to_check_set - set([self.namespace])),
+            "resources": {}
+        }}
+
+        def store_results(result_dict, step):
+            result_dict[step.resource_type] = {
+                'number_failing': len(step.failing_resources),
+                'failing': self.map_by_name(step.failing_resources)
+            }
+            if settings.INCLUDE_ALL_RES_IN_DETAILS:
+                result_dict[step.resource_type]['all'] = self.map_by_name(step.all_resources)
+                result_dict[step.resource_type]['number_all'] = len(step.all_resources)
+
+        for step in self._steps:
+            if step.failing:
+                self.failing = True
+                self.__logger.info("%s failing: %s",
+                                   step.resource_type,
+                                   len(step.failing_resources))
+            if step.is_primary:
+                store_results(details, step)
+            else:
+                ns_details = details["namespace"]["resources"]
+                if step.namespace not in ns_details:
+                    ns_details[step.namespace] = {}
+                ns_details = ns_details[step.namespace]
+                store_results(ns_details, step)
+
+        self.details = details
+        with (Path(self.res_dir).joinpath(settings.STATUS_DETAILS_JSON)
+              ).open('w', encoding="utf-8") as file:
+            json.dump(details, file, indent=4)
+        if self.failing:
+            raise StatusCheckException
+
+    def map_by_name(self, resources):
+        """Get resources' names."""
+        return list(map(lambda resource: resource.name, resources))
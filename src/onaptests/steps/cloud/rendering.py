@@ -0,0 +1,167 @@
+"""Status pages rendering module."""
+import copyreg
+import io
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from jinja2 import Environment, PackageLoader, select_autoescape
+from kubernetes import client
+from onapsdk.configuration import settings
+
+from .archive import DirectoryStore
+
+
+class RenderJob(NamedTuple):
+    """Page to render: template name, page path and template context."""
+
+    template: str
+    path: str
+    context: dict
+
+
+def _reduce_configuration(_):
+    return client.Configuration, ()
+
+
+def dump_context(context: dict) -> bytes:
+    """Pickle the template context to send it to a rendering process.
+
+    k8s models keep the client configuration which is not needed to render
+    them and may not be picklable (token refresh hook of the kubeconfig),
+    it is replaced by the default one.
+    """
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[client.Configuration] = _reduce_configuration
+    pickler.dump(context)
+    return buffer.getvalue()
+
+
+def get_mp_context():
+    """Get the context starting the rendering processes.
+
+    Status check runs threads (artifacts collection, parallel steps) which may
+    hold locks, rendering processes are not forked from it but from a fork
+    server, or spawned on platforms without fork.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class PageRenderer():
+    """Renderer of the status pages.
+
+    Resources parsing only queues the render jobs, pages are rendered all
+    together once the check is done, on a pool of processes if there are
+    several workers.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, enabled: bool = None, workers: int = None,
+                 store: DirectoryStore = None):
+        """Init the renderer.
+
+        Args:
+            enabled (bool): are the HTML pages rendered. Defaults to STATUS_RENDER_HTML
+            workers (int): number of rendering processes, pages are rendered in
+                the current process if lower than 2. Defaults to STATUS_RENDER_WORKERS
+            store (DirectoryStore): store of the pages, pages are written as files if not set
+        """
+        self.enabled = settings.STATUS_RENDER_HTML if enabled is None else enabled
+        self.workers = settings.STATUS_RENDER_WORKERS if workers is None else workers
+        self.store = store
+        self.jobs = []
+        self._lock = threading.Lock()
+        self._templates = {}
+        self._jinja_env = None
+
+    def get_template(self, name: str):
+        """Get the template loaded once for all the pages."""
+        if name not in self._templates:
+            if self._jinja_env is None:
+                self._jinja_env = Environment(
+                    autoescape=select_autoescape(['html']),
+                    loader=PackageLoader('onaptests.templates', 'status'),
+                    auto_reload=False)
+            self._templates[name] = self._jinja_env.get_template(name)
+        return self._templates[name]
+
+    def add(self, template: str, path: str, **context) -> None:
+        """Queue the page rendering, ignored if HTML pages are not rendered.
+
+        Args:
+            template (str): name of the template
+            path (str): path of the page
+            context: template variables, they are not modified once the job is queued
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.jobs.append(RenderJob(template, path, context))
+
+    def render_job(self, job: RenderJob) -> None:
+        """Render the page in the current process."""
+        stream = self.get_template(job.template).stream(**job.context)
+        if self.store is None:
+            stream.dump(job.path)
+            return
+        with self.store.open(job.path) as page:
+            stream.dump(page, encoding="utf-8")
+
+    def render(self) -> None:
+        """Render all the queued pages."""
+        with self._lock:
+            jobs, self.jobs = self.jobs, []
+        if not jobs:
+            return
+        self.__logger.debug("Rendering %s pages", len(jobs))
+        if self.workers < 2 or len(jobs) < 2:
+            for job in jobs:
+                self.render_job(job)
+            return
+        chunksize = max(1, len(jobs) // (self.workers * 4))
+        payloads = [(job.template, job.path, dump_context(job.context)) for job in jobs]
+        with ProcessPoolExecutor(max_workers=self.workers,
+                                 mp_context=get_mp_context()) as executor:
+            if self.store is None or self.store.in_directory:
+                for _ in executor.map(_render_job, payloads, chunksize=chunksize):
+                    pass
+                return
+            # pages are sent back to be written through the store
+            for job, page in zip(jobs, executor.map(_render_page, payloads,
+                                                    chunksize=chunksize)):
+                self.store.write(job.path, page)
+
+
+_WORKER_RENDERER = None
+
+
+def _worker_renderer() -> PageRenderer:
+    """Get the renderer of the worker process."""
+    global _WORKER_RENDERER  # pylint: disable=global-statement
+    if _WORKER_RENDERER is None:
+        _WORKER_RENDERER = PageRenderer(enabled=True, workers=1)
+    return _WORKER_RENDERER
+
+
+def _load_job(payload: tuple) -> RenderJob:
+    template, path, context = payload
+    return RenderJob(template, path, pickle.loads(context))
+
+
+def _render_job(payload: tuple) -> None:
+    """Render the page file in the worker process."""
+    _worker_renderer().render_job(_load_job(payload))
+
+
+def _render_page(payload: tuple) -> str:
+    """Render the page in the worker process."""
+    job = _load_job(payload)
+    return _worker_renderer().get_template(job.template).render(**job.context)
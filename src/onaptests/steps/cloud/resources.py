@@ -1,44 +1,185 @@
 """Resources module."""
 
 
+class CompactK8s():
+    """Compact copy of k8s object with the fields used by the status check only.
+
+    Subclasses map the copied fields to the compact class of the nested
+    k8s object, None if the value is copied as is. Fields the k8s object
+    does not have are not set, so reading them raises AttributeError as
+    on the k8s object.
+    """
+
+    __slots__ = ()
+    _fields = {}
+
+    @classmethod
+    def copy(cls, k8s):
+        """Copy the fields of k8s object.
+
+        Args:
+            k8s (object): k8s object, client model or raw object
+
+        Returns:
+            CompactK8s: copy of the k8s object
+        """
+        compact = cls()
+        for name, compact_class in cls._fields.items():
+            try:
+                value = getattr(k8s, name)
+            except AttributeError:
+                continue
+            if compact_class is not None:
+                if isinstance(value, list):
+                    value = [compact_class.copy(item) for item in value]
+                elif hasattr(value, "attribute_map"):
+                    value = compact_class.copy(value)
+            setattr(compact, name, value)
+        return compact
+
+
+class CompactOwnerReference(CompactK8s):
+    """Compact copy of k8s owner reference."""
+
+    _fields = {"kind": None, "name": None}
+    __slots__ = tuple(_fields)
+
+
+class CompactLabelSelector(CompactK8s):
+    """Compact copy of k8s label selector."""
+
+    _fields = {"match_labels": None}
+    __slots__ = tuple(_fields)
+
+
+class CompactServicePort(CompactK8s):
+    """Compact copy of k8s service port."""
+
+    _fields = {"name": None, "port": None, "node_port": None, "target_port": None,
+               "protocol": None}
+    __slots__ = tuple(_fields)
+
+
+class CompactVolume(CompactK8s):
+    """Compact copy of k8s volume, volumes details are kept in Pod."""
+
+    _fields = {"name": None}
+    __slots__ = tuple(_fields)
+
+
+class CompactMetadata(CompactK8s):
+    """Compact copy of k8s object metadata."""
+
+    _fields = {"name": None, "namespace": None, "uid": None, "labels": None,
+               "annotations": None, "resource_version": None, "creation_timestamp": None,
+               "owner_references": CompactOwnerReference}
+    __slots__ = tuple(_fields)
+
+
+class CompactSpec(CompactK8s):
+    """Compact copy of k8s object spec."""
+
+    _fields = {"type": None, "cluster_ip": None, "selector": CompactLabelSelector,
+               "replicas": None, "completions": None, "storage_class_name": None,
+               "volume_name": None, "volumes": CompactVolume, "ports": CompactServicePort}
+    __slots__ = tuple(_fields)
+
+
+class CompactStatus(CompactK8s):
+    """Compact copy of k8s object status."""
+
+    _fields = {"phase": None, "reason": None, "access_modes": None, "capacity": None,
+               "start_time": None, "completion_time": None, "succeeded": None,
+               "replicas": None, "ready_replicas": None, "available_replicas": None,
+               "updated_replicas": None, "unavailable_replicas": None,
+               "current_number_scheduled": None, "desired_number_scheduled": None,
+               "number_available": None, "number_ready": None,
+               "updated_number_scheduled": None}
+    __slots__ = tuple(_fields)
+
+
+class CompactK8sObject(CompactK8s):
+    """Compact copy of k8s object."""
+
+    _fields = {"metadata": CompactMetadata, "spec": CompactSpec, "status": CompactStatus}
+    __slots__ = tuple(_fields)
+
+
+class CompactEvent(CompactK8s):
+    """Compact copy of k8s event."""
+
+    _fields = {"type": None, "count": None, "reason": None, "message": None}
+    __slots__ = tuple(_fields)
+
+
 class K8sResource():
     """K8sResource class."""
 
+    __slots__ = ("k8s", "name", "namespace", "uid", "events", "labels", "annotations")
+
     def __init__(self, k8s=None):
         """Init the k8s resource."""
-        self.k8s = k8s
+        self.k8s = None
         self.name = ""
+        self.namespace = None
+        self.uid = None
         self.events = []
-        self.labels = None
-        self.annotations = None
-        if self.k8s:
-            self.name = self.k8s.metadata.name
-            self.labels = self.k8s.metadata.labels
-            self.annotations = self.k8s.metadata.annotations
-            self.specific_k8s_init()
-        if not self.labels:
-            self.labels = {}
-        if not self.annotations:
-            self.annotations = {}
+        self.labels = {}
+        self.annotations = {}
+        if k8s:
+            self.update(k8s)
+
+    def update(self, k8s):
+        """Update the k8s resource with the new state of k8s object."""
+        self.k8s = k8s
+        self.name = self.k8s.metadata.name
+        self.namespace = self.k8s.metadata.namespace
+        self.uid = self.k8s.metadata.uid
+        self.labels = self.k8s.metadata.labels or {}
+        self.annotations = self.k8s.metadata.annotations or {}
+        self.specific_k8s_init()
 
     def specific_k8s_init(self):
         """Do the specific part for k8s resource when k8s object is present."""
 
+    def compact(self):
+        """Replace k8s object and events by their compact copies.
+
+        Only the fields used by the status check and its templates are kept.
+        """
+        if not isinstance(self.k8s, CompactK8s):
+            self.k8s = CompactK8sObject.copy(self.k8s)
+        self.events = [event if isinstance(event, CompactK8s) else CompactEvent.copy(event)
+                       for event in self.events]
+
     def __repr__(self):
         return self.name
 
     def __str__(self):
         return self.name
 
+    @property
+    def identity(self) -> tuple:
+        """Stable identity of the resource, its namespace and uid.
+
+        Name is used instead of the uid if the uid is not known.
+        """
+        return (self.namespace, self.uid or self.name)
+
     def __eq__(self, other):
         if isinstance(other, K8sResource):
-            return self.name == other.name
+            return self.identity == other.identity
         return False
 
+    def __hash__(self):
+        return hash(self.identity)
+
 
 class K8sPodParentResource(K8sResource):
     """K8sPodParentResource class."""
 
+    __slots__ = ("pods", "failed_pods")
+
     def __init__(self, k8s=None):
         """Init the k8s pod parent resource."""
         self.pods = []
@@ -49,6 +190,9 @@ class K8sPodParentResource(K8sResource):
 class Pod(K8sResource):
     """Pod class."""
 
+    __slots__ = ("containers", "init_containers", "running_containers", "runned_init_containers",
+                 "volumes", "restart_count", "init_restart_count", "init_done")
+
     def __init__(self, k8s=None):
         """Init the pod."""
         self.containers = []
@@ -63,6 +207,7 @@ class Pod(K8sResource):
 
     def specific_k8s_init(self):
         """Specific k8s init."""
+        self.volumes = {}
         self.set_volumes(self.k8s.spec.volumes)
 
     def set_volumes(self, volumes):
@@ -93,6 +238,8 @@ class Pod(K8sResource):
 class Container():
     """Container class."""
 
+    __slots__ = ("name", "status", "ready", "restart_count", "image")
+
     def __init__(self, name=""):
         """Init the container."""
         self.name = name
@@ -120,6 +267,8 @@ class Container():
 class Service(K8sPodParentResource):
     """Service class."""
 
+    __slots__ = ("type",)
+
     def __init__(self, k8s=None):
         """Init the service."""
         self.type = ""
@@ -133,38 +282,58 @@ class Service(K8sPodParentResource):
 class Job(K8sPodParentResource):
     """Job class."""
 
+    __slots__ = ()
+
 
 class Deployment(K8sPodParentResource):
     """Deployment class."""
 
+    __slots__ = ()
+
 
 class ReplicaSet(K8sPodParentResource):
     """ReplicaSet class."""
 
+    __slots__ = ()
+
 
 class StatefulSet(K8sPodParentResource):
     """StatefulSet class."""
 
+    __slots__ = ()
+
 
 class DaemonSet(K8sPodParentResource):
     """DaemonSet class."""
 
+    __slots__ = ()
+
 
 class Pvc(K8sResource):
     """Pvc class."""
 
+    __slots__ = ()
+
 
 class ConfigMap(K8sResource):
     """ConfigMap class."""
 
+    __slots__ = ()
+
 
 class Secret(K8sResource):
     """Secret class."""
 
+    __slots__ = ()
+
 
 class Ingress(K8sResource):
     """Ingress class."""
 
+    __slots__ = ()
+
 
 class Node(K8sResource):
     """Node class."""
+
+    __slots__ = ()
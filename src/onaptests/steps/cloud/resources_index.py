@@ -0,0 +1,113 @@
+"""Resources index module."""
+import threading
+from collections import defaultdict
+
+from onapsdk.configuration import settings
+
+from onaptests.utils.kubernetes import KubernetesHelper
+
+from .resources import CompactEvent
+
+
+class EventsIndex():
+    """Events of the namespace indexed by the involved object.
+
+    All events of the namespace are loaded with one paginated list call
+    on the first lookup and then served from memory.
+    """
+
+    def __init__(self, core, namespace: str):
+        """Init the events index.
+
+        Args:
+            core (CoreV1Api): k8s core api used to list events
+            namespace (str): namespace of the events
+        """
+        self.core = core
+        self.namespace = namespace
+        self._by_object = None
+        self._by_name = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """Load all events of the namespace."""
+        by_object = defaultdict(list)
+        by_name = defaultdict(list)
+        if settings.STATUS_RAW_JSON:
+            events = KubernetesHelper.list_all_raw(self.core.list_namespaced_event,
+                                                   self.namespace, model="CoreV1Event",
+                                                   limit=settings.K8S_LIST_PAGE_SIZE or None)
+        else:
+            events = KubernetesHelper.list_all(self.core.list_namespaced_event,
+                                               self.namespace,
+                                               limit=settings.K8S_LIST_PAGE_SIZE or None)
+        for event in events:
+            involved_object = event.involved_object
+            if settings.STATUS_COMPACT_RESOURCES:
+                event = CompactEvent.copy(event)
+            by_object[(involved_object.kind, involved_object.name)].append(event)
+            by_name[involved_object.name].append(event)
+        self._by_object = by_object
+        self._by_name = by_name
+
+    def get(self, name: str, kind: str = None) -> list:
+        """Get events of the object.
+
+        Args:
+            name (str): name of the involved object
+            kind (str): kind of the involved object, any kind if None
+
+        Returns:
+            list: events of the object
+        """
+        with self._lock:
+            if self._by_name is None:
+                self._load()
+        if kind is None:
+            return list(self._by_name.get(name, []))
+        return list(self._by_object.get((kind, name), []))
+
+
+class PodsIndex():
+    """Pods of the namespace indexed by labels.
+
+    Each label key/value pair is mapped to the set of pods having it, so
+    `match_labels` selectors are resolved locally by set intersection.
+    """
+
+    def __init__(self):
+        """Init the pods index."""
+        self._names = []
+        self._by_label = defaultdict(set)
+
+    def add(self, k8s):
+        """Add the pod to the index.
+
+        Args:
+            k8s (V1Pod): k8s pod
+        """
+        position = len(self._names)
+        self._names.append(k8s.metadata.name)
+        for label in (k8s.metadata.labels or {}).items():
+            self._by_label[label].add(position)
+
+    def find(self, selector: dict) -> list:
+        """Find pods matching the selector.
+
+        Args:
+            selector (dict): labels which have to be set on the pod
+
+        Returns:
+            list: names of matching pods, in the order they were added
+        """
+        if not selector:
+            return []
+        matching = []
+        for label in selector.items():
+            positions = self._by_label.get(label)
+            if not positions:
+                return []
+            matching.append(positions)
+        matching.sort(key=len)
+        return [self._names[position] for position in
+                sorted(matching[0].intersection(*matching[1:]))]
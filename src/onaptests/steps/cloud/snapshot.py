@@ -0,0 +1,104 @@
+"""Status snapshot module."""
+import json
+import logging
+import os
+import threading
+
+from .archive import DirectoryStore
+
+
+class StatusSnapshot():
+    """Snapshot of the resources checked by the previous status check.
+
+    For each resource, identified by namespace, kind and name, the snapshot
+    keeps a fingerprint of the resource state (its resourceVersion and the ones
+    of its pods), the paths of the artifacts generated for it and the state of
+    its containers. It allows to skip the artifacts of resources which did not
+    change since the previous check.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, path: str, store: DirectoryStore = None):
+        """Init the snapshot and load the previous one if it exists.
+
+        Args:
+            path (str): path of the snapshot file
+            store (DirectoryStore): store of the artifacts, files of the
+                results directory if not set
+        """
+        self.path = path
+        self.store = store or DirectoryStore(os.path.dirname(path))
+        self._previous = {}
+        self._current = {}
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as snapshot_file:
+                    self._previous = json.load(snapshot_file)
+            except (OSError, ValueError) as exc:
+                self.__logger.warning("Status snapshot %s can't be loaded: %s", self.path, exc)
+
+    @staticmethod
+    def _key(namespace: str, kind: str, name: str) -> str:
+        return f"{namespace}/{kind}/{name}"
+
+    def get(self, namespace: str, kind: str, name: str) -> dict:
+        """Get the resource entry of the previous snapshot.
+
+        Returns:
+            dict: previous entry of the resource, empty if the resource is not known
+        """
+        return self._previous.get(self._key(namespace, kind, name), {})
+
+    def artifacts_exist(self, entry: dict) -> bool:
+        """Check if all artifacts of the entry are still present in the store.
+
+        Artifacts are kept by the store if they are all present, so they are
+        not collected again.
+        """
+        artifacts = entry.get("artifacts", [])
+        if not all(self.store.exists(artifact) for artifact in artifacts):
+            return False
+        for artifact in artifacts:
+            self.store.keep(artifact)
+        return True
+
+    def is_up_to_date(self, namespace: str, kind: str, name: str, fingerprint: str) -> bool:
+        """Check if the resource did not change since the previous snapshot.
+
+        Returns:
+            bool: True if fingerprint is the same and all artifacts are present
+        """
+        entry = self.get(namespace, kind, name)
+        return (entry.get("fingerprint") == fingerprint and
+                bool(entry.get("artifacts")) and self.artifacts_exist(entry))
+
+    def set(self, namespace: str, kind: str, name: str, **entry) -> None:
+        """Update the resource entry of the current snapshot."""
+        with self._lock:
+            self._current.setdefault(self._key(namespace, kind, name), {}).update(entry)
+
+    def get_container(self, namespace: str, pod_name: str, container_name: str) -> dict:
+        """Get the container entry of the previous snapshot.
+
+        Returns:
+            dict: previous entry of the container, empty if the container is not known
+        """
+        return self.get(namespace, "Pod", pod_name).get("containers", {}).get(container_name, {})
+
+    def set_container(self, namespace: str, pod_name: str, container_name: str,
+                      **entry) -> None:
+        """Set the container entry of the current snapshot."""
+        with self._lock:
+            pod_entry = self._current.setdefault(self._key(namespace, "Pod", pod_name), {})
+            pod_entry.setdefault("containers", {})[container_name] = entry
+
+    def save(self) -> None:
+        """Store the current snapshot.
+
+        Resources not seen during the current check are dropped.
+        """
+        with self._lock:
+            with open(self.path, "w", encoding="utf-8") as snapshot_file:
+                json.dump(self._current, snapshot_file)
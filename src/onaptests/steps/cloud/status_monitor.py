@@ -0,0 +1,359 @@
+"""Continuous status monitor module."""
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+from kubernetes import client, watch
+from kubernetes.client.rest import ApiException
+from onapsdk.configuration import settings
+from xtesting.core import testcase
+
+from onaptests.utils.exceptions import StatusCheckException
+from onaptests.utils.kubernetes import KubernetesHelper
+
+from ..base import BaseStep
+from .check_status import (CheckK8sDaemonSetsStep, CheckK8sDeploymentsStep,
+                           CheckK8sJobsStep, CheckK8sNodesStep,
+                           CheckK8sPvcsStep, CheckK8sReplicaSetsStep,
+                           CheckK8sResourcesStep, CheckK8sStatefulSetsStep)
+from .namespace_status import CheckNamespaceStatusStep
+from .resources import (ConfigMap, DaemonSet, Deployment, Ingress, Job, Node,
+                        Pod, Pvc, ReplicaSet, Secret, Service, StatefulSet)
+from .waivers import WaiverMatcher
+
+HTTP_GONE = 410
+
+# resource type: (k8s api, list method, resource class, step class evaluating the failure)
+# in the order of status-details.json
+WATCHED_RESOURCES = {
+    "node": (client.CoreV1Api, "list_node", Node, CheckK8sNodesStep),
+    "job": (client.BatchV1Api, "list_namespaced_job", Job, CheckK8sJobsStep),
+    "pod": (client.CoreV1Api, "list_namespaced_pod", Pod, CheckK8sResourcesStep),
+    "service": (client.CoreV1Api, "list_namespaced_service", Service, CheckK8sResourcesStep),
+    "deployment": (client.AppsV1Api, "list_namespaced_deployment", Deployment,
+                   CheckK8sDeploymentsStep),
+    "replicaset": (client.AppsV1Api, "list_namespaced_replica_set", ReplicaSet,
+                   CheckK8sReplicaSetsStep),
+    "statefulset": (client.AppsV1Api, "list_namespaced_stateful_set", StatefulSet,
+                    CheckK8sStatefulSetsStep),
+    "daemonset": (client.AppsV1Api, "list_namespaced_daemon_set", DaemonSet,
+                  CheckK8sDaemonSetsStep),
+    "configmap": (client.CoreV1Api, "list_namespaced_config_map", ConfigMap,
+                  CheckK8sResourcesStep),
+    "secret": (client.CoreV1Api, "list_namespaced_secret", Secret, CheckK8sResourcesStep),
+    "ingress": (client.NetworkingV1Api, "list_namespaced_ingress", Ingress,
+                CheckK8sResourcesStep),
+    "pvc": (client.CoreV1Api, "list_namespaced_persistent_volume_claim", Pvc,
+            CheckK8sPvcsStep),
+}
+# resources which are waived by WAIVER_LIST
+WAIVED_RESOURCES = ("job", "pod")
+# resources which are ignored with no replicas if IGNORE_EMPTY_REPLICAS is set
+REPLICATED_RESOURCES = ("deployment", "replicaset", "statefulset")
+
+
+class StatusMonitor():
+    """Continuous monitor of the k8s resources status.
+
+    All resources are listed once and then followed with k8s watch streams,
+    resources objects are updated in place and the failure state is evaluated
+    again only for the resources which changed. Status details, in the format
+    of the status check, can be taken at any time.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, namespaces: set = None):
+        """Init the monitor.
+
+        Args:
+            namespaces (set): namespaces to monitor. Defaults to the namespaces
+                checked by the status check
+        """
+        self.namespace = settings.K8S_TESTS_NAMESPACE
+        self.namespaces = namespaces
+        if self.namespaces is None:
+            self.namespaces = CheckNamespaceStatusStep.get_namespaces_to_check()
+        self.matcher = WaiverMatcher()
+        self.resources = {}
+        self.failing = {}
+        self.resource_versions = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watchers = {}
+        self._threads = []
+        for namespace in sorted(self.namespaces):
+            for resource_type in WATCHED_RESOURCES:
+                if resource_type == "node" and namespace != self.namespace:
+                    continue
+                self.resources[(namespace, resource_type)] = {}
+                self.failing[(namespace, resource_type)] = set()
+
+    def _list_method(self, key):
+        namespace, resource_type = key
+        api, method, _, _ = WATCHED_RESOURCES[resource_type]
+        list_method = getattr(api(KubernetesHelper.get_api_client()), method)
+        if resource_type == "node":
+            return list_method, ()
+        return list_method, (namespace,)
+
+    def _list(self, key) -> None:
+        """List all resources and replace the known ones."""
+        list_method, args = self._list_method(key)
+        items = []
+        _continue = None
+        while True:
+            result = list_method(*args, limit=settings.K8S_LIST_PAGE_SIZE or None,
+                                 _continue=_continue)
+            items.extend(result.items)
+            _continue = result.metadata._continue  # pylint: disable=protected-access
+            if not _continue:
+                break
+        with self._lock:
+            self.resources[key] = {}
+            self.failing[key] = set()
+            for k8s in items:
+                self._update(key, k8s)
+            self.resource_versions[key] = result.metadata.resource_version
+
+    def _watch(self, key) -> None:
+        """Follow the watch stream of resources and relist them if it is expired."""
+        list_method, args = self._list_method(key)
+        while not self._stop.is_set():
+            watcher = watch.Watch()
+            with self._lock:
+                self._watchers[key] = watcher
+            try:
+                for event in watcher.stream(
+                        list_method, *args,
+                        resource_version=self.resource_versions[key],
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=settings.STATUS_MONITOR_WATCH_TIMEOUT):
+                    self._on_event(key, event)
+                    if self._stop.is_set():
+                        break
+                if watcher.resource_version:
+                    self.resource_versions[key] = watcher.resource_version
+            except ApiException as exc:
+                if self._stop.is_set():
+                    break
+                if exc.status != HTTP_GONE:
+                    self._watch_failed(key, exc)
+                self._relist(key)
+            except Exception as exc:  # pylint: disable=broad-except
+                # transport errors (urllib3 ProtocolError, ReadTimeoutError...)
+                # are handled as the failed watch, resources are listed again
+                if self._stop.is_set():
+                    break
+                self._watch_failed(key, exc)
+                self._relist(key)
+
+    def _watch_failed(self, key, exc: Exception) -> None:
+        """Log the failed watch and back off before listing again."""
+        self.__logger.warning("Watch of %s %ss failed: %s", key[0], key[1], exc)
+        self._stop.wait(1)
+
+    def _relist(self, key) -> None:
+        """List again the resources whose watch stream failed."""
+        while not self._stop.is_set():
+            self.__logger.debug("Listing again %s %ss", key[0], key[1])
+            try:
+                self._list(key)
+                return
+            except Exception as exc:  # pylint: disable=broad-except
+                self.__logger.error("List of %s %ss failed: %s", key[0], key[1], exc)
+                self._stop.wait(1)
+
+    def _on_event(self, key, event) -> None:
+        """Apply the watch event on the known resources."""
+        if event["type"] in ("ADDED", "MODIFIED"):
+            with self._lock:
+                self._update(key, event["object"])
+        elif event["type"] == "DELETED":
+            with self._lock:
+                self._delete(key, event["object"].metadata.name)
+
+    def _update(self, key, k8s) -> None:
+        """Update the resource in place and evaluate its failure state."""
+        resource_type = key[1]
+        _, _, res_class, _ = WATCHED_RESOURCES[resource_type]
+        if (resource_type in REPLICATED_RESOURCES and settings.IGNORE_EMPTY_REPLICAS
+                and k8s.spec.replicas == 0):
+            self._delete(key, k8s.metadata.name)
+            return
+        if (resource_type in WAIVED_RESOURCES and
+                self.matcher.is_waived(k8s.metadata.name)):
+            self._delete(key, k8s.metadata.name)
+            return
+        resource = self.resources[key].get(k8s.metadata.name)
+        if resource is None:
+            resource = res_class(k8s=k8s)
+            self.resources[key][resource.name] = resource
+        else:
+            resource.update(k8s)
+        self._evaluate(key, resource)
+
+    def _delete(self, key, name: str) -> None:
+        """Forget the deleted resource."""
+        resource = self.resources[key].pop(name, None)
+        self.failing[key].discard(name)
+        if resource is not None and key[1] == "job":
+            self._evaluate_cron_job(key, CheckK8sJobsStep.get_cron_job_name(resource.k8s))
+
+    def _evaluate(self, key, resource) -> None:
+        """Evaluate the failure state of the changed resource."""
+        _, _, _, step_class = WATCHED_RESOURCES[key[1]]
+        if key[1] == "job":
+            cron_job = step_class.get_cron_job_name(resource.k8s)
+            if cron_job:
+                self._evaluate_cron_job(key, cron_job)
+                return
+        if (step_class.is_failing(resource.k8s) and
+                not self.matcher.has_excluded_label(resource.labels)):
+            self.failing[key].add(resource.name)
+        else:
+            self.failing[key].discard(resource.name)
+
+    def _evaluate_cron_job(self, key, cron_job: str) -> None:
+        """Evaluate the failure state of the cron job, only its last job is taken."""
+        if not cron_job:
+            return
+        jobs = [job for job in self.resources[key].values()
+                if CheckK8sJobsStep.get_cron_job_name(job.k8s) == cron_job]
+        self.failing[key].difference_update(job.name for job in jobs)
+        if jobs:
+            last_job = CheckK8sJobsStep.get_last_job(jobs)
+            if (CheckK8sJobsStep.is_failing(last_job.k8s) and
+                    not self.matcher.has_excluded_label(last_job.labels)):
+                self.failing[key].add(last_job.name)
+
+    def start(self) -> None:
+        """List all resources and start to watch them."""
+        self._stop.clear()
+        for key in self.resources:
+            self._list(key)
+        # each watch keeps a connection of the pool
+        KubernetesHelper.add_watch_connections(len(self.resources))
+        for key in self.resources:
+            thread = threading.Thread(target=self._watch, args=(key,), daemon=True,
+                                      name=f"watch-{key[0]}-{key[1]}")
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """Stop to watch resources."""
+        self._stop.set()
+        with self._lock:
+            for watcher in self._watchers.values():
+                watcher.stop()
+        for thread in self._threads:
+            thread.join(timeout=settings.STATUS_MONITOR_WATCH_TIMEOUT)
+        KubernetesHelper.add_watch_connections(-len(self._threads))
+        self._threads = []
+
+    @property
+    def is_failing(self) -> bool:
+        """Is any monitored resource in error."""
+        with self._lock:
+            return any(self.failing.values())
+
+    def details(self) -> dict:
+        """Get the status details in the format of the status check."""
+        with self._lock:
+            details = {"namespace": {
+                "all": list(self.namespaces - set([self.namespace])),
+                "resources": {}
+            }}
+            for (namespace, resource_type), resources in self.resources.items():
+                if namespace == self.namespace:
+                    result_dict = details
+                else:
+                    result_dict = details["namespace"]["resources"].setdefault(namespace, {})
+                failing = sorted(self.failing[(namespace, resource_type)])
+                result_dict[resource_type] = {
+                    'number_failing': len(failing),
+                    'failing': failing
+                }
+                if settings.INCLUDE_ALL_RES_IN_DETAILS:
+                    result_dict[resource_type]['all'] = sorted(resources)
+                    result_dict[resource_type]['number_all'] = len(resources)
+        return details
+
+    def dump_details(self, path: str) -> None:
+        """Store the status details in the file."""
+        with Path(path).open('w', encoding="utf-8") as file:
+            json.dump(self.details(), file, indent=4)
+
+    def run(self, duration: int, interval: int, path: str) -> None:
+        """Monitor the resources and store the status details on interval.
+
+        Args:
+            duration (int): monitoring duration in seconds
+            interval (int): time between the stores of status details in seconds
+            path (str): path of the status details file
+        """
+        end = time.monotonic() + duration
+        self.start()
+        try:
+            while True:
+                self.dump_details(path)
+                remaining = end - time.monotonic()
+                if remaining <= 0 or self._stop.wait(min(interval, remaining)):
+                    break
+            self.dump_details(path)
+        finally:
+            self.stop()
+
+
+class MonitorNamespaceStatusStep(BaseStep):
+    """Monitor status of all k8s resources in the selected namespaces."""
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self):
+        """Init MonitorNamespaceStatusStep."""
+        super().__init__(cleanup=BaseStep.HAS_NO_CLEANUP)
+        if settings.STATUS_RESULTS_DIRECTORY:
+            self.res_dir = f"{settings.STATUS_RESULTS_DIRECTORY}"
+        else:
+            self.res_dir = f"{testcase.TestCase.dir_results}/kubernetes-status"
+        self.monitor = None
+
+    @property
+    def description(self) -> str:
+        """Step description."""
+        return "Monitor status of all k8s resources in the selected namespaces."
+
+    @property
+    def component(self) -> str:
+        """Component name."""
+        return "ALL"
+
+    @BaseStep.store_state
+    def execute(self):
+        """Monitor status of all k8s resources in the selected namespaces.
+
+        Status details are stored on interval and the step fails if resources
+        are in error at the end of monitoring.
+
+        Use settings values:
+         - K8S_TESTS_NAMESPACE
+         - STATUS_RESULTS_DIRECTORY
+         - STATUS_DETAILS_JSON
+         - IGNORE_EMPTY_REPLICAS
+         - INCLUDE_ALL_RES_IN_DETAILS
+         - K8S_LIST_PAGE_SIZE
+         - STATUS_MONITOR_DURATION
+         - STATUS_MONITOR_INTERVAL
+         - STATUS_MONITOR_WATCH_TIMEOUT
+        """
+        super().execute()
+        Path(self.res_dir).mkdir(parents=True, exist_ok=True)
+        self.monitor = StatusMonitor()
+        self.monitor.run(settings.STATUS_MONITOR_DURATION,
+                         settings.STATUS_MONITOR_INTERVAL,
+                         str(Path(self.res_dir).joinpath(settings.STATUS_DETAILS_JSON)))
+        if self.monitor.is_failing:
+            raise StatusCheckException("k8s resources are in error")
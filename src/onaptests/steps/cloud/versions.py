@@ -0,0 +1,168 @@
+"""Container versions inventory module."""
+import logging
+import re
+
+from onapsdk.configuration import settings
+
+IMAGE_PATTERN = re.compile("^(?P<source>[^/]*)/*(?P<container>[^:]*):*(?P<version>.*)$")
+LIBRARY_PATTERN = re.compile("^library/(?P<real_container>[^:]*)$")
+
+
+class ImageInventory():
+    """Inventory of the container images versions.
+
+    Images are parsed once whatever the number of containers using them,
+    versions are aggregated by container name with ordered sets of
+    components and repositories.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    def __init__(self, repositories: list = None, nicknames: dict = None,
+                 generic_names: dict = None):
+        """Init the inventory.
+
+        Args:
+            repositories (list): known docker repositories. Defaults to DOCKER_REPOSITORIES
+            nicknames (dict): names of the repositories.
+                Defaults to DOCKER_REPOSITORIES_NICKNAMES
+            generic_names (dict): common components mapped to their image names.
+                Defaults to GENERIC_NAMES
+        """
+        if repositories is None:
+            repositories = settings.DOCKER_REPOSITORIES
+        if nicknames is None:
+            nicknames = settings.DOCKER_REPOSITORIES_NICKNAMES
+        if generic_names is None:
+            generic_names = settings.GENERIC_NAMES
+        self.repositories = set(repositories)
+        self.nicknames = nicknames
+        self.generic_names = {}
+        for common_component, names in generic_names.items():
+            for name in names:
+                # first common component wins as in the ordered search
+                self.generic_names.setdefault(name, common_component)
+        self.pod_versions = []
+        self._versions = {}
+        self._images = {}
+
+    @classmethod
+    def from_containers(cls, containers, **kwargs) -> "ImageInventory":
+        """Build the inventory of all containers at once.
+
+        Args:
+            containers (Iterable): tuples of component, container name and image
+            kwargs: arguments of the inventory
+
+        Returns:
+            ImageInventory: inventory of the containers
+        """
+        inventory = cls(**kwargs)
+        for component, container_name, image in containers:
+            inventory.add(component, container_name, image)
+        return inventory
+
+    @classmethod
+    def from_pods(cls, pods, **kwargs) -> "ImageInventory":
+        """Build the inventory of all containers of k8s pods.
+
+        Args:
+            pods (Iterable): k8s pods
+            kwargs: arguments of the inventory
+
+        Returns:
+            ImageInventory: inventory of the pods
+        """
+        inventory = cls(**kwargs)
+        for k8s in pods:
+            inventory.add_pod(k8s)
+        return inventory
+
+    @classmethod
+    def get_component(cls, k8s) -> str:
+        """Get the component of the pod from its 'app' labels, its name if there is none."""
+        labels = k8s.metadata.labels or {}
+        component = labels.get('app', labels.get('app.kubernetes.io/name'))
+        if component is None:
+            cls.__logger.error("pod %s has no 'app' or 'app.kubernetes.io/name' "
+                               "in metadata: %s", k8s.metadata.name, k8s.metadata.labels)
+            return k8s.metadata.name
+        return component
+
+    def add_pod(self, k8s) -> None:
+        """Add containers of the k8s pod."""
+        component = self.get_component(k8s)
+        for container in k8s.spec.containers:
+            self.add(component, container.name, container.image)
+
+    def parse_image(self, image: str) -> tuple:
+        """Parse the image.
+
+        Returns:
+            tuple: container name, version and repository nickname of the image
+        """
+        try:
+            return self._images[image]
+        except KeyError:
+            pass
+        search = IMAGE_PATTERN.search(image)
+        name = "{}/{}".format(search.group('source'), search.group('container'))
+        version = search.group('version')
+        if name[-1] == '/':
+            name = name[0:-1]
+        source = "default"
+        if search.group('source') in self.repositories:
+            source = search.group('source')
+            name = search.group('container')
+        container_search = LIBRARY_PATTERN.search(name)
+        if container_search:
+            name = container_search.group('real_container')
+        common_component = self.generic_names.get(name)
+        if common_component is not None:
+            version = "{}:{}".format(name, version)
+            name = common_component
+        parsed = (name, version, self.nicknames[source])
+        self._images[image] = parsed
+        return parsed
+
+    def add(self, component: str, container_name: str, image: str) -> None:
+        """Add the container.
+
+        Args:
+            component (str): component of the container pod
+            container_name (str): name of the container
+            image (str): image of the container
+        """
+        pod_container_version = image.rsplit(":", 1)
+        pod_container_tag = "latest"
+        if len(pod_container_version) > 1:
+            pod_container_tag = pod_container_version[1]
+        self.pod_versions.append({
+            'container': container_name,
+            'component': component,
+            'image': pod_container_version[0],
+            'version': pod_container_tag
+        })
+        name, version, repository = self.parse_image(image)
+        version_details = self._versions.setdefault(name, {}).setdefault(
+            version, ({}, {}))
+        # dicts are used as ordered sets of repositories and components
+        version_details[0][repository] = None
+        version_details[1][component] = None
+
+    @property
+    def containers(self) -> dict:
+        """Versions of containers, data of container_versions.html.j2 template."""
+        containers = {}
+        for name, versions in self._versions.items():
+            containers[name] = {
+                'versions': {
+                    version: {
+                        'repositories': list(repositories),
+                        'components': list(components)
+                    } for version, (repositories, components) in versions.items()
+                },
+                'number_components': sum(len(components)
+                                         for _, components in versions.values())
+            }
+        return containers
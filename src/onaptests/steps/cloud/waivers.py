@@ -0,0 +1,54 @@
+"""Waivers module."""
+import re
+from collections import defaultdict
+
+from onapsdk.configuration import settings
+
+
+class WaiverMatcher():
+    """Matcher of the resources excluded from the status check.
+
+    WAIVER_LIST patterns are compiled into a single regular expression and
+    EXCLUDED_LABELS are indexed by all substrings of their keys, so the
+    decisions do not scan the whole lists for each resource.
+    """
+
+    def __init__(self, waivers: list = None, excluded_labels: dict = None):
+        """Init the matcher.
+
+        Args:
+            waivers (list): patterns of waived names. Defaults to WAIVER_LIST
+            excluded_labels (dict): excluded labels. Defaults to EXCLUDED_LABELS
+        """
+        if waivers is None:
+            waivers = settings.WAIVER_LIST
+        if excluded_labels is None:
+            excluded_labels = settings.EXCLUDED_LABELS
+        self._waivers = None
+        if waivers:
+            self._waivers = re.compile("|".join(re.escape(waiver) for waiver in waivers))
+        self._excluded_labels = dict(excluded_labels)
+        # label key matches the excluded label if it is a part of its key
+        self._excluded_keys = defaultdict(set)
+        for excluded_key in self._excluded_labels:
+            for start in range(len(excluded_key) + 1):
+                for end in range(start, len(excluded_key) + 1):
+                    self._excluded_keys[excluded_key[start:end]].add(excluded_key)
+
+    def is_waived(self, name: str) -> bool:
+        """Check if the name contains one of waivers patterns."""
+        return self._waivers is not None and self._waivers.search(name) is not None
+
+    def has_excluded_label(self, labels: dict) -> bool:
+        """Check if one of labels is excluded.
+
+        Label is excluded if its key is a part of the excluded label key
+        and its value is in the excluded label value.
+        """
+        if not labels or not self._excluded_labels:
+            return False
+        for key, value in labels.items():
+            for excluded_key in self._excluded_keys.get(key, ()):
+                if value in self._excluded_labels[excluded_key]:
+                    return True
+        return False
@@ -1,9 +1,7 @@
-import base64
 import logging
 from typing import Dict
 
 import mysql.connector as mysql
-from kubernetes import client, config
 from onapsdk.configuration import settings
 from onapsdk.exceptions import APIError
 from onapsdk.sdnc import VfModulePreload
@@ -14,8 +12,9 @@ from onapsdk.utils.headers_creator import headers_sdnc_creator
 
 from onaptests.scenario.scenario_base import BaseScenarioStep
 from onaptests.steps.base import BaseStep
-from onaptests.utils.exceptions import (EnvironmentPreparationException,
-                                        OnapTestException)
+from onaptests.utils.database import MySQLPool
+from onaptests.utils.exceptions import OnapTestException
+from onaptests.utils.kubernetes import KubernetesHelper
 
 
 class BaseSdncStep(BaseStep):
@@ -59,66 +58,35 @@ class CheckSdncDbStep(BaseSdncStep):
         """Step description."""
         return "Check MariaDB connection."
 
-    def get_database_credentials(self):
-        """Resolve SDNC datbase credentials from k8s secret."""
+    def get_database_credentials(self, refresh: bool = False):
+        """Resolve SDNC datbase credentials from k8s secret.
 
-        if settings.IN_CLUSTER:
-            config.load_incluster_config()
-        else:
-            config.load_kube_config(config_file=settings.K8S_CONFIG)
-        api_instance = client.CoreV1Api()
-        try:
-            secret = api_instance.read_namespaced_secret(
-                settings.SDNC_SECRET_NAME, settings.K8S_TESTS_NAMESPACE)
-            if secret.data:
-                if (self.SDNC_DB_LOGIN in secret.data and self.SDNC_DB_PASSWORD in secret.data):
-                    login_base64 = secret.data[self.SDNC_DB_LOGIN]
-                    self.login = base64.b64decode(login_base64).decode("utf-8")
-                    password_base64 = secret.data[self.SDNC_DB_PASSWORD]
-                    self.password = base64.b64decode(password_base64).decode("utf-8")
-                else:
-                    raise EnvironmentPreparationException(
-                        "Login key or password key not found in secret")
-            else:
-                raise EnvironmentPreparationException("Secret data not found in secret")
-        except client.rest.ApiException as e:
-            self.login = None
-            self.password = None
-            raise EnvironmentPreparationException("Error accessing secret") from e
-
-    def _check_query(self, conn, query):
-        cursor = conn.cursor()
-        cursor.execute(query)
-        for _ in cursor:
-            pass
-        cursor.close()
+        Args:
+            refresh (bool): read the secret even if its credentials are cached
+        """
+        self.login, self.password = KubernetesHelper.get_credentials_from_secret(
+            settings.SDNC_SECRET_NAME, self.SDNC_DB_LOGIN, self.SDNC_DB_PASSWORD,
+            namespace=settings.K8S_TESTS_NAMESPACE, refresh=refresh)
+
+    def _credentials(self, refresh: bool):
+        self.get_database_credentials(refresh=refresh)
+        return self.login, self.password
 
     @BaseStep.store_state
     def execute(self) -> None:
         """Check MariaDB connection."""
         super().execute()
         self.get_database_credentials()
-        conn = None
+        pool = MySQLPool.get(settings.SDNC_DB_PRIMARY_HOST, settings.SDNC_DB_PORT,
+                             self.SDNC_DATABASE)
         try:
-            conn = mysql.connect(
-                database=self.SDNC_DATABASE,
-                host=settings.SDNC_DB_PRIMARY_HOST,
-                port=settings.SDNC_DB_PORT,
-                user=self.login,
-                password=self.password)
-            self._check_query(conn, self.SDNC_QUERY_LOGIC)
-            self._check_query(conn, self.SDNC_QUERY_MODEL)
+            pool.query(self._credentials, self.SDNC_QUERY_LOGIC)
+            pool.query(self._credentials, self.SDNC_QUERY_MODEL)
         except (mysql.errors.ProgrammingError,
                 mysql.errors.DatabaseError) as e:
             raise OnapTestException(e) from e
         except Exception as e:
             raise OnapTestException("Cannot connect to SDNC Database") from e
-        finally:
-            if conn:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
 
 
 class ServiceCreateStep(BaseSdncStep):
@@ -326,13 +294,14 @@ class TestSdncStep(BaseScenarioStep):
             - UpdateSdncService
             - GetSdncPreloadStep
         """
-        super().__init__(cleanup=BaseStep.HAS_NO_CLEANUP)
+        super().__init__(cleanup=BaseStep.HAS_NO_CLEANUP, parallel_substeps=True)
         if settings.IN_CLUSTER:
             self.add_step(CheckSdncDbStep())
-        self.add_step(CheckSdncHealthStep())
+        health_step = CheckSdncHealthStep()
+        self.add_step(health_step)
         if full:
-            self.add_step(UpdateSdncService())
-            self.add_step(GetSdncPreloadStep())
+            self.add_step(UpdateSdncService(), depends_on=[health_step])
+            self.add_step(GetSdncPreloadStep(), depends_on=[health_step])
 
     @property
     def description(self) -> str:
@@ -36,13 +36,17 @@ class YamlTemplateServiceMacroInstantiateBaseStep(YamlTemplateBaseStep):
             - VerifyServiceDistributionStep
             - TestSdncStep
         """
-        super().__init__(cleanup=cleanup)
+        super().__init__(cleanup=cleanup, parallel_cleanup=True)
         self._yaml_template: dict = None
         self._model_yaml_template: dict = None
         self._service_instance_name: str = None
+        onboard_steps = []
         if not settings.ONLY_INSTANTIATE:
-            self.add_step(YamlTemplateServiceOnboardStep())
+            onboard_step = YamlTemplateServiceOnboardStep()
+            self.add_step(onboard_step)
+            onboard_steps.append(onboard_step)
 
+            # SDC and AAI resources are cleaned-up at the same time
             if any(
                 filter(lambda x: x in self.yaml_template[self.service_name].keys(),
                        ["vnfs", "networks"])):
@@ -50,8 +54,9 @@ class YamlTemplateServiceMacroInstantiateBaseStep(YamlTemplateBaseStep):
                 self.add_step(ConnectServiceSubToCloudRegionStep())
             else:  # only pnfs
                 self.add_step(CustomerServiceSubscriptionCreateStep())
-        self.add_step(VerifyServiceDistributionStep())
-        self.add_step(TestSdncStep(full=False))
+        verify_step = VerifyServiceDistributionStep()
+        self.add_step(verify_step, depends_on=onboard_steps)
+        self.add_step(TestSdncStep(full=False), depends_on=[verify_step])
 
     @property
     def description(self) -> str:
@@ -1,16 +1,13 @@
 # http://www.apache.org/licenses/LICENSE-2.0
 """CPS onboard module."""
-import base64
-import ssl
 from abc import ABC
 
-import pg8000
-from kubernetes import client, config
 from onapsdk.configuration import settings
 from onapsdk.cps import Anchor, Dataspace, SchemaSet
 
-from onaptests.utils.exceptions import (EnvironmentPreparationException,
-                                        OnapTestException)
+from onaptests.utils.database import PostgresPool
+from onaptests.utils.exceptions import OnapTestException
+from onaptests.utils.kubernetes import KubernetesHelper
 
 from ..base import BaseStep
 
@@ -264,58 +261,29 @@ class CheckPostgressDataBaseConnectionStep(CpsBaseStep):
         """Step description."""
         return "Establish connection with Postgress and execute the query"
 
-    def get_database_credentials(self):
-        """Resolve CPS datbase credentials from k8s secret."""
-
-        if settings.IN_CLUSTER:
-            config.load_incluster_config()
-        else:
-            config.load_kube_config(config_file=settings.K8S_CONFIG)
-        api_instance = client.CoreV1Api()
-        try:
-            secret = api_instance.read_namespaced_secret(
-                settings.SECRET_NAME, settings.K8S_TESTS_NAMESPACE)
-            if secret.data:
-                if settings.DB_LOGIN in secret.data and settings.DB_PASSWORD in secret.data:
-                    login_base64 = secret.data[settings.DB_LOGIN]
-                    self.login = base64.b64decode(login_base64).decode("utf-8")
-                    password_base64 = secret.data[settings.DB_PASSWORD]
-                    self.password = base64.b64decode(password_base64).decode("utf-8")
-                else:
-                    raise EnvironmentPreparationException(
-                        "Login key or password key not found in secret")
-            else:
-                raise EnvironmentPreparationException("Secret data not found in secret")
-        except client.rest.ApiException as e:
-            self.login = None
-            self.password = None
-            raise EnvironmentPreparationException("Error accessing secret") from e
+    def get_database_credentials(self, refresh: bool = False):
+        """Resolve CPS datbase credentials from k8s secret.
+
+        Args:
+            refresh (bool): read the secret even if its credentials are cached
+        """
+        self.login, self.password = KubernetesHelper.get_credentials_from_secret(
+            settings.SECRET_NAME, settings.DB_LOGIN, settings.DB_PASSWORD,
+            namespace=settings.K8S_TESTS_NAMESPACE, refresh=refresh)
+
+    def _credentials(self, refresh: bool):
+        self.get_database_credentials(refresh=refresh)
+        return self.login, self.password
 
     def connect_to_postgress(self):
         """Connect to CPS database and execute select query."""
 
         self.get_database_credentials()
         if self.login and self.password:
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            db_params = {
-                "user": self.login,
-                "password": self.password,
-                "host": settings.DB_PRIMARY_HOST,
-                "database": settings.DATABASE,
-                "port": settings.DB_PORT,
-                "ssl_context": ctx
-            }
+            pool = PostgresPool.get(settings.DB_PRIMARY_HOST, settings.DB_PORT,
+                                    settings.DATABASE)
             try:
-                connection = pg8000.connect(**db_params)
-                cursor = connection.cursor()
-                select_query = "SELECT * FROM yang_resource LIMIT 1;"
-                cursor.execute(select_query)
-                if cursor:
-                    cursor.close()
-                if connection:
-                    connection.close()
+                pool.query(self._credentials, "SELECT * FROM yang_resource LIMIT 1;")
             except Exception as e:
                 self._logger.exception(f"Error while connecting to PostgreSQL: {str(e)}")
                 raise OnapTestException(e) from e
@@ -2,7 +2,6 @@ import time
 from typing import Any, Dict, Iterator
 from urllib.parse import urlencode
 
-import mysql.connector as mysql
 from onapsdk.aai.service_design_and_creation import Model
 from onapsdk.configuration import settings
 from onapsdk.exceptions import InvalidResponse, ResourceNotFound
@@ -18,6 +17,7 @@ from yaml import SafeLoader, load
 
 import onaptests.utils.exceptions as onap_test_exceptions
 from onaptests.scenario.scenario_base import BaseScenarioStep
+from onaptests.utils.database import MySQLPool
 from onaptests.utils.kubernetes import KubernetesHelper
 
 from ..base import BaseStep, YamlTemplateBaseStep
@@ -32,15 +32,24 @@ class YamlTemplateServiceOnboardStep(YamlTemplateBaseStep):
         """Initialize step.
 
         Substeps:
-            - YamlTemplateVfOnboardStep.
+            - YamlTemplateVfOnboardStep,
+            - YamlTemplatePnfOnboardStep.
+
+        VF and PNF steps read the same YAML template, so if the service has
+        both they clean-up the same vendors and VSPs: the PNFs are cleaned-up
+        once the VFs are cleaned-up.
         """
-        super().__init__(cleanup=settings.CLEANUP_FLAG)
+        super().__init__(cleanup=settings.CLEANUP_FLAG, parallel_cleanup=True)
         self._yaml_template: dict = None
         self._model_yaml_template: dict = None
-        if "vnfs" in self.yaml_template[self.service_name]:
-            self.add_step(YamlTemplateVfOnboardStep())
+        pnf_steps = []
         if "pnfs" in self.yaml_template[self.service_name]:
-            self.add_step(YamlTemplatePnfOnboardStep())
+            pnf_steps.append(YamlTemplatePnfOnboardStep())
+        if "vnfs" in self.yaml_template[self.service_name]:
+            # cleaned-up before the PNFs, see BaseStep.dependencies
+            self.add_step(YamlTemplateVfOnboardStep(), depends_on=pnf_steps)
+        for pnf_step in pnf_steps:
+            self.add_step(pnf_step)
 
     @property
     def description(self) -> str:
@@ -198,15 +207,16 @@ class VerifyServiceDistributionStep(BaseScenarioStep):
 
     def __init__(self):
         """Initialize step."""
-        super().__init__(cleanup=BaseStep.HAS_NO_CLEANUP)
-        self.add_step(ServiceDistributionWaitStep())
+        super().__init__(cleanup=BaseStep.HAS_NO_CLEANUP, parallel_substeps=True)
+        wait_step = ServiceDistributionWaitStep()
+        self.add_step(wait_step)
         for notified_module in settings.SDC_SERVICE_DISTRIBUTION_COMPONENTS:
             self.add_step(VerifyServiceDistributionStatusStep(
-                notified_module=notified_module))
+                notified_module=notified_module), depends_on=[wait_step])
         if settings.IN_CLUSTER:
-            self.add_step(VerifyServiceDistributionInSoStep())
-            self.add_step(VerifyServiceDistributionInSdncStep())
-        self.add_step(VerifyServiceDistributionInAaiStep())
+            self.add_step(VerifyServiceDistributionInSoStep(), depends_on=[wait_step])
+            self.add_step(VerifyServiceDistributionInSdncStep(), depends_on=[wait_step])
+        self.add_step(VerifyServiceDistributionInAaiStep(), depends_on=[wait_step])
 
     @property
     def description(self) -> str:
@@ -410,36 +420,28 @@ class VerifyServiceDistributionInSdncStep(BaseServiceDistributionComponentCheckS
         BaseServiceDistributionComponentCheckStep.__init__(
             self, component_name="SDNC")
 
+    def _get_credentials(self, refresh: bool = False):
+        """Get SDNC database credentials from k8s secret."""
+        return KubernetesHelper.get_credentials_from_secret(
+            settings.SDNC_SECRET_NAME, self.SDNC_DB_LOGIN, self.SDNC_DB_PASSWORD,
+            namespace=settings.K8S_TESTS_NAMESPACE, refresh=refresh)
+
     @BaseStep.store_state
     def execute(self):
         """Check service distribution status."""
         super().execute()
-        login, password = KubernetesHelper.get_credentials_from_secret(
-            settings.SDNC_SECRET_NAME, self.SDNC_DB_LOGIN, self.SDNC_DB_PASSWORD)
-        conn = None
+        self._get_credentials()
+        pool = MySQLPool.get(settings.SDNC_DB_PRIMARY_HOST, settings.SDNC_DB_PORT,
+                             self.SDNC_DATABASE)
         try:
-            conn = mysql.connect(
-                database=self.SDNC_DATABASE,
-                host=settings.SDNC_DB_PRIMARY_HOST,
-                port=settings.SDNC_DB_PORT,
-                user=login,
-                password=password)
-            cursor = conn.cursor()
-            cursor.execute(
-                f"SELECT * FROM service_model WHERE service_uuid = '{self.service.uuid}';")
-            cursor.fetchall()
-            if cursor.rowcount <= 0:
+            rows = pool.query(self._get_credentials,
+                              "SELECT * FROM service_model WHERE service_uuid = %s;",
+                              (self.service.uuid,))
+            if not rows:
                 msg = "Service model is missing in SDNC."
                 self._logger.error(msg)
                 raise onap_test_exceptions.ServiceDistributionException(msg)
             self._logger.info("Service found in SDNC")
-            cursor.close()
         except Exception as e:
             msg = f"Service {self.service.name} is missing in SDNC."
             raise onap_test_exceptions.ServiceDistributionException(msg) from e
-        finally:
-            if conn:
-                try:
-                    conn.close()
-                except Exception:
-                    pass
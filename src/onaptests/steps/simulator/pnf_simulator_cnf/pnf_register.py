@@ -6,13 +6,14 @@ from typing import Tuple
 
 import requests
 import urllib3
-from kubernetes import client, config, watch
+from kubernetes import client, watch
 from onapsdk.configuration import settings
 
 from onaptests.steps.base import BaseStep
 from onaptests.steps.instantiate.msb_k8s import CreateInstanceStep
 from onaptests.utils.exceptions import (EnvironmentPreparationException,
                                         OnapTestException)
+from onaptests.utils.kubernetes import KubernetesHelper
 
 
 class PnfSimulatorCnfRegisterStep(BaseStep):
@@ -47,11 +48,7 @@ class PnfSimulatorCnfRegisterStep(BaseStep):
             bool: True if PNF simulator pod is running, False otherwise
 
         """
-        if settings.IN_CLUSTER:
-            config.load_incluster_config()
-        else:
-            config.load_kube_config(config_file=settings.K8S_CONFIG)
-        k8s_client: "client.CoreV1Api" = client.CoreV1Api()
+        k8s_client: "client.CoreV1Api" = client.CoreV1Api(KubernetesHelper.get_api_client())
         k8s_watch: "watch.Watch" = watch.Watch()
         status = False
         try:
@@ -79,11 +76,7 @@ class PnfSimulatorCnfRegisterStep(BaseStep):
             Tuple[str, str, str]: VES protocol, IP and port
 
         """
-        if settings.IN_CLUSTER:
-            config.load_incluster_config()
-        else:
-            config.load_kube_config(config_file=settings.K8S_CONFIG)
-        k8s_client: "client.CoreV1Api" = client.CoreV1Api()
+        k8s_client: "client.CoreV1Api" = client.CoreV1Api(KubernetesHelper.get_api_client())
         try:
             for service in k8s_client.list_namespaced_service(
                     namespace=settings.K8S_TESTS_NAMESPACE).items:
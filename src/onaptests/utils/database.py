@@ -0,0 +1,262 @@
+"""Pooled access to the databases checked by the tests."""
+import atexit
+import logging
+import os
+import ssl
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Tuple
+
+import mysql.connector as mysql
+import pg8000
+from mysql.connector import errorcode
+
+# SQLSTATE of the rejected PostgreSQL password
+INVALID_PASSWORD = "28P01"
+
+# Callable returning (login, password), read again (not cached) if called with True
+Credentials = Callable[[bool], Tuple[str, str]]
+
+
+class DatabasePool(ABC):
+    """Pool of the connections to one database.
+
+    Pools are shared by all the steps of the process, see `get`, so the
+    connection handshake is done once for all the steps and scenarios
+    checking the database. Released connections are kept idle, up to
+    DB_POOL_SIZE, and checked before they are reused.
+
+    Module is not reloaded between the scenarios run one by one (see
+    MODULES_TO_KEEP of run_test.py), so settings are imported when they
+    are read, not when the module is loaded.
+    """
+
+    __logger = logging.getLogger(__name__)
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+    _pools_pid = None
+
+    def __init__(self, host: str, port: int, database: str, size: int = None):
+        """Init the pool.
+
+        Args:
+            host (str): database host
+            port (int): database port
+            database (str): database name
+            size (int): maximum number of idle connections. Defaults to DB_POOL_SIZE
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from onapsdk.configuration import settings
+
+        self.host = host
+        self.port = port
+        self.database = database
+        self.size = settings.DB_POOL_SIZE if size is None else size
+        self._idle = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, host: str, port: int, database: str) -> "DatabasePool":
+        """Get the pool of the database shared by the process.
+
+        Pools inherited from the parent process are dropped, their connections
+        can't be shared.
+
+        Args:
+            host (str): database host
+            port (int): database port
+            database (str): database name
+
+        Returns:
+            DatabasePool: pool of the database connections
+        """
+        key = (cls.__name__, host, port, database)
+        with cls._pools_lock:
+            if DatabasePool._pools_pid != os.getpid():
+                DatabasePool._pools = {}
+                DatabasePool._pools_pid = os.getpid()
+            if key not in DatabasePool._pools:
+                DatabasePool._pools[key] = cls(host, port, database)
+            return DatabasePool._pools[key]
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close idle connections of all the pools of the process."""
+        with cls._pools_lock:
+            if DatabasePool._pools_pid != os.getpid():
+                return
+            for pool in DatabasePool._pools.values():
+                pool.close()
+
+    @abstractmethod
+    def _connect(self, login: str, password: str):
+        """Open a new connection to the database."""
+
+    @classmethod
+    @abstractmethod
+    def _is_access_denied(cls, exc: Exception) -> bool:
+        """Is the exception the rejection of the credentials."""
+
+    @abstractmethod
+    def _is_usable(self, connection) -> bool:
+        """Check the idle connection is still open."""
+
+    def _acquire(self, credentials: Credentials):
+        """Get an idle connection of the credentials or open a new one."""
+        login, password = credentials(False)
+        while True:
+            with self._lock:
+                for index, (owner, connection) in enumerate(self._idle):
+                    if owner == (login, password):
+                        del self._idle[index]
+                        break
+                else:
+                    break
+            if self._is_usable(connection):
+                return connection, (login, password)
+            self._close(connection)
+        try:
+            return self._connect(login, password), (login, password)
+        except Exception as exc:  # pylint: disable=broad-except
+            if not self._is_access_denied(exc):
+                raise
+        self.__logger.info("Credentials of %s database rejected, read them again",
+                           self.database)
+        login, password = credentials(True)
+        return self._connect(login, password), (login, password)
+
+    def _release(self, connection, owner: Tuple[str, str]) -> None:
+        """Keep the connection for the next user or close it if the pool is full."""
+        try:
+            # next user must not see the snapshot of this transaction
+            connection.rollback()
+        except Exception:  # pylint: disable=broad-except
+            self._close(connection)
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((owner, connection))
+                return
+        self._close(connection)
+
+    @staticmethod
+    def _close(connection) -> None:
+        try:
+            connection.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    @contextmanager
+    def connection(self, credentials: Credentials):
+        """Borrow a connection of the pool.
+
+        Connection is returned to the pool when the block ends, it is closed
+        if the block raises an exception.
+
+        Args:
+            credentials (Credentials): database credentials, read again if
+                the database rejects them
+        """
+        connection, owner = self._acquire(credentials)
+        try:
+            yield connection
+        except BaseException:
+            self._close(connection)
+            raise
+        self._release(connection, owner)
+
+    def query(self, credentials: Credentials, query: str, params: tuple = None) -> list:
+        """Execute the query and fetch all the returned rows.
+
+        Args:
+            credentials (Credentials): database credentials
+            query (str): query with `%s` placeholders
+            params (tuple): values of the placeholders
+
+        Returns:
+            list: rows returned by the query, empty if it returns none
+        """
+        with self.connection(credentials) as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params or ())
+                if cursor.description is None:
+                    return []
+                return list(cursor.fetchall())
+            finally:
+                cursor.close()
+
+    def close(self) -> None:
+        """Close the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _, connection in idle:
+            self._close(connection)
+
+
+class MySQLPool(DatabasePool):
+    """Pool of the MySQL/MariaDB connections."""
+
+    def _connect(self, login: str, password: str):
+        return mysql.connect(database=self.database,
+                             host=self.host,
+                             port=self.port,
+                             user=login,
+                             password=password)
+
+    @classmethod
+    def _is_access_denied(cls, exc: Exception) -> bool:
+        return (isinstance(exc, mysql.errors.ProgrammingError) and
+                exc.errno == errorcode.ER_ACCESS_DENIED_ERROR)
+
+    def _is_usable(self, connection) -> bool:
+        try:
+            connection.ping(reconnect=False)
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return True
+
+
+class PostgresPool(DatabasePool):
+    """Pool of the PostgreSQL connections.
+
+    Connections are encrypted but the server certificate is not verified,
+    the SSL context is created once for all the connections.
+    """
+
+    _ssl_context = None
+
+    @classmethod
+    def get_ssl_context(cls) -> ssl.SSLContext:
+        """Get the SSL context shared by all the connections."""
+        if PostgresPool._ssl_context is None:
+            ctx = ssl.create_default_context()
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+            PostgresPool._ssl_context = ctx
+        return PostgresPool._ssl_context
+
+    def _connect(self, login: str, password: str):
+        return pg8000.connect(user=login,
+                              password=password,
+                              host=self.host,
+                              database=self.database,
+                              port=self.port,
+                              ssl_context=self.get_ssl_context())
+
+    @classmethod
+    def _is_access_denied(cls, exc: Exception) -> bool:
+        return (isinstance(exc, pg8000.exceptions.DatabaseError) and bool(exc.args) and
+                isinstance(exc.args[0], dict) and exc.args[0].get("C") == INVALID_PASSWORD)
+
+    def _is_usable(self, connection) -> bool:
+        try:
+            connection.run("SELECT 1")
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return True
+
+
+atexit.register(DatabasePool.close_all)
@@ -1,39 +1,367 @@
 import base64
+import json
+import pprint
+import re
+import threading
+import time
 
+from dateutil.parser import parse as parse_datetime
 from kubernetes import client, config
 from onapsdk.configuration import settings
 
 from onaptests.utils.exceptions import EnvironmentPreparationException
 
+try:
+    import orjson as json_decoder  # faster decoder of big k8s lists
+except ImportError:
+    json_decoder = json
+
+LIST_TYPE = re.compile(r"^list\[(.*)\]$")
+# "dict(str, str)" or "dict[str, str]" depending on k8s client version
+DICT_TYPE = re.compile(r"^dict[(\[]([^,]*), (.*)[)\]]$")
+PRIMITIVE_TYPES = ("str", "int", "float", "bool", "object")
+
+# Accept header of metadata-only list, full objects are returned by older servers
+PARTIAL_METADATA_LIST_ACCEPT = ("application/json;as=PartialObjectMetadataList;"
+                                "g=meta.k8s.io;v=v1,application/json")
+
+
+class K8sRawObject():
+    """Read only k8s object loaded from the raw JSON.
+
+    Has the interface of the k8s client model, attributes are converted
+    from JSON only when they are accessed.
+    """
+
+    __slots__ = ("_data", "_model", "_cache")
+
+    def __init__(self, data: dict, model: str):
+        """Init the k8s object.
+
+        Args:
+            data (dict): JSON of the object
+            model (str): name of the k8s client model, e.g. `V1Pod`
+        """
+        self._data = data
+        self._model = getattr(client, model)
+        self._cache = {}
+
+    @property
+    def attribute_map(self) -> dict:
+        """Map of attributes names to JSON keys."""
+        return self._model.attribute_map
+
+    @property
+    def openapi_types(self) -> dict:
+        """Map of attributes names to their types."""
+        return self._model.openapi_types
+
+    def __getattr__(self, name):
+        try:
+            return self._cache[name]
+        except KeyError:
+            pass
+        try:
+            openapi_type = self._model.openapi_types[name]
+        except KeyError as exc:
+            raise AttributeError(name) from exc
+        value = self._convert(self._data.get(self._model.attribute_map[name]), openapi_type)
+        self._cache[name] = value
+        return value
+
+    @classmethod
+    def _convert(cls, value, openapi_type: str):
+        """Convert the JSON value the same way as k8s client deserializer."""
+        if value is None or openapi_type in PRIMITIVE_TYPES:
+            return value
+        list_type = LIST_TYPE.match(openapi_type)
+        if list_type:
+            return [cls._convert(item, list_type.group(1)) for item in value]
+        dict_type = DICT_TYPE.match(openapi_type)
+        if dict_type:
+            return {key: cls._convert(item, dict_type.group(2)) for key, item in value.items()}
+        if openapi_type == "datetime":
+            return parse_datetime(value)
+        if openapi_type == "date":
+            return parse_datetime(value).date()
+        return cls(value, openapi_type)
+
+    def to_dict(self) -> dict:
+        """Get the object as dict, like k8s client model."""
+        def convert(value):
+            return value.to_dict() if hasattr(value, "to_dict") else value
+
+        result = {}
+        for attr in self.openapi_types:
+            value = getattr(self, attr)
+            if isinstance(value, list):
+                result[attr] = [convert(item) for item in value]
+            elif isinstance(value, dict):
+                result[attr] = {key: convert(item) for key, item in value.items()}
+            else:
+                result[attr] = convert(value)
+        return result
+
+    def __repr__(self):
+        return pprint.pformat(self.to_dict())
+
+    def __reduce__(self):
+        return (self.__class__, (self._data, self._model.__name__))
+
+    def __eq__(self, other):
+        if not isinstance(other, (K8sRawObject, self._model)):
+            return False
+        return self.to_dict() == other.to_dict()
+
 
 class KubernetesHelper:
     """Helper class to perform operations on kubernetes cluster"""
 
+    _api_client = None
+    _context_api_clients = {}
+    _api_clients_lock = threading.Lock()
+    _watch_connections = 0
+    _credentials = {}
+    _credentials_lock = threading.Lock()
+
+    @classmethod
+    def get_connection_pool_size(cls) -> int:
+        """Get the size of the connection pool of the API clients.
+
+        Pool is sized for the status check if K8S_CONNECTION_POOL_SIZE is 0:
+        STATUS_CHECK_WORKERS resources checks and STATUS_ARTIFACTS_WORKERS
+        artifacts collectors use the connections at the same time, each
+        running watch keeps its own connection.
+
+        Returns:
+            int: size of the pool, None for the k8s client default size
+        """
+        size = settings.K8S_CONNECTION_POOL_SIZE
+        if size == 0:
+            size = (settings.STATUS_CHECK_WORKERS + settings.STATUS_ARTIFACTS_WORKERS +
+                    cls._watch_connections)
+        return size
+
+    @classmethod
+    def _resize_connection_pool(cls, api_client: client.ApiClient) -> None:
+        """Apply the pool size to the API client, its idle connections are closed."""
+        size = cls.get_connection_pool_size()
+        if not size:
+            return
+        api_client.configuration.connection_pool_maxsize = size
+        pool_manager = api_client.rest_client.pool_manager
+        if pool_manager.connection_pool_kw.get("maxsize") != size:
+            pool_manager.connection_pool_kw["maxsize"] = size
+            pool_manager.clear()
+
     @classmethod
-    def load_config(cls):
-        """Load kubernetes client configuration"""
-        if settings.IN_CLUSTER:
-            config.load_incluster_config()
-        else:
-            config.load_kube_config(config_file=settings.K8S_CONFIG)
+    def add_watch_connections(cls, count: int) -> None:
+        """Count the connections kept by the watches, negative if they are stopped.
+
+        Connection pools of the API clients are resized.
+
+        Args:
+            count (int): number of started watches
+        """
+        with cls._api_clients_lock:
+            cls._watch_connections = max(0, cls._watch_connections + count)
+            api_clients = list(cls._context_api_clients.values())
+            if cls._api_client is not None:
+                api_clients.append(cls._api_client)
+            for api_client in api_clients:
+                cls._resize_connection_pool(api_client)
+
+    @classmethod
+    def _create_api_client(cls, context: str = None) -> client.ApiClient:
+        """Create the API client tuned for the tests.
+
+        Configuration is loaded in-cluster or from K8S_CONFIG, it is not loaded
+        at all for the validation. Connection pool is sized by
+        `get_connection_pool_size` and responses of the API server are not
+        validated again while deserialized.
+
+        Args:
+            context (str): context of K8S_CONFIG kubeconfig, current one if not set
+        """
+        configuration = client.Configuration()
+        if not settings.IF_VALIDATION:
+            if settings.IN_CLUSTER and context is None:
+                config.load_incluster_config(client_configuration=configuration)
+            else:
+                config.load_kube_config(config_file=settings.K8S_CONFIG, context=context,
+                                        client_configuration=configuration)
+        pool_size = cls.get_connection_pool_size()
+        if pool_size:
+            configuration.connection_pool_maxsize = pool_size
+        configuration.client_side_validation = False
+        return client.ApiClient(configuration)
+
+    @classmethod
+    def get_api_client(cls) -> client.ApiClient:
+        """Get the API client shared by all the steps.
+
+        Client is created on the first call so the configuration is loaded once
+        and all the steps share its connection pool. The global default
+        configuration is not modified.
+
+        Returns:
+            client.ApiClient: API client of the cluster
+        """
+        with cls._api_clients_lock:
+            if cls._api_client is None:
+                cls._api_client = cls._create_api_client()
+            return cls._api_client
+
+    @classmethod
+    def get_context_api_client(cls, context: str) -> client.ApiClient:
+        """Get the API client of the kubeconfig context.
+
+        Client is created once for the context so all its users share the
+        connection pool, the global default configuration is not modified.
+
+        Args:
+            context (str): context of K8S_CONFIG kubeconfig
+
+        Returns:
+            client.ApiClient: API client of the context cluster
+        """
+        with cls._api_clients_lock:
+            if context not in cls._context_api_clients:
+                cls._context_api_clients[context] = cls._create_api_client(context)
+            return cls._context_api_clients[context]
+
+    @classmethod
+    def list_all(cls, list_method, *args, limit: int = None, **kwargs):
+        """Iterate over all items returned by the paginated k8s list call.
+
+        Items are requested in chunks of `limit` size using the `continue`
+        token returned by the API server, so the whole collection is never
+        requested at once.
+
+        Args:
+            list_method (Callable): k8s client list method, e.g. `list_namespaced_event`
+            limit (int): size of the requested chunk, all at once if None
+            args, kwargs: arguments passed to the list method
+
+        Yields:
+            object: k8s resource from the list
+
+        """
+        _continue = None
+        while True:
+            result = list_method(*args, limit=limit, _continue=_continue, **kwargs)
+            yield from result.items
+            _continue = result.metadata._continue  # pylint: disable=protected-access
+            if not _continue:
+                break
+
+    @classmethod
+    def list_all_raw(cls, list_method, *args, model: str, limit: int = None, **kwargs):
+        """Iterate over all items of the paginated k8s list call loaded from raw JSON.
+
+        Same as `list_all`, but the response is not deserialized by k8s client,
+        items are lightweight objects made of the JSON decoded response.
+
+        Args:
+            list_method (Callable): k8s client list method, e.g. `list_namespaced_pod`
+            model (str): name of the k8s client model of items, e.g. `V1Pod`
+            limit (int): size of the requested chunk, all at once if None
+            args, kwargs: arguments passed to the list method
+
+        Yields:
+            K8sRawObject: k8s resource from the list
+
+        """
+        _continue = None
+        while True:
+            response = list_method(*args, limit=limit, _continue=_continue,
+                                   _preload_content=False, **kwargs)
+            try:
+                result = json_decoder.loads(response.data)
+            finally:
+                response.release_conn()
+            for item in result.get("items") or []:
+                yield K8sRawObject(item, model)
+            _continue = result.get("metadata", {}).get("continue")
+            if not _continue:
+                break
+
+    @classmethod
+    def list_metadata(cls, api_client, path: str, response_type: str,
+                      limit: int = None, _continue: str = None,
+                      _preload_content: bool = True, **path_params):
+        """List only metadata of k8s resources.
+
+        Resources are requested as PartialObjectMetadataList, so their
+        data, specs and statuses are not sent by the API server.
+
+        Args:
+            api_client (ApiClient): k8s api client
+            path (str): resources path, e.g. `/api/v1/namespaces/{namespace}/secrets`
+            response_type (str): k8s list model the metadata is loaded into,
+                e.g. `V1SecretList`
+            limit (int): size of the requested chunk, all at once if None
+            _continue (str): continue token of the next chunk
+            _preload_content (bool): if False, raw response is returned
+            path_params: parameters of the resources path
+
+        Returns:
+            object: k8s list of resources with metadata only
+
+        """
+        query_params = []
+        if limit:
+            query_params.append(("limit", limit))
+        if _continue:
+            query_params.append(("continue", _continue))
+        return api_client.call_api(path, "GET",
+                                   path_params=path_params,
+                                   query_params=query_params,
+                                   header_params={"Accept": PARTIAL_METADATA_LIST_ACCEPT},
+                                   response_types_map={200: response_type},
+                                   auth_settings=["BearerToken"],
+                                   _return_http_data_only=True,
+                                   _preload_content=_preload_content)
 
     @classmethod
     def get_credentials_from_secret(cls,
                                     secret_name: str,
                                     login_key: str,
                                     password_key: str,
-                                    namespace: str = settings.K8S_TESTS_NAMESPACE):
+                                    namespace: str = settings.K8S_TESTS_NAMESPACE,
+                                    refresh: bool = False):
         """Resolve SDNC datbase credentials from k8s secret.
 
+        Credentials are cached by namespace, secret and keys for
+        K8S_CREDENTIALS_TTL seconds, refresh them if they are rejected.
+
         Args:
             secret_name (str): name of the secret to load
             login_key (str): key of the login in secret
             password_key (str): key of the password in secret
             namespace (str): k8s namespace to load key from
+            refresh (bool): read the secret even if its credentials are cached
         """
+        key = (namespace, secret_name, login_key, password_key)
+        with cls._credentials_lock:
+            cached = cls._credentials.get(key)
+            if cached is not None and not refresh and time.monotonic() < cached[0]:
+                return cached[1]
+        credentials = cls._read_credentials_from_secret(secret_name, login_key,
+                                                        password_key, namespace)
+        with cls._credentials_lock:
+            cls._credentials[key] = (time.monotonic() + settings.K8S_CREDENTIALS_TTL,
+                                     credentials)
+        return credentials
 
-        cls.load_config()
-        api_instance = client.CoreV1Api()
+    @classmethod
+    def _read_credentials_from_secret(cls,
+                                      secret_name: str,
+                                      login_key: str,
+                                      password_key: str,
+                                      namespace: str):
+        """Read the credentials from k8s secret."""
+        api_instance = client.CoreV1Api(cls.get_api_client())
         try:
             secret = api_instance.read_namespaced_secret(secret_name, namespace)
             if secret.data:
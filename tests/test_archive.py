@@ -0,0 +1,52 @@
+import json
+import zipfile
+
+from onaptests.steps.cloud.archive import ArchiveStore, DirectoryStore
+from onaptests.steps.cloud.rendering import PageRenderer
+
+
+def test_archive_store(tmp_path):
+    store = ArchiveStore(str(tmp_path), str(tmp_path / "status.zip"))
+    with store.open(str(tmp_path / "pod-a-c.log")) as artifact:
+        artifact.write(b"crash\n")
+        artifact.write(b"loop\n")
+    with store.open(str(tmp_path / "other" / "pod-b-c.log")) as artifact:
+        artifact.write(b"crash\nloop\n")
+    store.write(str(tmp_path / "pod-a.html"), "<html>")
+    store.close()
+    store.close()
+
+    assert [path.name for path in tmp_path.iterdir()] == ["status.zip"]
+    with zipfile.ZipFile(tmp_path / "status.zip") as archive:
+        assert sorted(archive.namelist()) == ["index.json", "pod-a-c.log", "pod-a.html"]
+        index = json.loads(archive.read("index.json"))
+        assert index["other/pod-b-c.log"]["member"] == "pod-a-c.log"
+        assert index["other/pod-b-c.log"]["size"] == 11
+        assert archive.read(index["pod-a.html"]["member"]) == b"<html>"
+
+
+def test_archive_store_without_dedup(tmp_path):
+    store = ArchiveStore(str(tmp_path), str(tmp_path / "status.zip"), dedup=False)
+    store.write(str(tmp_path / "a.log"), b"logs")
+    store.write(str(tmp_path / "b.log"), b"logs")
+    store.close()
+    with zipfile.ZipFile(tmp_path / "status.zip") as archive:
+        assert sorted(archive.namelist()) == ["a.log", "b.log", "index.json"]
+
+
+def test_archive_store_rendering(tmp_path):
+    pod_versions = [{"container": "c", "component": "so", "image": "onap/so", "version": "1"}]
+    for store in (DirectoryStore(str(tmp_path)),
+                  ArchiveStore(str(tmp_path), str(tmp_path / "status.zip"))):
+        renderer = PageRenderer(enabled=True, workers=2, store=store)
+        for index in range(2):
+            renderer.add("version.html.j2", str(tmp_path / f"versions-{index}.html"),
+                         pod_versions=pod_versions)
+        renderer.render()
+        store.close()
+
+    with zipfile.ZipFile(tmp_path / "status.zip") as archive:
+        index = json.loads(archive.read("index.json"))
+        assert sorted(index) == ["versions-0.html", "versions-1.html"]
+        assert archive.read(index["versions-1.html"]["member"]) == (
+            tmp_path / "versions-1.html").read_bytes()
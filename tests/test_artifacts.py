@@ -0,0 +1,84 @@
+import threading
+import time
+
+import pytest
+
+from onaptests.steps.cloud.artifacts import ArtifactsCollector
+
+
+def test_artifacts_collector_per_pod_limit():
+    collector = ArtifactsCollector(workers=4, per_pod=1, max_bytes=0)
+    lock = threading.Lock()
+    running = {"pod-a": 0, "pod-b": 0}
+    max_running = {"pod-a": 0, "pod-b": 0}
+    collected = []
+
+    def task(pod_name, number):
+        with lock:
+            running[pod_name] += 1
+            max_running[pod_name] = max(max_running[pod_name], running[pod_name])
+        time.sleep(0.01)
+        with lock:
+            running[pod_name] -= 1
+            collected.append((pod_name, number))
+
+    for number in range(3):
+        collector.submit("pod-a", task, "pod-a", number)
+        collector.submit("pod-b", task, "pod-b", number)
+    collector.wait()
+
+    assert sorted(collected) == [("pod-a", 0), ("pod-a", 1), ("pod-a", 2),
+                                 ("pod-b", 0), ("pod-b", 1), ("pod-b", 2)]
+    assert max_running == {"pod-a": 1, "pod-b": 1}
+
+
+def test_artifacts_collector_sequential():
+    collector = ArtifactsCollector(workers=1, per_pod=1, max_bytes=0)
+    collected = []
+    collector.submit("pod", collected.append, 1)
+    assert collected == [1]
+    collector.wait()
+
+
+def test_artifacts_collector_size_limit():
+    collector = ArtifactsCollector(workers=1, per_pod=1, max_bytes=10)
+    assert not collector.exhausted
+    collector.add_bytes(9)
+    assert not collector.exhausted
+    collector.add_bytes(1)
+    assert collector.exhausted
+
+    collector = ArtifactsCollector(workers=1, per_pod=1, max_bytes=0)
+    collector.add_bytes(10**12)
+    assert not collector.exhausted
+
+
+def test_artifacts_collector_exception():
+    collector = ArtifactsCollector(workers=2, per_pod=1, max_bytes=0)
+
+    def failing_task():
+        raise OSError("disk full")
+
+    collector.submit("pod", failing_task)
+    with pytest.raises(OSError):
+        collector.wait()
+
+
+def test_artifacts_collector_close():
+    collector = ArtifactsCollector(workers=2, per_pod=1, max_bytes=0)
+    started = threading.Event()
+    collected = []
+
+    def task(number):
+        started.set()
+        time.sleep(0.05)
+        collected.append(number)
+
+    for number in range(3):
+        collector.submit("pod", task, number)
+    started.wait()
+    # running task is done, the waiting ones are dropped
+    collector.close(cancel=True)
+    assert collected == [0]
+    assert not any(thread.is_alive() for thread in collector._executor._threads)
+    collector.wait()
@@ -0,0 +1,159 @@
+import json
+from unittest import mock
+
+import pytest
+
+from onaptests.steps.base import BaseStep
+from onaptests.steps.cloud.check_status import (CheckK8sConfigMapsStep,
+                                                CheckK8sSecretsStep)
+from onaptests.steps.cloud.clusters_status import CheckClustersStatusStep
+from onaptests.utils.exceptions import StatusCheckException
+from onaptests.utils.kubernetes import PARTIAL_METADATA_LIST_ACCEPT
+
+
+def _config_map(name):
+    config_map = mock.MagicMock()
+    config_map.metadata.name = name
+    config_map.metadata.labels = None
+    config_map.metadata.annotations = None
+    return config_map
+
+
+def _list(items, _continue=None):
+    result = mock.MagicMock()
+    result.items = items
+    result.metadata._continue = _continue
+    return result
+
+
+@mock.patch("onaptests.steps.cloud.rendering.settings")
+@mock.patch("onaptests.steps.cloud.archive.settings")
+@mock.patch("onaptests.steps.cloud.check_status.settings")
+def test_check_resources_paginated(settings, archive_settings, rendering_settings, tmp_path):
+    archive_settings.STATUS_ARCHIVE = None
+    rendering_settings.STATUS_RENDER_HTML = False
+    settings.STATUS_RESULTS_DIRECTORY = str(tmp_path)
+    settings.K8S_TESTS_NAMESPACE = "onap"
+    settings.K8S_LIST_PAGE_SIZE = 2
+    settings.STATUS_METADATA_ONLY = False
+    settings.STATUS_RAW_JSON = False
+    settings.STATUS_COMPACT_RESOURCES = False
+    step = CheckK8sConfigMapsStep("onap")
+    step.core = mock.MagicMock()
+    step.core.list_namespaced_config_map.side_effect = [
+        _list([_config_map("a"), _config_map("b")], "token"),
+        _list([_config_map("c")])
+    ]
+    step._init_resources()
+    # nothing is requested until resources are consumed
+    step.core.list_namespaced_config_map.assert_not_called()
+
+    step.execute()
+    assert [config_map.name for config_map in step.all_resources] == ["a", "b", "c"]
+    assert step.k8s_resources_number == 3
+    assert step.core.list_namespaced_config_map.mock_calls == [
+        mock.call("onap", limit=2, _continue=None),
+        mock.call("onap", limit=2, _continue="token")
+    ]
+
+
+@mock.patch("onaptests.steps.cloud.check_status.settings")
+def test_check_resources_empty(settings, tmp_path):
+    settings.STATUS_RESULTS_DIRECTORY = str(tmp_path)
+    settings.K8S_TESTS_NAMESPACE = "onap"
+    settings.K8S_LIST_PAGE_SIZE = 0
+    settings.STATUS_METADATA_ONLY = False
+    settings.STATUS_RAW_JSON = False
+    settings.STATUS_COMPACT_RESOURCES = False
+    step = CheckK8sConfigMapsStep("onap")
+    step.core = mock.MagicMock()
+    step.core.list_namespaced_config_map.return_value = _list([])
+    step._parse_resources = mock.MagicMock()
+    step.execute()
+    step._parse_resources.assert_not_called()
+    step.core.list_namespaced_config_map.assert_called_once_with(
+        "onap", limit=None, _continue=None)
+
+
+@mock.patch("onaptests.steps.cloud.rendering.settings")
+@mock.patch("onaptests.steps.cloud.archive.settings")
+@mock.patch("onaptests.steps.cloud.check_status.settings")
+def test_check_resources_metadata_only(settings, archive_settings, rendering_settings, tmp_path):
+    archive_settings.STATUS_ARCHIVE = None
+    rendering_settings.STATUS_RENDER_HTML = False
+    settings.STATUS_RESULTS_DIRECTORY = str(tmp_path)
+    settings.K8S_TESTS_NAMESPACE = "onap"
+    settings.K8S_LIST_PAGE_SIZE = 2
+    settings.STATUS_METADATA_ONLY = True
+    settings.STATUS_RAW_JSON = False
+    settings.STATUS_COMPACT_RESOURCES = False
+    step = CheckK8sSecretsStep("onap")
+    step.core = mock.MagicMock()
+    step.core.api_client.call_api.side_effect = [
+        _list([_config_map("a"), _config_map("b")], "token"),
+        _list([_config_map("c")])
+    ]
+    step.execute()
+    assert [secret.name for secret in step.all_resources] == ["a", "b", "c"]
+    step.core.list_namespaced_secret.assert_not_called()
+    calls = step.core.api_client.call_api.mock_calls
+    assert len(calls) == 2
+    assert calls[1].args == ("/api/v1/namespaces/{namespace}/secrets", "GET")
+    assert calls[1].kwargs["path_params"] == {"namespace": "onap"}
+    assert calls[1].kwargs["query_params"] == [("limit", 2), ("continue", "token")]
+    assert calls[1].kwargs["header_params"] == {"Accept": PARTIAL_METADATA_LIST_ACCEPT}
+    assert calls[1].kwargs["response_types_map"] == {200: "V1SecretList"}
+
+
+@mock.patch("onaptests.steps.cloud.check_status.KubernetesHelper.get_context_api_client")
+@mock.patch("onaptests.steps.cloud.check_status.settings")
+def test_check_resources_cluster(settings, get_context_api_client, tmp_path):
+    settings.STATUS_RESULTS_DIRECTORY = str(tmp_path)
+    settings.K8S_TESTS_NAMESPACE = "onap"
+    api_client = get_context_api_client.return_value
+
+    step = CheckK8sSecretsStep("other", cluster="east")
+    get_context_api_client.assert_not_called()
+    assert step.core.api_client is api_client
+    assert step.core is step.core
+    get_context_api_client.assert_called_once_with("east")
+    assert step.res_dir == f"{tmp_path}/east/other"
+
+
+class _ClusterStep(BaseStep):
+
+    def __init__(self, cluster, failing):
+        super().__init__(cleanup=BaseStep.HAS_NO_CLEANUP, break_on_error=False)
+        self.cluster = cluster
+        self.failing = failing
+        self.details = {}
+
+    @property
+    def description(self):
+        return "cluster"
+
+    @property
+    def component(self):
+        return "ALL"
+
+    @BaseStep.store_state
+    def execute(self):
+        super().execute()
+        self.details = {"pod": {"number_failing": int(self.failing)}}
+        if self.failing:
+            raise StatusCheckException
+
+
+@mock.patch("onaptests.steps.cloud.clusters_status.settings")
+def test_check_clusters_status(settings, tmp_path):
+    settings.STATUS_RESULTS_DIRECTORY = str(tmp_path)
+    settings.STATUS_DETAILS_JSON = "status-details.json"
+    step = CheckClustersStatusStep(clusters=[])
+    for cluster, failing in (("east", False), ("west", True)):
+        step.add_step(_ClusterStep(cluster, failing))
+
+    with pytest.raises(StatusCheckException):
+        step.execute()
+    details = json.loads((tmp_path / "status-details.json").read_text())
+    assert details == {"east": {"pod": {"number_failing": 0}},
+                       "west": {"pod": {"number_failing": 1}}}
@@ -0,0 +1,90 @@
+import importlib
+import sys
+from unittest import mock
+
+import mysql.connector as mysql
+import pytest
+from mysql.connector import errorcode
+
+from onaptests.utils.database import DatabasePool, MySQLPool, PostgresPool
+
+
+@mock.patch("onaptests.utils.database.mysql.connect")
+def test_mysql_pool(mock_connect):
+    connection = mock_connect.return_value
+    connection.cursor.return_value.description = [("id",)]
+    connection.cursor.return_value.fetchall.return_value = [(1,)]
+    credentials = mock.MagicMock(return_value=("login", "password"))
+    pool = MySQLPool("db", 3306, "sdnctl", size=1)
+
+    assert pool.query(credentials, "SELECT * FROM t WHERE id = %s;", (1,)) == [(1,)]
+    assert pool.query(credentials, "SELECT 1;") == [(1,)]
+    mock_connect.assert_called_once_with(database="sdnctl", host="db", port=3306,
+                                         user="login", password="password")
+    connection.cursor.return_value.execute.assert_called_with("SELECT 1;", ())
+    assert connection.rollback.call_count == 2
+
+    # broken idle connection is replaced
+    connection.ping.side_effect = mysql.errors.InterfaceError()
+    pool.query(credentials, "SELECT 1;")
+    assert mock_connect.call_count == 2
+
+    # connection of a failed block is not reused
+    connection.ping.side_effect = None
+    with pytest.raises(ValueError):
+        with pool.connection(credentials):
+            raise ValueError()
+    pool.query(credentials, "SELECT 1;")
+    assert mock_connect.call_count == 3
+
+    pool.close()
+    connection.close.assert_called()
+
+
+@mock.patch("onaptests.utils.database.mysql.connect")
+def test_mysql_pool_credentials_refresh(mock_connect):
+    connection = mock.MagicMock()
+    mock_connect.side_effect = [
+        mysql.errors.ProgrammingError(errno=errorcode.ER_ACCESS_DENIED_ERROR), connection]
+    credentials = mock.MagicMock(side_effect=[("login", "old"), ("login", "new")])
+    pool = MySQLPool("db", 3306, "sdnctl", size=1)
+
+    with pool.connection(credentials) as conn:
+        assert conn is connection
+    credentials.assert_called_with(True)
+    assert mock_connect.call_args.kwargs["password"] == "new"
+
+
+@mock.patch("onapsdk.configuration.settings")
+def test_shared_pools(mock_settings):
+    mock_settings.DB_POOL_SIZE = 2
+    with mock.patch.object(DatabasePool, "_pools", {}), \
+            mock.patch.object(DatabasePool, "_pools_pid", None):
+        pool = MySQLPool.get("db", 3306, "sdnctl")
+        assert MySQLPool.get("db", 3306, "sdnctl") is pool
+        assert PostgresPool.get("db", 3306, "sdnctl") is not pool
+        with mock.patch("onaptests.utils.database.os.getpid", return_value=-1):
+            assert MySQLPool.get("db", 3306, "sdnctl") is not pool
+    assert PostgresPool.get_ssl_context() is PostgresPool.get_ssl_context()
+
+
+def test_pools_kept_on_modules_reload():
+    """Pools survive the purge of the modules between scenarios of run_test.py."""
+    modules = dict(sys.modules)
+    try:
+        with mock.patch.object(DatabasePool, "_pools", {}), \
+                mock.patch.object(DatabasePool, "_pools_pid", None):
+            pool = MySQLPool.get("db", 3306, "sdnctl")
+            for module in list(sys.modules):
+                if (("onapsdk" in module or "onaptests" in module) and
+                        module != "onaptests.utils.database"):
+                    del sys.modules[module]
+            reloaded = importlib.import_module("onaptests.steps.onboard.service")
+            assert reloaded.MySQLPool.get("db", 3306, "sdnctl") is pool
+            # new settings module is read by the pools created after the reload
+            settings = importlib.import_module("onapsdk.configuration").settings
+            with mock.patch.object(settings, "DB_POOL_SIZE", 7, create=True):
+                assert reloaded.MySQLPool.get("db", 3306, "other").size == 7
+    finally:
+        sys.modules.clear()
+        sys.modules.update(modules)
@@ -0,0 +1,56 @@
+import datetime
+import json
+import pickle
+from unittest import mock
+
+from kubernetes import client
+
+from onaptests.utils.kubernetes import K8sRawObject, KubernetesHelper
+
+POD = {
+    "metadata": {"name": "pod", "labels": {"app": "test"},
+                 "creationTimestamp": "2024-01-01T10:00:00Z",
+                 "ownerReferences": [{"apiVersion": "v1", "kind": "ReplicaSet",
+                                      "name": "rs", "uid": "uid"}]},
+    "spec": {"containers": [{"name": "c", "image": "nginx"}],
+             "volumes": [{"name": "cfg", "configMap": {"name": "cm", "defaultMode": 420}}]},
+    "status": {"phase": "Running",
+               "containerStatuses": [{"name": "c", "ready": True, "restartCount": 0,
+                                      "image": "nginx", "imageID": "id",
+                                      "state": {"running": {"startedAt": "2024-01-01T10:00:00Z"}}}]}
+}
+
+
+def test_k8s_raw_object():
+    pod = K8sRawObject(POD, "V1Pod")
+    model = client.ApiClient().deserialize(mock.MagicMock(data=json.dumps(POD)), "V1Pod")
+
+    assert pod.metadata.name == "pod"
+    assert pod.metadata.labels == {"app": "test"}
+    assert pod.metadata.annotations is None
+    assert pod.metadata.creation_timestamp == datetime.datetime(
+        2024, 1, 1, 10, tzinfo=datetime.timezone.utc)
+    assert pod.metadata.owner_references[0].kind == "ReplicaSet"
+    assert pod.status.container_statuses[0].state.running.started_at.year == 2024
+    assert pod.spec.volumes[0].config_map.default_mode == 420
+    assert pod.spec.volumes[0].attribute_map == client.V1Volume.attribute_map
+    assert not hasattr(pod, "phase")
+    assert pod.to_dict() == model.to_dict()
+    assert pod == model
+    assert repr(pod.spec.volumes[0]) == repr(model.spec.volumes[0])
+    assert pickle.loads(pickle.dumps(pod.spec)) == model.spec
+
+
+def test_list_all_raw():
+    response = mock.MagicMock()
+    response.data = json.dumps({"metadata": {"continue": "token"}, "items": [POD]}).encode()
+    last_response = mock.MagicMock()
+    last_response.data = json.dumps({"metadata": {}, "items": [POD]}).encode()
+    list_method = mock.MagicMock(side_effect=[response, last_response])
+
+    pods = list(KubernetesHelper.list_all_raw(list_method, "onap", model="V1Pod", limit=1))
+
+    assert [pod.metadata.name for pod in pods] == ["pod", "pod"]
+    assert list_method.mock_calls[1] == mock.call("onap", limit=1, _continue="token",
+                                                  _preload_content=False)
+    response.release_conn.assert_called_once()
@@ -0,0 +1,94 @@
+from unittest import mock
+
+from onaptests.utils.kubernetes import KubernetesHelper
+
+
+@mock.patch.object(KubernetesHelper, "_api_client", None)
+@mock.patch("onaptests.utils.kubernetes.config")
+@mock.patch("onaptests.utils.kubernetes.settings")
+def test_shared_api_client(settings, config):
+    settings.IF_VALIDATION = False
+    settings.IN_CLUSTER = False
+    settings.K8S_CONFIG = "kubeconfig"
+    settings.K8S_CONNECTION_POOL_SIZE = 7
+
+    api_client = KubernetesHelper.get_api_client()
+    assert KubernetesHelper.get_api_client() is api_client
+    config.load_kube_config.assert_called_once_with(
+        config_file="kubeconfig", context=None,
+        client_configuration=api_client.configuration)
+    assert api_client.configuration.connection_pool_maxsize == 7
+    assert api_client.rest_client.pool_manager.connection_pool_kw["maxsize"] == 7
+    assert not api_client.configuration.client_side_validation
+
+
+@mock.patch.object(KubernetesHelper, "_context_api_clients", {})
+@mock.patch("onaptests.utils.kubernetes.config")
+@mock.patch("onaptests.utils.kubernetes.settings")
+def test_context_api_client(settings, config):
+    settings.IF_VALIDATION = False
+    settings.IN_CLUSTER = True
+    settings.K8S_CONFIG = "kubeconfig"
+    settings.K8S_CONNECTION_POOL_SIZE = None
+
+    east = KubernetesHelper.get_context_api_client("east")
+    assert KubernetesHelper.get_context_api_client("east") is east
+    assert KubernetesHelper.get_context_api_client("west") is not east
+    config.load_incluster_config.assert_not_called()
+    assert config.load_kube_config.call_count == 2
+
+
+@mock.patch.object(KubernetesHelper, "_api_client", None)
+@mock.patch.object(KubernetesHelper, "_context_api_clients", {})
+@mock.patch.object(KubernetesHelper, "_watch_connections", 0)
+@mock.patch("onaptests.utils.kubernetes.config")
+@mock.patch("onaptests.utils.kubernetes.settings")
+def test_status_connection_pool_size(settings, config):
+    settings.IF_VALIDATION = True
+    settings.K8S_CONNECTION_POOL_SIZE = 0
+    settings.STATUS_CHECK_WORKERS = 2
+    settings.STATUS_ARTIFACTS_WORKERS = 4
+
+    api_client = KubernetesHelper.get_api_client()
+    assert api_client.configuration.connection_pool_maxsize == 6
+    # settings are read when the client is built
+    settings.STATUS_CHECK_WORKERS = 4
+    east = KubernetesHelper.get_context_api_client("east")
+    assert east.configuration.connection_pool_maxsize == 8
+
+    KubernetesHelper.add_watch_connections(12)
+    assert api_client.rest_client.pool_manager.connection_pool_kw["maxsize"] == 20
+    assert east.rest_client.pool_manager.connection_pool_kw["maxsize"] == 20
+    KubernetesHelper.add_watch_connections(-12)
+    assert KubernetesHelper.get_connection_pool_size() == 8
+
+
+@mock.patch.object(KubernetesHelper, "_credentials", {})
+@mock.patch.object(KubernetesHelper, "get_api_client")
+@mock.patch("onaptests.utils.kubernetes.time")
+@mock.patch("onaptests.utils.kubernetes.client.CoreV1Api")
+@mock.patch("onaptests.utils.kubernetes.settings")
+def test_credentials_cache(settings, core, time, get_api_client):
+    settings.K8S_CREDENTIALS_TTL = 60
+    time.monotonic.return_value = 100
+    read_secret = core.return_value.read_namespaced_secret
+    read_secret.return_value.data = {"login": "dXNlcg==", "password": "cGFzcw=="}
+
+    def credentials(**kwargs):
+        return KubernetesHelper.get_credentials_from_secret(
+            "secret", "login", "password", namespace="onap", **kwargs)
+
+    assert credentials() == ("user", "pass")
+    assert credentials() == ("user", "pass")
+    assert read_secret.call_count == 1
+    # other keys of the same secret
+    KubernetesHelper.get_credentials_from_secret("secret", "password", "login", namespace="onap")
+    assert read_secret.call_count == 2
+
+    read_secret.return_value.data = {"login": "dXNlcg==", "password": "bmV3"}
+    assert credentials() == ("user", "pass")
+    assert credentials(refresh=True) == ("user", "new")
+    time.monotonic.return_value = 200
+    read_secret.return_value.data = {"login": "dXNlcg==", "password": "cGFzcw=="}
+    assert credentials() == ("user", "pass")
+    assert read_secret.call_count == 4
@@ -0,0 +1,44 @@
+import pickle
+from multiprocessing.reduction import ForkingPickler
+
+from kubernetes import client
+
+from onaptests.steps.cloud.rendering import PageRenderer, dump_context
+
+
+def test_page_renderer(tmp_path):
+    renderer = PageRenderer(enabled=True, workers=2)
+    pod_versions = [{"container": "c", "component": "so", "image": "onap/so", "version": "1"}]
+    for index in range(3):
+        renderer.add("version.html.j2", str(tmp_path / f"versions-{index}.html"),
+                     pod_versions=pod_versions)
+    assert not list(tmp_path.iterdir())
+
+    renderer.render()
+    assert not renderer.jobs
+    pages = sorted(tmp_path.iterdir())
+    assert len(pages) == 3
+    assert "onap/so" in pages[0].read_text()
+    # templates are loaded once
+    assert renderer.get_template("version.html.j2") is renderer.get_template("version.html.j2")
+
+
+def test_page_renderer_disabled(tmp_path):
+    renderer = PageRenderer(enabled=False, workers=1)
+    renderer.add("version.html.j2", str(tmp_path / "versions.html"), pod_versions=[])
+    renderer.render()
+    assert not renderer.jobs
+    assert not list(tmp_path.iterdir())
+
+
+def test_dump_context():
+    configuration = client.Configuration()
+    configuration.refresh_api_key_hook = lambda conf: None
+    pod = client.V1Pod(metadata=client.V1ObjectMeta(name="pod"),
+                       local_vars_configuration=configuration)
+
+    context = pickle.loads(dump_context({"pod": pod}))
+    assert context["pod"].metadata.name == "pod"
+    assert context["pod"].local_vars_configuration.refresh_api_key_hook is None
+    # pickling of the process is not changed
+    assert client.Configuration not in ForkingPickler._extra_reducers
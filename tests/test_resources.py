@@ -0,0 +1,83 @@
+from kubernetes import client
+import pytest
+
+from onaptests.steps.cloud.resources import CompactK8s, Container, Pod, Service
+
+
+def test_compact_pod():
+    k8s = client.V1Pod(
+        metadata=client.V1ObjectMeta(name="pod", labels={"app": "test"}, resource_version="2",
+                                     owner_references=[client.V1OwnerReference(
+                                         api_version="v1", kind="ReplicaSet", name="rs",
+                                         uid="uid")]),
+        spec=client.V1PodSpec(containers=[client.V1Container(name="c", image="nginx")],
+                              volumes=[client.V1Volume(
+                                  name="cfg",
+                                  config_map=client.V1ConfigMapVolumeSource(name="cm"))]),
+        status=client.V1PodStatus(phase="Running"))
+    pod = Pod(k8s=k8s)
+    pod.events = [client.CoreV1Event(involved_object=client.V1ObjectReference(name="pod"),
+                                     metadata=client.V1ObjectMeta(name="event"),
+                                     type="Normal", reason="Started", message="msg", count=1)]
+    pod.compact()
+
+    assert isinstance(pod.k8s, CompactK8s)
+    assert pod.k8s.metadata.name == "pod"
+    assert pod.k8s.metadata.labels == {"app": "test"}
+    assert pod.k8s.metadata.resource_version == "2"
+    assert pod.k8s.metadata.owner_references[0].kind == "ReplicaSet"
+    assert pod.k8s.status.phase == "Running"
+    assert pod.k8s.status.reason is None
+    assert [volume.name for volume in pod.k8s.spec.volumes] == ["cfg"]
+    assert pod.volumes["cfg"]["config_map"]["name"] == "cm"
+    # pod spec has no ports and there is no phase at the top level
+    with pytest.raises(AttributeError):
+        pod.k8s.spec.ports  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError):
+        pod.k8s.phase  # pylint: disable=pointless-statement
+    assert [(event.type, event.reason) for event in pod.events] == [("Normal", "Started")]
+    assert not hasattr(pod, "__dict__")
+
+    compact = pod.k8s
+    pod.compact()
+    assert pod.k8s is compact
+
+
+def test_compact_service():
+    k8s = client.V1Service(
+        metadata=client.V1ObjectMeta(name="svc"),
+        spec=client.V1ServiceSpec(type="NodePort", selector={"app": "test"},
+                                  ports=[client.V1ServicePort(name="http", port=80,
+                                                              node_port=30080,
+                                                              target_port=8080,
+                                                              protocol="TCP")]))
+    service = Service(k8s=k8s)
+    service.compact()
+
+    assert service.type == "NodePort"
+    assert service.k8s.spec.selector == {"app": "test"}
+    port = service.k8s.spec.ports[0]
+    assert (port.name, port.port, port.node_port, port.target_port, port.protocol) == (
+        "http", 80, 30080, 8080, "TCP")
+
+
+def test_container_slots():
+    container = Container(name="c")
+    with pytest.raises(AttributeError):
+        container.unknown = True
+
+
+def test_resource_identity():
+    def pod(name, uid, namespace="onap"):
+        return Pod(k8s=client.V1Pod(metadata=client.V1ObjectMeta(name=name, uid=uid,
+                                                                 namespace=namespace),
+                                    spec=client.V1PodSpec(containers=[])))
+
+    assert pod("a", "uid-1").identity == ("onap", "uid-1")
+    # recreated pod with the same name is another pod
+    assert pod("a", "uid-1") != pod("a", "uid-2")
+    assert pod("a", "uid-1") != pod("a", "uid-1", namespace="other")
+    assert pod("a", "uid-1") == pod("a", "uid-1")
+    assert {pod("a", "uid-1"), pod("a", "uid-1"), pod("b", "uid-2")} == {
+        pod("a", "uid-1"), pod("b", "uid-2")}
+    assert Pod().identity == (None, "")
@@ -0,0 +1,62 @@
+from unittest import mock
+
+from onaptests.steps.cloud.resources_index import EventsIndex, PodsIndex
+
+
+def _event(kind, name, reason):
+    event = mock.MagicMock()
+    event.involved_object.kind = kind
+    event.involved_object.name = name
+    event.reason = reason
+    return event
+
+
+def _events_list(items, _continue=None):
+    events_list = mock.MagicMock()
+    events_list.items = items
+    events_list.metadata._continue = _continue
+    return events_list
+
+
+@mock.patch("onaptests.steps.cloud.resources_index.settings")
+def test_events_index(settings):
+    settings.K8S_LIST_PAGE_SIZE = 2
+    settings.STATUS_RAW_JSON = False
+    settings.STATUS_COMPACT_RESOURCES = False
+    core = mock.MagicMock()
+    core.list_namespaced_event.side_effect = [
+        _events_list([_event("Pod", "pod-1", "Started"),
+                      _event("Job", "job-1", "Completed")], "token"),
+        _events_list([_event("Pod", "pod-1", "Killing")])
+    ]
+    events = EventsIndex(core, "onap")
+
+    assert [e.reason for e in events.get("pod-1")] == ["Started", "Killing"]
+    assert [e.reason for e in events.get("job-1", kind="Job")] == ["Completed"]
+    assert events.get("job-1", kind="Pod") == []
+    assert events.get("unknown") == []
+    assert core.list_namespaced_event.mock_calls == [
+        mock.call("onap", limit=2, _continue=None),
+        mock.call("onap", limit=2, _continue="token")
+    ]
+
+
+def _pod(name, labels):
+    pod = mock.MagicMock()
+    pod.metadata.name = name
+    pod.metadata.labels = labels
+    return pod
+
+
+def test_pods_index():
+    pods = PodsIndex()
+    pods.add(_pod("sdc-be-1", {"app": "sdc-be", "release": "onap"}))
+    pods.add(_pod("sdc-fe-1", {"app": "sdc-fe", "release": "onap"}))
+    pods.add(_pod("no-labels", None))
+    pods.add(_pod("sdc-be-2", {"app": "sdc-be", "release": "onap"}))
+
+    assert pods.find({"app": "sdc-be", "release": "onap"}) == ["sdc-be-1", "sdc-be-2"]
+    assert pods.find({"release": "onap"}) == ["sdc-be-1", "sdc-fe-1", "sdc-be-2"]
+    assert pods.find({"app": "sdc-fe", "release": "other"}) == []
+    assert pods.find({}) == []
+    assert pods.find(None) == []
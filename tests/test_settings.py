@@ -0,0 +1,37 @@
+import os
+from unittest import mock
+
+from onaptests.configuration import settings
+
+
+def test_generate_service_config_yaml_file(tmp_path):
+    service_config = tmp_path / "basic_vm-service.yaml"
+    config = settings.generate_service_config_yaml_file("basic_vm", "basic_vm-service.yaml.j2",
+                                                        str(service_config))
+    assert next(iter(config)) == "basic_vm"
+    assert service_config.read_text(encoding="utf-8").startswith("---\nbasic_vm:")
+
+    # up to date file is not written again
+    os.utime(service_config, (0, 0))
+    config["basic_vm"]["vnfs"] = []
+    assert settings.generate_service_config_yaml_file(
+        "basic_vm", "basic_vm-service.yaml.j2", str(service_config))["basic_vm"]["vnfs"]
+    assert service_config.stat().st_mtime == 0
+
+    config = settings.generate_service_config_yaml_file("basic_vm", "basic_vm-service.yaml.j2",
+                                                        str(service_config),
+                                                        generate_random_names=True)
+    service_name = next(iter(config))
+    assert service_name.startswith("basic_vm_")
+    assert service_config.stat().st_mtime != 0
+    assert f"{service_name}:" in service_config.read_text(encoding="utf-8")
+
+
+def test_get_cloud_auth():
+    settings._load_cloud_auth.cache_clear()
+    with mock.patch("openstack.config.get_cloud_region") as mock_cloud_region:
+        mock_cloud_region.return_value.auth = {"username": "user"}
+        settings.get_cloud_auth("cloud")["username"] = "other"
+        assert settings.get_cloud_auth("cloud") == {"username": "user"}
+    mock_cloud_region.assert_called_once_with(cloud="cloud")
+    settings._load_cloud_auth.cache_clear()
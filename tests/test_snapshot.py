@@ -0,0 +1,62 @@
+import json
+import zipfile
+
+from onaptests.steps.cloud.archive import ArchiveStore
+from onaptests.steps.cloud.snapshot import StatusSnapshot
+
+
+def test_status_snapshot(tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    page = tmp_path / "pod-a.html"
+    page.write_text("page")
+
+    snapshot = StatusSnapshot(path)
+    assert not snapshot.is_up_to_date("onap", "Pod", "a", "1")
+    snapshot.set("onap", "Pod", "a", fingerprint="1", artifacts=[str(page)])
+    snapshot.set_container("onap", "a", "c", restart_count=0, artifacts=[str(page)])
+    snapshot.set("onap", "Pod", "b", fingerprint="1", artifacts=[str(tmp_path / "pod-b.html")])
+    snapshot.save()
+
+    snapshot = StatusSnapshot(path)
+    assert snapshot.is_up_to_date("onap", "Pod", "a", "1")
+    assert not snapshot.is_up_to_date("onap", "Pod", "a", "2")
+    assert not snapshot.is_up_to_date("other", "Pod", "a", "1")
+    # artifact removed since previous check
+    assert not snapshot.is_up_to_date("onap", "Pod", "b", "1")
+    assert snapshot.get_container("onap", "a", "c") == {"restart_count": 0,
+                                                        "artifacts": [str(page)]}
+    assert snapshot.get_container("onap", "a", "d") == {}
+    snapshot.save()
+
+    # resources not seen in the last check are dropped
+    assert StatusSnapshot(path).get("onap", "Pod", "a") == {}
+
+
+def test_status_snapshot_corrupted(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text("{not json")
+    assert StatusSnapshot(str(path)).get("onap", "Pod", "a") == {}
+
+
+def test_status_snapshot_archive(tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    page = str(tmp_path / "pod-a.html")
+    store = ArchiveStore(str(tmp_path), str(tmp_path / "status.zip"))
+    store.write(page, "page")
+    store.write(str(tmp_path / "pod-b.html"), "other page")
+    store.close()
+    snapshot = StatusSnapshot(path, store)
+    snapshot.set("onap", "Pod", "a", fingerprint="1", artifacts=[page])
+    snapshot.save()
+
+    # page is kept in the new archive without being rendered again
+    store = ArchiveStore(str(tmp_path), str(tmp_path / "status.zip"))
+    snapshot = StatusSnapshot(path, store)
+    assert snapshot.is_up_to_date("onap", "Pod", "a", "1")
+    assert not snapshot.is_up_to_date("onap", "Pod", "c", "1")
+    store.close()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["snapshot.json", "status.zip"]
+    with zipfile.ZipFile(tmp_path / "status.zip") as archive:
+        index = json.loads(archive.read("index.json"))
+        assert sorted(index) == ["pod-a.html"]
+        assert archive.read(index["pod-a.html"]["member"]) == b"page"
@@ -0,0 +1,158 @@
+import datetime
+from unittest import mock
+
+from kubernetes import client
+from urllib3.exceptions import ProtocolError
+
+from onaptests.steps.cloud.status_monitor import StatusMonitor
+from onaptests.steps.cloud.waivers import WaiverMatcher
+
+
+def _deployment(name, unavailable=None, replicas=1):
+    return client.V1Deployment(
+        metadata=client.V1ObjectMeta(name=name, resource_version="1"),
+        spec=client.V1DeploymentSpec(replicas=replicas, selector=client.V1LabelSelector(),
+                                     template=client.V1PodTemplateSpec()),
+        status=client.V1DeploymentStatus(unavailable_replicas=unavailable))
+
+
+def _job(name, hour, completed, cron_job=None):
+    owners = None
+    if cron_job:
+        owners = [client.V1OwnerReference(api_version="batch/v1", kind="CronJob",
+                                          name=cron_job, uid="uid")]
+    created = datetime.datetime(2024, 1, 1, hour)
+    return client.V1Job(
+        metadata=client.V1ObjectMeta(name=name, creation_timestamp=created,
+                                     owner_references=owners),
+        spec=client.V1JobSpec(template=client.V1PodTemplateSpec()),
+        status=client.V1JobStatus(completion_time=created if completed else None))
+
+
+def _list(items, resource_version="10"):
+    result = mock.MagicMock()
+    result.items = items
+    result.metadata._continue = None
+    result.metadata.resource_version = resource_version
+    return result
+
+
+@mock.patch("onaptests.steps.cloud.status_monitor.settings")
+@mock.patch("onaptests.steps.cloud.waivers.settings")
+def test_status_monitor_events(waivers_settings, settings):
+    settings.K8S_TESTS_NAMESPACE = "onap"
+    settings.INCLUDE_ALL_RES_IN_DETAILS = True
+    settings.IGNORE_EMPTY_REPLICAS = True
+    waivers_settings.WAIVER_LIST = ["integration"]
+    waivers_settings.EXCLUDED_LABELS = {}
+    monitor = StatusMonitor(namespaces={"onap", "other"})
+    key = ("onap", "deployment")
+
+    monitor._on_event(key, {"type": "ADDED", "object": _deployment("a")})
+    monitor._on_event(key, {"type": "ADDED", "object": _deployment("b", unavailable=1)})
+    deployment = monitor.resources[key]["b"]
+    assert monitor.failing[key] == {"b"}
+
+    # updated in place
+    monitor._on_event(key, {"type": "MODIFIED", "object": _deployment("b")})
+    assert monitor.resources[key]["b"] is deployment
+    assert not monitor.is_failing
+
+    monitor._on_event(key, {"type": "MODIFIED", "object": _deployment("a", unavailable=1)})
+    monitor._on_event(key, {"type": "ADDED", "object": _deployment("c", replicas=0)})
+    assert monitor.failing[key] == {"a"}
+    monitor._on_event(key, {"type": "DELETED", "object": _deployment("a")})
+    assert not monitor.is_failing
+
+    details = monitor.details()
+    assert details["namespace"]["all"] == ["other"]
+    assert details["deployment"] == {"number_failing": 0, "failing": [],
+                                     "all": ["b"], "number_all": 1}
+    assert details["namespace"]["resources"]["other"]["deployment"]["number_all"] == 0
+    assert "node" not in details["namespace"]["resources"]["other"]
+
+
+@mock.patch("onaptests.steps.cloud.status_monitor.settings")
+@mock.patch("onaptests.steps.cloud.waivers.settings")
+def test_status_monitor_cron_jobs(waivers_settings, settings):
+    settings.K8S_TESTS_NAMESPACE = "onap"
+    waivers_settings.WAIVER_LIST = ["integration"]
+    waivers_settings.EXCLUDED_LABELS = {}
+    monitor = StatusMonitor(namespaces={"onap"})
+    key = ("onap", "job")
+
+    monitor._on_event(key, {"type": "ADDED", "object": _job("cron-1", 1, False, "cron")})
+    monitor._on_event(key, {"type": "ADDED", "object": _job("integration", 1, False)})
+    assert monitor.failing[key] == {"cron-1"}
+    monitor._on_event(key, {"type": "ADDED", "object": _job("cron-2", 2, True, "cron")})
+    assert not monitor.is_failing
+    monitor._on_event(key, {"type": "DELETED", "object": _job("cron-2", 2, True, "cron")})
+    assert monitor.failing[key] == {"cron-1"}
+    assert list(monitor.resources[key]) == ["cron-1"]
+
+    # failing job which becomes waived is not counted anymore
+    monitor._on_event(key, {"type": "ADDED", "object": _job("lost", 3, False)})
+    assert monitor.failing[key] == {"cron-1", "lost"}
+    monitor.matcher = WaiverMatcher(waivers=["lost"], excluded_labels={})
+    monitor._on_event(key, {"type": "MODIFIED", "object": _job("lost", 3, False)})
+    assert monitor.failing[key] == {"cron-1"}
+    assert list(monitor.resources[key]) == ["cron-1"]
+
+
+@mock.patch("onaptests.steps.cloud.status_monitor.watch")
+@mock.patch("onaptests.steps.cloud.status_monitor.settings")
+@mock.patch("onaptests.steps.cloud.waivers.settings")
+def test_status_monitor_watch_relist(waivers_settings, settings, k8s_watch):
+    settings.K8S_TESTS_NAMESPACE = "onap"
+    settings.K8S_LIST_PAGE_SIZE = 100
+    settings.IGNORE_EMPTY_REPLICAS = False
+    waivers_settings.WAIVER_LIST = []
+    waivers_settings.EXCLUDED_LABELS = {}
+    monitor = StatusMonitor(namespaces={"onap"})
+    key = ("onap", "deployment")
+    list_method = mock.MagicMock(side_effect=[_list([_deployment("a")], "10"),
+                                              _list([_deployment("b", unavailable=1)], "20")])
+    monitor._list_method = mock.MagicMock(return_value=(list_method, ("onap",)))
+
+    def stream(*args, **kwargs):
+        if kwargs["resource_version"] == "10":
+            yield {"type": "BOOKMARK", "object": None}
+            raise client.rest.ApiException(status=410)
+        monitor._stop.set()
+        yield {"type": "ADDED", "object": _deployment("c")}
+
+    k8s_watch.Watch.return_value.resource_version = None
+    k8s_watch.Watch.return_value.stream.side_effect = stream
+    monitor._list(key)
+    assert list(monitor.resources[key]) == ["a"]
+    monitor._watch(key)
+
+    assert sorted(monitor.resources[key]) == ["b", "c"]
+    assert monitor.failing[key] == {"b"}
+    assert monitor.resource_versions[key] == "20"
+
+
+@mock.patch("onaptests.steps.cloud.status_monitor.watch")
+@mock.patch("onaptests.steps.cloud.status_monitor.settings")
+@mock.patch("onaptests.steps.cloud.waivers.settings")
+def test_status_monitor_watch_transport_error(waivers_settings, settings, k8s_watch):
+    settings.K8S_TESTS_NAMESPACE = "onap"
+    settings.K8S_LIST_PAGE_SIZE = 100
+    settings.IGNORE_EMPTY_REPLICAS = False
+    waivers_settings.WAIVER_LIST = []
+    waivers_settings.EXCLUDED_LABELS = {}
+    monitor = StatusMonitor(namespaces={"onap"})
+    monitor._stop = mock.MagicMock()
+    monitor._stop.is_set.side_effect = [False, False, False, False, True]
+    key = ("onap", "deployment")
+    list_method = mock.MagicMock(side_effect=[ProtocolError("reset"),
+                                              _list([_deployment("b", unavailable=1)], "20")])
+    monitor._list_method = mock.MagicMock(return_value=(list_method, ("onap",)))
+    monitor.resource_versions[key] = "10"
+    k8s_watch.Watch.return_value.stream.side_effect = ProtocolError("broken")
+
+    monitor._watch(key)
+
+    assert list_method.call_count == 2
+    assert monitor.failing[key] == {"b"}
+    assert monitor.resource_versions[key] == "20"
@@ -3,7 +3,9 @@ from time import sleep
 import pytest
 
 from onaptests.steps.base import BaseStep
-from onaptests.utils.exceptions import OnapTestException
+from onaptests.utils.exceptions import (OnapTestException,
+                                        SubstepExecutionException,
+                                        SubstepExecutionExceptionGroup)
 
 
 
@@ -117,6 +119,42 @@ class TestCleanupStepD(TestCleanupStepA):
         return "Test cleanup step D"
 
 
+class TestRecordStep(BaseStep):
+
+    def __init__(self, label, events, fail=False, fail_cleanup=False, **kwargs):
+        super().__init__(**kwargs)
+        self.label = label
+        self.events = events
+        self.fail = fail
+        self.fail_cleanup = fail_cleanup
+
+    @BaseStep.store_state
+    def execute(self):
+        super().execute()
+        self.events.append(f"start {self.label}")
+        sleep(0.2)
+        self.events.append(f"end {self.label}")
+        if self.fail:
+            raise OnapTestException
+
+    @BaseStep.store_state(cleanup=True)
+    def cleanup(self):
+        self.events.append(f"start cleanup {self.label}")
+        sleep(0.2)
+        self.events.append(f"end cleanup {self.label}")
+        if self.fail_cleanup:
+            raise OnapTestException
+        super().cleanup()
+
+    @property
+    def description(self):
+        return self.label
+
+    @property
+    def component(self) -> str:
+        return "Test"
+
+
 def test_store_state():
     ts = TestStep()
     ts.execute()
@@ -240,3 +278,61 @@ def test_store_state_with_cleanup():
     assert rep_cleanup_step_2.step_description == "[Test] TestCleanupStepB cleanup: Test cleanup step B"
     assert rep_cleanup_step_3.step_description == "[Test] TestCleanupStepC cleanup: Test cleanup step C"
     assert rep_cleanup_step_4.step_description == "[Test] TestCleanupStepD cleanup: Test cleanup step D"
+
+
+def test_store_state_parallel_substeps():
+    events = []
+    ts = TestRecordStep("parent", events, parallel_substeps=True)
+    step_a = TestRecordStep("a", events)
+    ts.add_step(step_a)
+    ts.add_step(TestRecordStep("b", events))
+    ts.add_step(TestRecordStep("c", events), depends_on=[step_a])
+    ts.execute()
+
+    assert events.index("start b") < events.index("end a") < events.index("start c")
+    assert events[-1] == "end parent"
+    assert [rep.step_description for rep in ts.execution_reports] == [
+        "[Test] TestRecordStep: a", "[Test] TestRecordStep: b",
+        "[Test] TestRecordStep: c", "[Test] TestRecordStep: parent"]
+    assert all(rep.step_execution_status.value == "PASS" for rep in ts.execution_reports)
+
+
+def test_store_state_parallel_substeps_break_on_error():
+    events = []
+    ts = TestRecordStep("parent", events, parallel_substeps=True)
+    step_a = TestRecordStep("a", events, fail=True)
+    ts.add_step(step_a)
+    ts.add_step(TestRecordStep("b", events, fail=True, break_on_error=False))
+    ts.add_step(TestRecordStep("c", events), depends_on=[step_a])
+    with pytest.raises(SubstepExecutionException):
+        ts.execute()
+
+    assert "start c" not in events
+    assert [(rep.step_description, rep.step_execution_status.value)
+            for rep in ts.execution_reports] == [
+        ("[Test] TestRecordStep: a", "FAIL"), ("[Test] TestRecordStep: b", "FAIL"),
+        ("[Test] TestRecordStep: parent", "NOT EXECUTED")]
+
+
+def test_store_state_parallel_cleanup():
+    events = []
+    ts = TestRecordStep("parent", events, cleanup=True, parallel_cleanup=True)
+    step_a = TestRecordStep("a", events, cleanup=True)
+    step_a.add_step(TestRecordStep("a1", events, cleanup=True, fail_cleanup=True))
+    ts.add_step(step_a)
+    ts.add_step(TestRecordStep("b", events, cleanup=True, fail_cleanup=True))
+    ts.add_step(TestRecordStep("c", events, cleanup=True), depends_on=[step_a])
+    ts.execute()
+    # substeps are executed in order
+    assert events.index("end b") < events.index("start c")
+
+    with pytest.raises(SubstepExecutionExceptionGroup) as exc:
+        ts.cleanup()
+    assert len(exc.value.sub_exceptions) == 2
+    assert events.index("start cleanup b") < events.index("end cleanup c")
+    assert events.index("end cleanup c") < events.index("start cleanup a")
+    assert events.index("end cleanup a") < events.index("start cleanup a1")
+    assert [rep.step_description for rep in ts.cleanup_reports] == [
+        "[Test] TestRecordStep Cleanup: parent", "[Test] TestRecordStep Cleanup: c",
+        "[Test] TestRecordStep Cleanup: b", "[Test] TestRecordStep Cleanup: a",
+        "[Test] TestRecordStep Cleanup: a1"]
@@ -0,0 +1,49 @@
+from kubernetes import client
+
+from onaptests.steps.cloud.versions import ImageInventory
+
+REPOSITORIES = ["nexus3.onap.org:10001", "docker.io"]
+NICKNAMES = {"nexus3.onap.org:10001": "onap", "docker.io": "docker hub", "default": "default"}
+GENERIC_NAMES = {"mariadb": ["bitnami/mariadb", "mariadb"], "other": ["mariadb"]}
+
+
+def test_image_inventory():
+    inventory = ImageInventory.from_containers([
+        ("so", "so", "nexus3.onap.org:10001/onap/so/api-handler:1.0.0"),
+        ("aai", "aai", "nexus3.onap.org:10001/onap/so/api-handler:1.0.0"),
+        ("so", "db", "docker.io/library/mariadb:10.5"),
+        ("aai", "db", "docker.io/bitnami/mariadb:10.6"),
+        ("aai", "busybox", "busybox"),
+    ], repositories=REPOSITORIES, nicknames=NICKNAMES, generic_names=GENERIC_NAMES)
+
+    assert inventory.pod_versions[0] == {
+        "container": "so", "component": "so",
+        "image": "nexus3.onap.org:10001/onap/so/api-handler", "version": "1.0.0"}
+    assert inventory.pod_versions[-1]["version"] == "latest"
+    assert inventory.containers == {
+        "onap/so/api-handler": {
+            "versions": {"1.0.0": {"repositories": ["onap"], "components": ["so", "aai"]}},
+            "number_components": 2},
+        "mariadb": {
+            "versions": {
+                "mariadb:10.5": {"repositories": ["docker hub"], "components": ["so"]},
+                "bitnami/mariadb:10.6": {"repositories": ["docker hub"], "components": ["aai"]}},
+            "number_components": 2},
+        "busybox": {
+            "versions": {"": {"repositories": ["default"], "components": ["aai"]}},
+            "number_components": 1},
+    }
+
+
+def test_image_inventory_from_pods():
+    pod = client.V1Pod(
+        metadata=client.V1ObjectMeta(name="so-0", labels={"app.kubernetes.io/name": "so"}),
+        spec=client.V1PodSpec(containers=[client.V1Container(name="so", image="docker.io/so:1")]))
+    unlabeled = client.V1Pod(
+        metadata=client.V1ObjectMeta(name="job-0"),
+        spec=client.V1PodSpec(containers=[client.V1Container(name="job", image="docker.io/so:1")]))
+
+    inventory = ImageInventory.from_pods([pod, unlabeled], repositories=REPOSITORIES,
+                                         nicknames=NICKNAMES, generic_names=GENERIC_NAMES)
+    assert [version["component"] for version in inventory.pod_versions] == ["so", "job-0"]
+    assert inventory.containers["so"]["versions"]["1"]["components"] == ["so", "job-0"]
@@ -0,0 +1,38 @@
+from unittest import mock
+
+from onaptests.steps.cloud.waivers import WaiverMatcher
+
+
+def test_waiver_matcher_names():
+    matcher = WaiverMatcher(waivers=["integration", "a.b", "test("], excluded_labels={})
+    assert matcher.is_waived("onap-integration-job")
+    assert matcher.is_waived("x-a.b-y")
+    # patterns are not regular expressions
+    assert not matcher.is_waived("x-aXb-y")
+    assert matcher.is_waived("test(1)")
+    assert not matcher.is_waived("onap-so")
+    assert not WaiverMatcher(waivers=[], excluded_labels={}).is_waived("onap-so")
+
+
+def test_waiver_matcher_labels():
+    matcher = WaiverMatcher(waivers=[], excluded_labels={
+        "app.kubernetes.io/name": ["cassandra", "mariadb"],
+        "release": "dev-onap"
+    })
+    assert matcher.has_excluded_label({"app.kubernetes.io/name": "cassandra"})
+    # key and value match parts of the excluded label as before
+    assert matcher.has_excluded_label({"name": "mariadb"})
+    assert matcher.has_excluded_label({"release": "onap"})
+    assert not matcher.has_excluded_label({"app.kubernetes.io/name": "cass"})
+    assert not matcher.has_excluded_label({"app": "so", "release": "prod"})
+    assert not matcher.has_excluded_label({})
+    assert not matcher.has_excluded_label(None)
+
+
+@mock.patch("onaptests.steps.cloud.waivers.settings")
+def test_waiver_matcher_settings(settings):
+    settings.WAIVER_LIST = ["integration"]
+    settings.EXCLUDED_LABELS = {"app": "so"}
+    matcher = WaiverMatcher()
+    assert matcher.is_waived("integration")
+    assert matcher.has_excluded_label({"app": "so"})